@@ -0,0 +1,290 @@
+"""
+Performance benchmarks for digipin-python.
+
+Measures single-call latency, batch throughput, memory per encoded row, import
+time and worst-case inputs near the edges of `BOUNDS`, writes the results to a
+JSON file and optionally compares them against a stored baseline.
+
+Usage:
+
+    python benchmarks/bench.py                       # full run, compare to baseline
+    python benchmarks/bench.py --quick               # small batch sizes only
+    python benchmarks/bench.py --save-baseline       # record a new baseline
+
+The exit status is 1 when any metric regresses past `--threshold` relative to
+the baseline. Baselines are machine specific: record them on the machine that
+runs the comparison.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from digipin import __version__
+from digipin.core import BOUNDS, Digipin
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUTPUT = os.path.join(HERE, "results.json")
+DEFAULT_BASELINE = os.path.join(HERE, "baseline.json")
+DEFAULT_SIZES = (1_000, 1_000_000, 10_000_000)
+QUICK_SIZES = (1_000, 100_000)
+
+# Rows used to measure memory per encoded row
+MEMORY_ROWS = 100_000
+
+LOWER = "lower"
+HIGHER = "higher"
+
+
+def _metric(value: float, unit: str, better: str) -> Dict[str, object]:
+    return {"value": value, "unit": unit, "better": better}
+
+
+def _sample(count: int, seed: int = 42):
+    rng = random.Random(seed)
+    lats = [rng.uniform(BOUNDS.min_lat, BOUNDS.max_lat) for _ in range(count)]
+    lons = [rng.uniform(BOUNDS.min_lon, BOUNDS.max_lon) for _ in range(count)]
+    return lats, lons
+
+
+def _edge_points() -> List[tuple]:
+    """Points on the outer bounds and on level-1/level-2 cell edges, where rounding bites."""
+    lat_span = BOUNDS.max_lat - BOUNDS.min_lat
+    lon_span = BOUNDS.max_lon - BOUNDS.min_lon
+    lats = [BOUNDS.min_lat, BOUNDS.max_lat]
+    lons = [BOUNDS.min_lon, BOUNDS.max_lon]
+    for step in range(1, 16):
+        lats.append(BOUNDS.min_lat + lat_span * step / 16)
+        lons.append(BOUNDS.min_lon + lon_span * step / 16)
+    return [(lat, lon) for lat in lats for lon in lons]
+
+
+def _per_call_ns(func: Callable[[], object], calls: int, repeat: int) -> float:
+    """Median time of one call in nanoseconds, where `func` performs `calls` calls."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    runs = timer.repeat(repeat=repeat, number=number)
+    return statistics.median(runs) / (number * calls) * 1e9
+
+
+def bench_latency(repeat: int) -> Dict[str, Dict[str, object]]:
+    handler = Digipin()
+    lookup_handler = Digipin(lookup_levels=3)
+    lats, lons = _sample(1_000)
+    points = list(zip(lats, lons))
+    pins = [handler.get_digipin(lat, lon) for lat, lon in points]
+    edges = _edge_points()
+
+    def encode(h=handler):
+        for lat, lon in points:
+            h.get_digipin(lat, lon)
+
+    def encode_lookup():
+        encode(lookup_handler)
+
+    def decode():
+        for pin in pins:
+            handler.get_lat_lng_from_digipin(pin)
+
+    def encode_edges():
+        for lat, lon in edges:
+            handler.get_digipin(lat, lon)
+
+    return {
+        "latency.encode": _metric(_per_call_ns(encode, len(points), repeat), "ns", LOWER),
+        "latency.encode_lookup": _metric(
+            _per_call_ns(encode_lookup, len(points), repeat), "ns", LOWER
+        ),
+        "latency.decode": _metric(_per_call_ns(decode, len(pins), repeat), "ns", LOWER),
+        "latency.encode_edges": _metric(
+            _per_call_ns(encode_edges, len(edges), repeat), "ns", LOWER
+        ),
+    }
+
+
+def bench_throughput(sizes, repeat: int) -> Dict[str, Dict[str, object]]:
+    results = {}
+    if np is None:
+        handler = Digipin()
+        lats, lons = _sample(min(sizes))
+        seconds = min(
+            timeit.repeat(
+                lambda: [handler.get_digipin(lat, lon) for lat, lon in zip(lats, lons)],
+                repeat=repeat,
+                number=1,
+            )
+        )
+        results[f"throughput.encode_scalar.{len(lats)}"] = _metric(
+            len(lats) / seconds, "rows/s", HIGHER
+        )
+        return results
+
+    rng = np.random.default_rng(42)
+    for size in sizes:
+        # Large batches are slow and stable; one run is enough.
+        runs = repeat if size <= 1_000_000 else 1
+        encode_rate, decode_rate = _batch_rates(rng, size, runs)
+        results[f"throughput.encode.{size}"] = _metric(encode_rate, "rows/s", HIGHER)
+        results[f"throughput.decode.{size}"] = _metric(decode_rate, "rows/s", HIGHER)
+    return results
+
+
+def _batch_rates(rng, size: int, runs: int):
+    """Vectorized encode and decode rates in rows/s; arrays are freed on return."""
+    from digipin.vectorized import decode_many, encode_many
+
+    lats = rng.uniform(BOUNDS.min_lat, BOUNDS.max_lat, size)
+    lons = rng.uniform(BOUNDS.min_lon, BOUNDS.max_lon, size)
+    encode_seconds = min(timeit.repeat(lambda: encode_many(lats, lons), repeat=runs, number=1))
+    pins = encode_many(lats, lons)
+    decode_seconds = min(timeit.repeat(lambda: decode_many(pins), repeat=runs, number=1))
+    return size / encode_seconds, size / decode_seconds
+
+
+def bench_memory() -> Dict[str, Dict[str, object]]:
+    if np is None:
+        handler = Digipin()
+        lats, lons = _sample(MEMORY_ROWS)
+        tracemalloc.start()
+        pins = [handler.get_digipin(lat, lon) for lat, lon in zip(lats, lons)]
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del pins
+        return {"memory.encode_scalar": _metric(peak / MEMORY_ROWS, "bytes/row", LOWER)}
+
+    from digipin.vectorized import encode_many
+
+    rng = np.random.default_rng(42)
+    lats = rng.uniform(BOUNDS.min_lat, BOUNDS.max_lat, MEMORY_ROWS)
+    lons = rng.uniform(BOUNDS.min_lon, BOUNDS.max_lon, MEMORY_ROWS)
+    encode_many(lats[:10], lons[:10])  # Exclude one-off import allocations
+    tracemalloc.start()
+    pins = encode_many(lats, lons)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del pins
+    return {"memory.encode": _metric(peak / MEMORY_ROWS, "bytes/row", LOWER)}
+
+
+def bench_import(repeat: int) -> Dict[str, Dict[str, object]]:
+    """Best wall time of `import digipin` in a fresh interpreter, in milliseconds."""
+    code = "import time; t = time.perf_counter(); import digipin; print(time.perf_counter() - t)"
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", code], check=True, capture_output=True, text=True
+        ).stdout
+        runs.append(float(output) * 1e3)
+    return {"import.digipin": _metric(min(runs), "ms", LOWER)}
+
+
+def run(sizes, repeat: int) -> Dict[str, object]:
+    metrics: Dict[str, Dict[str, object]] = {}
+    metrics.update(bench_latency(repeat))
+    metrics.update(bench_throughput(sizes, repeat))
+    metrics.update(bench_memory())
+    metrics.update(bench_import(repeat))
+    return {
+        "version": __version__,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "numpy": None if np is None else np.__version__,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "metrics": metrics,
+    }
+
+
+def compare(
+    results: Dict[str, object], baseline: Dict[str, object], threshold: float
+) -> List[str]:
+    """
+    Prints a comparison table and returns the names of regressed metrics.
+
+    A lower-is-better metric regresses when it grows by more than `threshold`
+    (a fraction); a higher-is-better metric when it shrinks by more than that.
+    Metrics missing from either side are skipped.
+    """
+    regressions = []
+    print(f"{'metric':<34} {'baseline':>14} {'current':>14} {'change':>8}")
+    for name, current in sorted(results["metrics"].items()):
+        base = baseline["metrics"].get(name)
+        if base is None or not base["value"]:
+            continue
+        change = current["value"] / base["value"] - 1
+        if current["better"] == LOWER:
+            regressed = change > threshold
+        else:
+            regressed = change < -threshold
+        flag = "  REGRESSION" if regressed else ""
+        print(
+            f"{name:<34} {base['value']:>14.4g} {current['value']:>14.4g} "
+            f"{change:>+7.1%}{flag}"
+        )
+        if regressed:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Where to write the results.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline to compare with.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Allowed relative regression before failing (default: 0.2, i.e. 20%%).",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=lambda text: tuple(int(size) for size in text.split(",")),
+        default=None,
+        help="Comma separated batch sizes (default: 1000,1000000,10000000).",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per measurement.")
+    parser.add_argument("--quick", action="store_true", help="Use small batch sizes only.")
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="Also store the results as the baseline."
+    )
+    args = parser.parse_args(argv)
+
+    sizes = args.sizes or (QUICK_SIZES if args.quick else DEFAULT_SIZES)
+    results = run(sizes, args.repeat)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+    print(f"Results written to {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to record one.")
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"{len(regressions)} metric(s) regressed by more than {args.threshold:.0%}.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,22 +1,25 @@
 from .core import Digipin
-from .model import Coordinates, DigipinBounds
 from .error import (
     DigipinBaseError,
+    InvalidDigipinCharError,
+    InvalidDigipinError,
+    InvalidPrecisionError,
     LatitudeOutOfRangeError,
     LongitudeOutOfRangeError,
-    InvalidDigipinError,
-    InvalidDigipinCharError,
 )
+from .model import Coordinates, DigipinBounds, DigipinCell
 
 __all__ = [
     "Digipin",
     "Coordinates",
     "DigipinBounds",
+    "DigipinCell",
     "DigipinBaseError",
     "LatitudeOutOfRangeError",
     "LongitudeOutOfRangeError",
     "InvalidDigipinError",
     "InvalidDigipinCharError",
+    "InvalidPrecisionError",
 ]
 
 __version__ = "0.1.0"
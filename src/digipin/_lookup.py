@@ -0,0 +1,176 @@
+"""
+Precomputed tables that let encoding and decoding skip the first grid levels.
+
+The subdivision is separable: the row chosen at each level depends only on the
+latitude and the column only on the longitude. For the first ``levels`` levels
+there are therefore only ``4**levels`` possible row sequences (latitude strips)
+and as many column sequences (longitude strips).
+
+The encode table stores, per axis, the smallest coordinate that `get_digipin`
+maps into each strip. Because every level's decision is monotonic in the
+coordinate, a binary search over those thresholds lands on exactly the strip
+the level-by-level loop would reach, along with the bounds it would compute.
+
+The decode table maps every ``levels``-character prefix to the bounds reached
+by `get_lat_lng_from_digipin` after consuming it.
+
+Tables are built on first use and shared by every `Digipin` in the process.
+"""
+
+import math
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from .core import BOUNDS, DIGIPIN_GRID
+
+MAX_LOOKUP_LEVELS = 4
+
+_Bounds = Tuple[float, float, float, float]
+
+
+def _lat_strip(lat: float, levels: int) -> Tuple[int, List[int], float, float]:
+    """
+    Runs the latitude half of the encoding loop for the first `levels` levels.
+
+    Returns the strip number (0 at the southern edge), the grid row index chosen
+    at each level and the (min_lat, max_lat) bounds reached.
+    """
+    current_min_lat = BOUNDS.min_lat
+    current_max_lat = BOUNDS.max_lat
+    strip = 0
+    rows = []
+    for _ in range(levels):
+        lat_div = (current_max_lat - current_min_lat) / 4
+        row_idx = 3 - math.floor((lat - current_min_lat) / lat_div)
+        row_idx = max(0, min(row_idx, 3))
+        strip = strip * 4 + (3 - row_idx)
+        rows.append(row_idx)
+
+        new_max_lat = current_min_lat + lat_div * (4 - row_idx)
+        current_min_lat = current_min_lat + lat_div * (3 - row_idx)
+        current_max_lat = new_max_lat
+    return strip, rows, current_min_lat, current_max_lat
+
+
+def _lon_strip(lon: float, levels: int) -> Tuple[int, List[int], float, float]:
+    """
+    Runs the longitude half of the encoding loop for the first `levels` levels.
+
+    Returns the strip number (0 at the western edge), the grid column index chosen
+    at each level and the (min_lon, max_lon) bounds reached.
+    """
+    current_min_lon = BOUNDS.min_lon
+    current_max_lon = BOUNDS.max_lon
+    strip = 0
+    cols = []
+    for _ in range(levels):
+        lon_div = (current_max_lon - current_min_lon) / 4
+        col_idx = math.floor((lon - current_min_lon) / lon_div)
+        col_idx = max(0, min(col_idx, 3))
+        strip = strip * 4 + col_idx
+        cols.append(col_idx)
+
+        current_min_lon = current_min_lon + lon_div * col_idx
+        current_max_lon = current_min_lon + lon_div
+    return strip, cols, current_min_lon, current_max_lon
+
+
+def _strip_thresholds(strip_of, low: float, high: float, levels: int) -> List[float]:
+    """
+    Finds, for every strip, the smallest coordinate that `strip_of` maps into it.
+
+    Starts from the nominal strip edge and walks one float at a time, so the
+    result honours the rounding of the level-by-level loop exactly.
+    """
+    count = 4**levels
+    width = (high - low) / count
+    thresholds = [low]
+    for strip in range(1, count):
+        edge = low + strip * width
+        while strip_of(edge, levels)[0] < strip:
+            edge = math.nextafter(edge, math.inf)
+        while strip_of(math.nextafter(edge, -math.inf), levels)[0] >= strip:
+            edge = math.nextafter(edge, -math.inf)
+        thresholds.append(edge)
+    return thresholds
+
+
+class EncodeTable(object):
+    """Resolves the first `levels` characters of a DIGIPIN by binary search."""
+
+    def __init__(self, levels: int):
+        self.levels = levels
+        self._lat_thresholds = _strip_thresholds(
+            _lat_strip, BOUNDS.min_lat, BOUNDS.max_lat, levels
+        )
+        self._lon_thresholds = _strip_thresholds(
+            _lon_strip, BOUNDS.min_lon, BOUNDS.max_lon, levels
+        )
+
+        lat_strips = [_lat_strip(lat, levels) for lat in self._lat_thresholds]
+        lon_strips = [_lon_strip(lon, levels) for lon in self._lon_thresholds]
+        self._lat_bounds = [(min_lat, max_lat) for _, _, min_lat, max_lat in lat_strips]
+        self._lon_bounds = [(min_lon, max_lon) for _, _, min_lon, max_lon in lon_strips]
+
+        # Hyphenated prefix for every (latitude strip, longitude strip) pair
+        self._prefixes: List[List[str]] = []
+        for _, rows, _, _ in lat_strips:
+            self._prefixes.append(
+                [_format_prefix(rows, cols, levels) for _, cols, _, _ in lon_strips]
+            )
+
+    def lookup(self, lat: float, lon: float) -> Tuple[str, float, float, float, float]:
+        """
+        Returns the hyphenated prefix for an in-bounds point and the bounds reached.
+
+        The result is `(prefix, min_lat, max_lat, min_lon, max_lon)`.
+        """
+        lat_strip = bisect_right(self._lat_thresholds, lat) - 1
+        lon_strip = bisect_right(self._lon_thresholds, lon) - 1
+        min_lat, max_lat = self._lat_bounds[lat_strip]
+        min_lon, max_lon = self._lon_bounds[lon_strip]
+        return self._prefixes[lat_strip][lon_strip], min_lat, max_lat, min_lon, max_lon
+
+
+def _format_prefix(rows: List[int], cols: List[int], levels: int) -> str:
+    chars = []
+    for level, (row_idx, col_idx) in enumerate(zip(rows, cols), start=1):
+        chars.append(DIGIPIN_GRID[row_idx][col_idx])
+        if level == 3 or level == 6:
+            chars.append("-")
+    return "".join(chars)
+
+
+def _build_decode_table(levels: int) -> Dict[str, _Bounds]:
+    """Maps every `levels`-character prefix to the bounds reached after decoding it."""
+    table: Dict[str, _Bounds] = {
+        "": (BOUNDS.min_lat, BOUNDS.max_lat, BOUNDS.min_lon, BOUNDS.max_lon)
+    }
+    for _ in range(levels):
+        next_table: Dict[str, _Bounds] = {}
+        for prefix, (min_lat, max_lat, min_lon, max_lon) in table.items():
+            lat_div = (max_lat - min_lat) / 4
+            lon_div = (max_lon - min_lon) / 4
+            for row_idx, row in enumerate(DIGIPIN_GRID):
+                for col_idx, char in enumerate(row):
+                    next_table[prefix + char] = (
+                        max_lat - lat_div * (row_idx + 1),
+                        max_lat - lat_div * row_idx,
+                        min_lon + lon_div * col_idx,
+                        min_lon + lon_div * (col_idx + 1),
+                    )
+        table = next_table
+    return table
+
+
+@lru_cache(maxsize=None)
+def get_encode_table(levels: int) -> EncodeTable:
+    """Returns the process-wide encode table for `levels` levels, building it once."""
+    return EncodeTable(levels)
+
+
+@lru_cache(maxsize=None)
+def get_decode_table(levels: int) -> Dict[str, _Bounds]:
+    """Returns the process-wide decode table for `levels` levels, building it once."""
+    return _build_decode_table(levels)
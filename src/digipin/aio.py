@@ -0,0 +1,303 @@
+"""
+Asyncio facade that coalesces concurrent encode/decode calls into batches.
+
+Each `await AsyncDigipin.encode(...)` (or `decode`) joins a pending batch.
+The batch is dispatched when it reaches `max_batch_size` or when `max_wait`
+seconds have passed since its first call, whichever comes first, and is
+processed in one call to `encode_many` / `decode_many` of the wrapped `Digipin`,
+so its backend and metrics apply. A handler with a cache answers each call from
+its cached scalar methods instead. Every caller gets exactly the value or
+exception the matching `Digipin` method would give.
+"""
+
+import asyncio
+import numbers
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .backends import _as_list
+from .core import DIGIPIN_LENGTH, Digipin, _check_coordinates, _check_precision, _clean_digipin
+from .model import Coordinates
+
+# (value, exception) per call; exactly one of the two is set
+_Outcome = Tuple[Any, Optional[BaseException]]
+
+
+@dataclass(frozen=True)
+class BatchStats:
+    """
+    A dataclass holding a snapshot of a batcher's counters.
+
+    Attributes:
+        batches (int): Number of batches dispatched.
+        items (int): Number of calls processed in those batches.
+        largest_batch (int): Size of the largest batch dispatched.
+        queue_depth (int): Calls currently waiting for their batch to be dispatched.
+        max_queue_depth (int): Highest number of calls seen waiting at once.
+    """
+
+    batches: int
+    items: int
+    largest_batch: int
+    queue_depth: int
+    max_queue_depth: int
+
+    @property
+    def mean_batch_size(self) -> float:
+        """Average number of calls per batch, 0.0 before the first batch."""
+        return self.items / self.batches if self.batches else 0.0
+
+
+class _Batcher(object):
+    """Collects submitted items and dispatches them to `run_batch` in groups."""
+
+    def __init__(
+        self,
+        run_batch: Callable[[List[Any]], List[_Outcome]],
+        max_batch_size: int,
+        max_wait: float,
+        executor: Optional[Executor],
+    ):
+        self._run_batch = run_batch
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._executor = executor
+        self._pending: List[Tuple[Any, "asyncio.Future"]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._batches = 0
+        self._items = 0
+        self._largest_batch = 0
+        self._max_queue_depth = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._pending)
+
+    async def submit(self, item: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        self._max_queue_depth = max(self._max_queue_depth, len(self._pending))
+        if len(self._pending) >= self._max_batch_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_wait, self.flush)
+        return await future
+
+    def flush(self) -> None:
+        """Dispatches the pending calls now, without waiting for the window to close."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        self._batches += 1
+        self._items += len(batch)
+        self._largest_batch = max(self._largest_batch, len(batch))
+        items = [item for item, _ in batch]
+        futures = [future for _, future in batch]
+
+        if self._executor is None:
+            try:
+                outcomes = self._run_batch(items)
+            except Exception as exc:
+                _fail(futures, exc)
+            else:
+                _resolve(futures, outcomes)
+            return
+
+        loop = futures[0].get_loop()
+        task = loop.run_in_executor(self._executor, self._run_batch, items)
+
+        def done(task: "asyncio.Future") -> None:
+            if task.cancelled():
+                _fail(futures, asyncio.CancelledError())
+            elif task.exception() is not None:
+                _fail(futures, task.exception())
+            else:
+                _resolve(futures, task.result())
+
+        task.add_done_callback(done)
+
+    def stats(self) -> BatchStats:
+        return BatchStats(
+            batches=self._batches,
+            items=self._items,
+            largest_batch=self._largest_batch,
+            queue_depth=len(self._pending),
+            max_queue_depth=self._max_queue_depth,
+        )
+
+
+def _resolve(futures: List["asyncio.Future"], outcomes: List[_Outcome]) -> None:
+    for future, (value, exc) in zip(futures, outcomes):
+        # A caller may have been cancelled while its batch was running.
+        if future.done():
+            continue
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(value)
+
+
+def _fail(futures: List["asyncio.Future"], exc: BaseException) -> None:
+    for future in futures:
+        if not future.done():
+            future.set_exception(exc)
+
+
+class AsyncDigipin(object):
+    """
+    Awaitable DIGIPIN encoding and decoding with micro-batching.
+
+    Create one instance per event loop and share it between request handlers.
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int = 256,
+        max_wait: float = 0.002,
+        executor: Optional[Executor] = None,
+        precision: int = DIGIPIN_LENGTH,
+        digipin: Optional[Digipin] = None,
+    ):
+        """
+        Initializes the facade.
+
+        Args:
+            max_batch_size (int): Dispatch a batch as soon as it holds this many calls.
+            max_wait (float): Longest time, in seconds, the first call of a batch
+                              waits for others to join it.
+            executor (Executor, optional): Run batches in this executor instead of
+                                           on the event loop thread.
+            precision (int): Number of grid levels used by `encode` and expected by
+                             `decode`, from 1 to 10.
+            digipin (Digipin, optional): Handler whose batch methods, backend,
+                                         cache and metrics serve the calls.
+
+        Raises:
+            ValueError: If max_batch_size is not positive or max_wait is negative.
+            InvalidPrecisionError: If precision is not between 1 and 10.
+        """
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be a positive integer, got {max_batch_size}.")
+        if max_wait < 0:
+            raise ValueError(f"max_wait must be non-negative, got {max_wait}.")
+        _check_precision(precision)
+        self.precision = precision
+        self._digipin = digipin if digipin is not None else Digipin()
+        self._encoder = _Batcher(self._encode_batch, max_batch_size, max_wait, executor)
+        self._decoder = _Batcher(self._decode_batch, max_batch_size, max_wait, executor)
+
+    async def encode(self, lat: float, lon: float) -> str:
+        """
+        Encodes one coordinate pair as part of the current batch.
+
+        Returns:
+            str: The same DIGIPIN as `Digipin.get_digipin(lat, lon, precision)`.
+
+        Raises:
+            LatitudeOutOfRangeError: If latitude is outside the defined bounds.
+            LongitudeOutOfRangeError: If longitude is outside the defined bounds.
+        """
+        return await self._encoder.submit((lat, lon))
+
+    async def decode(self, digi_pin: str) -> Coordinates:
+        """
+        Decodes one DIGIPIN as part of the current batch.
+
+        Returns:
+            Coordinates: The same value as `Digipin.get_lat_lng_from_digipin`.
+
+        Raises:
+            InvalidDigipinError: If the DIGIPIN string has an invalid length.
+            InvalidDigipinCharError: If the DIGIPIN string contains an unknown character.
+        """
+        return await self._decoder.submit(digi_pin)
+
+    @property
+    def queue_depth(self) -> int:
+        """Calls currently waiting for their batch, across encode and decode."""
+        return self._encoder.queue_depth + self._decoder.queue_depth
+
+    def stats(self) -> Dict[str, BatchStats]:
+        """
+        Returns batching counters for encoding and decoding.
+
+        Returns:
+            Dict[str, BatchStats]: Snapshots under the keys "encode" and "decode".
+        """
+        return {"encode": self._encoder.stats(), "decode": self._decoder.stats()}
+
+    def flush(self) -> None:
+        """Dispatches every pending call immediately."""
+        self._encoder.flush()
+        self._decoder.flush()
+
+    def _encode_batch(self, points: List[Tuple[float, float]]) -> List[_Outcome]:
+        # Cache keys (and rounding) only exist on the scalar path; non-numeric
+        # input must fail with the scalar error rather than be coerced.
+        if self._digipin._encode_cache is None and all(
+            isinstance(lat, numbers.Real) and isinstance(lon, numbers.Real) for lat, lon in points
+        ):
+            pins, invalid = self._digipin.encode_many(
+                [point[0] for point in points],
+                [point[1] for point in points],
+                return_invalid=True,
+                precision=self.precision,
+            )
+            return [
+                self._encode_error(*point) if bad else (pin, None)
+                for point, pin, bad in zip(points, _as_list(pins), _as_list(invalid))
+            ]
+        return [self._encode_one(lat, lon) for lat, lon in points]
+
+    def _decode_batch(self, pins: List[str]) -> List[_Outcome]:
+        # NumPy drops trailing NULs from fixed-width strings, so pins holding
+        # NUL are left to the scalar check.
+        if self._digipin._decode_cache is None and all(
+            isinstance(pin, str) and "\x00" not in pin for pin in pins
+        ):
+            decoded = self._digipin.decode_many(pins, precision=self.precision)
+            return [
+                self._decode_error(pin) if error else (Coordinates(lat, lon), None)
+                for pin, lat, lon, error in zip(
+                    pins,
+                    _as_list(decoded.latitude),
+                    _as_list(decoded.longitude),
+                    _as_list(decoded.errors),
+                )
+            ]
+        return [self._decode_one(pin) for pin in pins]
+
+    def _encode_one(self, lat: float, lon: float) -> _Outcome:
+        try:
+            return self._digipin.get_digipin(lat, lon, self.precision), None
+        except Exception as exc:
+            return None, exc
+
+    def _decode_one(self, digi_pin: str) -> _Outcome:
+        try:
+            return self._digipin.get_lat_lng_from_digipin(digi_pin, self.precision), None
+        except Exception as exc:
+            return None, exc
+
+    # The batch call already recorded these rows in the handler's metrics, so
+    # the scalar error is rebuilt without calling its (instrumented) methods.
+
+    def _encode_error(self, lat: float, lon: float) -> _Outcome:
+        try:
+            _check_coordinates(lat, lon, self._digipin.bounds)
+        except Exception as exc:
+            return None, exc
+        return self._encode_one(lat, lon)
+
+    def _decode_error(self, digi_pin: str) -> _Outcome:
+        try:
+            self._digipin._decode(_clean_digipin(digi_pin, self.precision))
+        except Exception as exc:
+            return None, exc
+        return self._decode_one(digi_pin)
@@ -0,0 +1,399 @@
+"""
+Registry of batch encode/decode backends behind `Digipin.encode_many` / `decode_many`.
+
+Two backends are built in:
+
+    python   the pure-Python reference: the scalar `Digipin` code applied row by
+             row. Always available; works on plain sequences and returns lists.
+    numpy    `digipin.vectorized`: whole arrays per grid level. Needs NumPy.
+
+Other packages (e.g. a compiled kernel) can add backends with
+`register_backend`, or by declaring an entry point in the ``digipin.backends``
+group whose value is a `Backend` subclass or factory. Backends are imported
+only when first selected, so ``import digipin`` never imports NumPy.
+
+The backend is chosen by the `backend` argument of `Digipin`, else by the
+``DIGIPIN_BACKEND`` environment variable, else automatically: the available
+backend with the highest priority wins.
+"""
+
+import importlib
+import math
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+from .core import (
+    BOUNDS,
+    DIGIPIN_GRID,
+    DIGIPIN_LENGTH,
+    Digipin,
+    _check_coordinates,
+    _check_precision,
+)
+from .model import DECODE_INVALID_CHAR, DECODE_INVALID_LENGTH, DECODE_OK, DecodedDigipins
+
+# Environment variable naming the backend to use when none is passed to `Digipin`
+BACKEND_ENV_VAR = "DIGIPIN_BACKEND"
+
+# Entry point group scanned for third-party backends
+ENTRY_POINT_GROUP = "digipin.backends"
+
+AUTO = "auto"
+
+
+class Backend(object):
+    """
+    Base class of batch backends.
+
+    Subclasses implement `encode_many` and `decode_many` with the semantics of
+    `digipin.vectorized.encode_many` and `decode_many`, so that the choice of
+    backend never changes a result:
+
+    - Input is converted like `numpy.asarray`: coordinates as float64, with None
+      becoming NaN, and pins as `str`/`bytes`. Values that cannot be converted
+      raise TypeError or ValueError.
+    - With NumPy installed, results are NumPy arrays shaped like the input:
+      `<U12` pins (narrower below precision 7), a boolean invalid mask, float64
+      coordinates and uint8 error codes. Only where NumPy is not installed at
+      all does the pure-Python backend return flat lists instead.
+    - A coordinate pair that is NaN or outside the bounds is an invalid row. The
+      first one raises the scalar range error unless `return_invalid` is set,
+      in which case it is encoded as an empty string and flagged in the mask.
+    - Invalid pins never raise; they get the per-row error code of the scalar
+      checks (length first, then characters, including NUL) and NaN coordinates.
+    """
+
+    name = "base"
+
+    def encode_many(
+        self, lats, lons, return_invalid: bool = False, precision: int = DIGIPIN_LENGTH
+    ):
+        raise NotImplementedError
+
+    def decode_many(
+        self, pins, return_bounds: bool = False, precision: int = DIGIPIN_LENGTH
+    ) -> DecodedDigipins:
+        raise NotImplementedError
+
+
+class PythonBackend(Backend):
+    """
+    Reference backend running the scalar `Digipin` code on each row.
+
+    NumPy is only used, when installed, to convert inputs and results to the
+    same types as the NumPy backend.
+    """
+
+    name = "python"
+
+    def __init__(self):
+        self._digipin = Digipin()
+        self._valid_chars = frozenset(char for row in DIGIPIN_GRID for char in row)
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        self._np = numpy
+
+    def encode_many(
+        self, lats, lons, return_invalid: bool = False, precision: int = DIGIPIN_LENGTH
+    ) -> Union[Any, List[str], Tuple[List[str], List[bool]]]:
+        """
+        Encodes sequences of latitudes and longitudes into DIGIPINs.
+
+        Returns:
+            numpy.ndarray: One pin per row (a list without NumPy), or a
+                           `(pins, invalid)` tuple when `return_invalid` is True;
+                           invalid rows are empty strings.
+        """
+        _check_precision(precision)
+        lat, lat_shape = self._coordinates(lats)
+        lon, lon_shape = self._coordinates(lons)
+        if lat_shape != lon_shape:
+            raise ValueError(
+                "Latitude and longitude arrays must have the same shape, "
+                f"got {lat_shape} and {lon_shape}."
+            )
+        encode = self._digipin._encode
+        pins: List[str] = []
+        invalid: List[bool] = []
+        for row_lat, row_lon in zip(lat, lon):
+            if (
+                BOUNDS.min_lat <= row_lat <= BOUNDS.max_lat
+                and BOUNDS.min_lon <= row_lon <= BOUNDS.max_lon
+            ):
+                pins.append(encode(row_lat, row_lon, precision))
+                invalid.append(False)
+            elif not return_invalid:
+                _check_coordinates(row_lat, row_lon)
+            else:
+                pins.append("")
+                invalid.append(True)
+
+        np = self._np
+        if np is not None:
+            width = precision + (precision > 3) + (precision > 6)
+            pins = np.array(pins, dtype=f"U{width}").reshape(lat_shape)
+            invalid = np.array(invalid, dtype=bool).reshape(lat_shape)
+        if return_invalid:
+            return pins, invalid
+        return pins
+
+    def decode_many(
+        self, pins, return_bounds: bool = False, precision: int = DIGIPIN_LENGTH
+    ) -> DecodedDigipins:
+        """
+        Decodes a sequence of DIGIPINs; the fields of the result are arrays shaped
+        like the input (flat lists without NumPy).
+        """
+        _check_precision(precision)
+        digipin = self._digipin
+        nan = math.nan
+        columns: Tuple[List[float], ...] = tuple([] for _ in range(6 if return_bounds else 2))
+        errors: List[int] = []
+        values, shape = self._pins(pins)
+        for pin in values:
+            if isinstance(pin, bytes):
+                pin = pin.decode("ascii", "replace")
+            pin_cleaned = pin.replace("-", "")
+            if len(pin_cleaned) != precision:
+                error = DECODE_INVALID_LENGTH
+            elif not self._valid_chars.issuperset(pin_cleaned):
+                error = DECODE_INVALID_CHAR
+            else:
+                error = DECODE_OK
+            errors.append(error)
+            if error != DECODE_OK:
+                for column in columns:
+                    column.append(nan)
+                continue
+            min_lat, max_lat, min_lon, max_lon = digipin._decode_bounds(pin_cleaned)
+            columns[0].append(round((min_lat + max_lat) / 2, 6))
+            columns[1].append(round((min_lon + max_lon) / 2, 6))
+            if return_bounds:
+                for column, value in zip(columns[2:], (min_lat, max_lat, min_lon, max_lon)):
+                    column.append(value)
+
+        np = self._np
+        if np is not None:
+            errors = np.array(errors, dtype=np.uint8).reshape(shape)
+            columns = tuple(
+                np.array(column, dtype=np.float64).reshape(shape) for column in columns
+            )
+        if not return_bounds:
+            latitude, longitude = columns
+            return DecodedDigipins(latitude=latitude, longitude=longitude, errors=errors)
+        latitude, longitude, min_lat, max_lat, min_lon, max_lon = columns
+        return DecodedDigipins(
+            latitude=latitude,
+            longitude=longitude,
+            errors=errors,
+            min_lat=min_lat,
+            max_lat=max_lat,
+            min_lon=min_lon,
+            max_lon=max_lon,
+        )
+
+    def _coordinates(self, values: Any) -> Tuple[List[float], Tuple[int, ...]]:
+        """Converts coordinates to a flat list of floats, plus the input shape."""
+        if self._np is not None:
+            array = self._np.asarray(values, dtype=self._np.float64)
+            return array.ravel().tolist(), array.shape
+        flat = [math.nan if value is None else float(value) for value in _as_list(values)]
+        return flat, (len(flat),)
+
+    def _pins(self, values: Any) -> Tuple[list, Tuple[int, ...]]:
+        """Converts pins to a flat list of `str` or `bytes`, plus the input shape."""
+        if self._np is not None:
+            array = self._np.asarray(values)
+            if array.dtype.kind not in ("U", "S"):
+                array = array.astype(str)
+            return array.ravel().tolist(), array.shape
+        flat = [
+            value if isinstance(value, (str, bytes)) else str(value) for value in _as_list(values)
+        ]
+        return flat, (len(flat),)
+
+
+class NumpyBackend(Backend):
+    """Vectorized backend from `digipin.vectorized`; importing it requires NumPy."""
+
+    name = "numpy"
+
+    def __init__(self):
+        from . import vectorized
+
+        self._vectorized = vectorized
+
+    def encode_many(
+        self, lats, lons, return_invalid: bool = False, precision: int = DIGIPIN_LENGTH
+    ):
+        return self._vectorized.encode_many(
+            lats, lons, return_invalid=return_invalid, precision=precision
+        )
+
+    def decode_many(
+        self, pins, return_bounds: bool = False, precision: int = DIGIPIN_LENGTH
+    ) -> DecodedDigipins:
+        return self._vectorized.decode_many(
+            pins, return_bounds=return_bounds, precision=precision
+        )
+
+
+def _as_list(values: Any) -> list:
+    """Flattens an array or iterable into a list of Python objects."""
+    if hasattr(values, "ravel") and hasattr(values, "tolist"):
+        return values.ravel().tolist()
+    return list(values)
+
+
+_Loader = Union[str, Callable[[], Backend]]
+
+
+@dataclass(frozen=True)
+class _Registration:
+    loader: _Loader
+    priority: int
+
+
+_registry: Dict[str, _Registration] = {
+    PythonBackend.name: _Registration(PythonBackend, priority=0),
+    NumpyBackend.name: _Registration(NumpyBackend, priority=10),
+}
+_instances: Dict[str, Backend] = {}
+_entry_points_loaded = False
+_lock = threading.RLock()
+
+
+def register_backend(name: str, loader: _Loader, priority: int = 0) -> None:
+    """
+    Registers a backend under a name, replacing any previous registration.
+
+    Args:
+        name (str): The name used to select the backend.
+        loader (str | Callable[[], Backend]): A zero-argument factory (such as a
+            `Backend` subclass), or its import path as "package.module:attribute".
+            It is called on first use; raising ImportError marks the backend as
+            unavailable.
+        priority (int): Rank for automatic selection; the built-in backends use
+                        0 (python) and 10 (numpy).
+
+    Raises:
+        ValueError: If name is empty or "auto".
+    """
+    if not name or name == AUTO:
+        raise ValueError(f"Invalid backend name {name!r}.")
+    with _lock:
+        _registry[name] = _Registration(loader, priority)
+        _instances.pop(name, None)
+        _instances.pop(AUTO, None)
+
+
+def _load_entry_points() -> None:
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+    from importlib.metadata import entry_points
+
+    found = entry_points()
+    if hasattr(found, "select"):
+        group = found.select(group=ENTRY_POINT_GROUP)
+    else:  # Python 3.9 returns a dict of groups
+        group = found.get(ENTRY_POINT_GROUP, ())
+    for entry_point in group:
+        _registry.setdefault(entry_point.name, _Registration(entry_point.value, priority=20))
+
+
+def _instantiate(name: str) -> Backend:
+    loader = _registry[name].loader
+    if isinstance(loader, str):
+        module_name, _, attribute = loader.partition(":")
+        loader = getattr(importlib.import_module(module_name), attribute)
+    return loader()
+
+
+def backend_names() -> List[str]:
+    """
+    Lists every registered backend, available or not, by decreasing priority.
+
+    Returns:
+        List[str]: Backend names, including those declared by entry points.
+    """
+    with _lock:
+        _load_entry_points()
+        return sorted(_registry, key=lambda name: -_registry[name].priority)
+
+
+def available_backends() -> List[str]:
+    """
+    Lists the backends that load in this environment, by decreasing priority.
+
+    Loading a backend to check it also caches it for `get_backend`.
+
+    Returns:
+        List[str]: Names of the backends whose dependencies are installed.
+    """
+    names = []
+    for name in backend_names():
+        try:
+            get_backend(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def check_backend_name(name: str) -> None:
+    """
+    Checks that a backend is registered, without importing it.
+
+    Raises:
+        ValueError: If no backend is registered under the name.
+    """
+    with _lock:
+        if name == AUTO or name in _registry:
+            return
+        _load_entry_points()
+        if name not in _registry:
+            raise ValueError(
+                f"Unknown DIGIPIN backend {name!r}; registered backends: "
+                f"{', '.join(backend_names())}."
+            )
+
+
+def get_backend(name: str = AUTO) -> Backend:
+    """
+    Returns a backend instance, importing it on first use.
+
+    Args:
+        name (str): A registered backend name, or "auto" for the
+                    ``DIGIPIN_BACKEND`` environment variable if set, and
+                    otherwise the available backend with the highest priority.
+
+    Returns:
+        Backend: The shared instance of that backend.
+
+    Raises:
+        ValueError: If no backend is registered under the name.
+        ImportError: If the backend's dependencies are not installed.
+    """
+    if name == AUTO:
+        name = os.environ.get(BACKEND_ENV_VAR) or AUTO
+    with _lock:
+        if name in _instances:
+            return _instances[name]
+        if name == AUTO:
+            for candidate in backend_names():
+                try:
+                    backend = get_backend(candidate)
+                except ImportError:
+                    continue
+                _instances[AUTO] = backend
+                return backend
+        check_backend_name(name)
+        backend = _instantiate(name)
+        _instances[name] = backend
+        return backend
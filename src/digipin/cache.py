@@ -0,0 +1,126 @@
+"""
+Bounded, thread-safe memoization used by `Digipin` when caching is enabled.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Optional
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    A dataclass holding a snapshot of a cache's counters.
+
+    Attributes:
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that had to be computed, including expired entries.
+        evictions (int): Entries dropped to stay within `maxsize`.
+        expirations (int): Entries dropped because they outlived the TTL.
+        size (int): Number of entries currently held.
+        maxsize (int): Maximum number of entries.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache, 0.0 before the first lookup."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache(object):
+    """
+    A least-recently-used cache with an optional time-to-live.
+
+    All operations take a lock, so one instance can be shared between threads.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: Optional[float] = None,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initializes an empty cache.
+
+        Args:
+            maxsize (int): Maximum number of entries; the least recently used
+                           entry is evicted beyond it.
+            ttl (float, optional): Seconds an entry stays valid after being stored.
+                                   None keeps entries until they are evicted.
+            timer (Callable[[], float]): Clock used for the TTL, in seconds.
+
+        Raises:
+            ValueError: If maxsize is not positive or ttl is not positive.
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be a positive integer, got {maxsize}.")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl must be positive, got {ttl}.")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the cached value for `key`, or `default` on a miss."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._misses += 1
+                return default
+            value, expires_at = entry
+            if expires_at is not None and self._timer() >= expires_at:
+                del self._data[key]
+                self._expirations += 1
+                self._misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Stores `value` under `key`, evicting the least recently used entry if full."""
+        expires_at = None if self.ttl is None else self._timer() + self.ttl
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Drops every entry and resets the counters."""
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def stats(self) -> CacheStats:
+        """Returns a consistent snapshot of the counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                size=len(self._data),
+                maxsize=self.maxsize,
+            )
@@ -0,0 +1,123 @@
+"""
+Command-line entry point for the `digipin` console script.
+
+    digipin encode points.csv points_with_pins.csv --lat-column lat --lon-column lon
+    digipin decode pins.parquet coords.parquet --column digipin
+    digipin pin 22.5726 88.3639
+    digipin coords 2TF-J7F-86MM
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from . import __version__
+from .core import DIGIPIN_LENGTH, Digipin
+from .error import DigipinBaseError
+from .pipeline import DEFAULT_CHUNK_SIZE, FORMATS, PipelineStats, decode_file, encode_file
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="digipin", description="Encode coordinates into DIGIPINs and decode them back."
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_file_arguments(command: argparse.ArgumentParser) -> None:
+        command.add_argument("input", help='Input file, or "-" for stdin (CSV/JSONL only).')
+        command.add_argument("output", help='Output file, or "-" for stdout (CSV/JSONL only).')
+        command.add_argument(
+            "--format", choices=FORMATS, help="File format (default: from the input extension)."
+        )
+        command.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help=f"Rows processed at a time (default: {DEFAULT_CHUNK_SIZE}).",
+        )
+
+    encode = commands.add_parser("encode", help="Add a DIGIPIN column to a file.")
+    add_file_arguments(encode)
+    encode.add_argument("--lat-column", default="lat", help="Latitude column (default: lat).")
+    encode.add_argument("--lon-column", default="lon", help="Longitude column (default: lon).")
+    encode.add_argument("--column", default="digipin", help="Column to add (default: digipin).")
+    encode.add_argument(
+        "--precision", type=int, default=DIGIPIN_LENGTH, help="Grid levels, 1-10 (default: 10)."
+    )
+
+    decode = commands.add_parser("decode", help="Add latitude/longitude columns to a file.")
+    add_file_arguments(decode)
+    decode.add_argument("--column", default="digipin", help="DIGIPIN column (default: digipin).")
+    decode.add_argument(
+        "--lat-column", default="latitude", help="Latitude column to add (default: latitude)."
+    )
+    decode.add_argument(
+        "--lon-column", default="longitude", help="Longitude column to add (default: longitude)."
+    )
+    decode.add_argument(
+        "--precision", type=int, default=DIGIPIN_LENGTH, help="Pin length, 1-10 (default: 10)."
+    )
+
+    pin = commands.add_parser("pin", help="Encode a single coordinate.")
+    pin.add_argument("lat", type=float)
+    pin.add_argument("lon", type=float)
+
+    coords = commands.add_parser("coords", help="Decode a single DIGIPIN.")
+    coords.add_argument("digipin")
+    return parser
+
+
+def _report(verb: str, stats: PipelineStats) -> None:
+    print(
+        f"{verb} {stats.rows:,} rows in {stats.seconds:.2f}s "
+        f"({stats.rows_per_second:,.0f} rows/s), {stats.errors:,} errors",
+        file=sys.stderr,
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs the command line interface.
+
+    Args:
+        argv (List[str], optional): Arguments without the program name; defaults to sys.argv.
+
+    Returns:
+        int: The process exit code.
+    """
+    args = _build_parser().parse_args(argv)
+    try:
+        if args.command == "encode":
+            stats = encode_file(
+                args.input,
+                args.output,
+                lat_column=args.lat_column,
+                lon_column=args.lon_column,
+                pin_column=args.column,
+                precision=args.precision,
+                chunk_size=args.chunk_size,
+                file_format=args.format,
+            )
+            _report("Encoded", stats)
+        elif args.command == "decode":
+            stats = decode_file(
+                args.input,
+                args.output,
+                pin_column=args.column,
+                lat_column=args.lat_column,
+                lon_column=args.lon_column,
+                precision=args.precision,
+                chunk_size=args.chunk_size,
+                file_format=args.format,
+            )
+            _report("Decoded", stats)
+        elif args.command == "pin":
+            print(Digipin().get_digipin(args.lat, args.lon))
+        else:
+            coords = Digipin().get_lat_lng_from_digipin(args.digipin)
+            print(f"{coords.latitude}, {coords.longitude}")
+    except (DigipinBaseError, KeyError, ValueError, ImportError, OSError) as exc:
+        print(f"digipin: error: {exc}", file=sys.stderr)
+        return 1
+    return 0
@@ -1,13 +1,18 @@
 import math
-from typing import Dict, List, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from .error import (
     InvalidDigipinCharError,
     InvalidDigipinError,
+    InvalidPrecisionError,
     LatitudeOutOfRangeError,
     LongitudeOutOfRangeError,
 )
-from .model import Coordinates, DigipinBounds
+from .model import Coordinates, DigipinBounds, DigipinCell
+
+if TYPE_CHECKING:
+    from .cache import CacheStats
+    from .metrics import Metrics
 
 # The DIGIPIN grid as defined in the JavaScript code
 DIGIPIN_GRID: List[List[str]] = [
@@ -20,59 +25,230 @@ DIGIPIN_GRID: List[List[str]] = [
 # The geographical bounds as defined in the JavaScript code
 BOUNDS: DigipinBounds = DigipinBounds(min_lat=2.5, max_lat=38.5, min_lon=63.5, max_lon=99.5)
 
+# Number of grid levels (characters) in a full DIGIPIN
+DIGIPIN_LENGTH = 10
+
+# Grid (row, column) of every DIGIPIN character, shared by all decoders
+_GRID_REVERSE_LOOKUP: Dict[str, Tuple[int, int]] = {
+    char: (r_idx, c_idx)
+    for r_idx, row in enumerate(DIGIPIN_GRID)
+    for c_idx, char in enumerate(row)
+}
+
+
+def _check_coordinates(lat: float, lon: float, bounds: DigipinBounds = BOUNDS) -> None:
+    """
+    Raises the appropriate out-of-range error if (lat, lon) falls outside the bounds.
+
+    Latitude is checked before longitude, so a point that is out of range on both
+    axes reports a LatitudeOutOfRangeError.
+    """
+    if not (bounds.min_lat <= lat <= bounds.max_lat):
+        raise LatitudeOutOfRangeError(
+            f"Latitude {lat} out of range " f"[{bounds.min_lat}, {bounds.max_lat}]"
+        )
+    if not (bounds.min_lon <= lon <= bounds.max_lon):
+        raise LongitudeOutOfRangeError(
+            f"Longitude {lon} out of range" f"[{bounds.min_lon}, {bounds.max_lon}]"
+        )
+
+
+def _check_precision(precision: int) -> None:
+    """Raises InvalidPrecisionError unless precision is a level between 1 and 10."""
+    if not (isinstance(precision, int) and 1 <= precision <= DIGIPIN_LENGTH):
+        raise InvalidPrecisionError(
+            f"Invalid precision {precision!r}: Must be an integer between 1 and {DIGIPIN_LENGTH}."
+        )
+
+
+def _clean_digipin(digi_pin: str, precision: int) -> str:
+    """
+    Strips hyphens from a DIGIPIN and checks it has `precision` characters.
+
+    Raises:
+        InvalidDigipinError: If the DIGIPIN string has an invalid length.
+        InvalidPrecisionError: If precision is not between 1 and 10.
+    """
+    if precision != DIGIPIN_LENGTH:
+        _check_precision(precision)
+    pin_cleaned = digi_pin.replace("-", "")
+    if len(pin_cleaned) != precision:
+        raise InvalidDigipinError(
+            f"Invalid DIGIPIN: Must be {precision} alphanumeric characters (excluding hyphens)."
+        )
+    return pin_cleaned
+
+
+def format_digipin(pin_cleaned: str) -> str:
+    """
+    Inserts the hyphens after the 3rd and 6th characters of a (partial) DIGIPIN.
+
+    Args:
+        pin_cleaned (str): DIGIPIN characters without hyphens, e.g. "2TFJ7F86MM" or "2TFJ".
+
+    Returns:
+        str: The hyphenated form, e.g. "2TF-J7F-86MM" or "2TF-J".
+    """
+    if len(pin_cleaned) <= 3:
+        return pin_cleaned
+    if len(pin_cleaned) <= 6:
+        return f"{pin_cleaned[:3]}-{pin_cleaned[3:]}"
+    return f"{pin_cleaned[:3]}-{pin_cleaned[3:6]}-{pin_cleaned[6:]}"
+
 
 class Digipin(object):
     """
-    Encodes latitude and longitude into a 10-digit alphanumeric DIGIPIN
-    and decodes a DIGIPIN back into its central latitude & longitude.
+    Encodes latitude and longitude into an alphanumeric DIGIPIN (10 characters
+    at full precision) and decodes a DIGIPIN back into its central latitude & longitude.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        lookup_levels: int = 0,
+        cache_size: int = 0,
+        cache_ttl: Optional[float] = None,
+        cache_decimals: Optional[int] = None,
+        metrics: Optional["Metrics"] = None,
+        backend: Optional[str] = None,
+    ):
         """
         Initializes the Digipin.
         The grid and bounds are fixed constants for this implementation.
+
+        Args:
+            lookup_levels (int): Number of leading grid levels (0-4) resolved from
+                                 precomputed tables instead of the per-level loop.
+                                 The tables are built once per process on first use
+                                 and give identical results. 0 disables them.
+            cache_size (int): Maximum number of entries in each of the encode and
+                              decode LRU caches. 0 disables caching.
+            cache_ttl (float, optional): Seconds a cached entry stays valid. None
+                                         keeps entries until they are evicted.
+            cache_decimals (int, optional): Round coordinates to this many decimal
+                                            places to form encode cache keys, so
+                                            nearby repeats share an entry. Points
+                                            that round together but straddle a
+                                            cell edge then share a pin. None keys
+                                            on the exact coordinates.
+            metrics (Metrics, optional): Registry recording call counts, errors,
+                                         sampled latency and batch sizes of this
+                                         instance (see `digipin.metrics`). None
+                                         leaves every method uninstrumented.
+            backend (str, optional): Batch backend used by `encode_many` and
+                                     `decode_many`, e.g. "python" or "numpy" (see
+                                     `digipin.backends`). None defers to the
+                                     DIGIPIN_BACKEND environment variable, then
+                                     to the fastest available backend.
+
+        Raises:
+            ValueError: If `lookup_levels` is outside [0, 4], `cache_size` is
+                        negative, `cache_ttl` is not positive or `backend` is
+                        not a registered backend.
         """
         self.digipin_grid = DIGIPIN_GRID
         self.bounds = BOUNDS
 
-        # Pre-compute reverse lookup for faster decoding
-        self._grid_reverse_lookup: Dict[str, Tuple[int, int]] = {}
-        for r_idx, row in enumerate(self.digipin_grid):
-            for c_idx, char in enumerate(row):
-                self._grid_reverse_lookup[char] = (r_idx, c_idx)
+        # Reverse lookup for decoding, computed once at import time
+        self._grid_reverse_lookup = _GRID_REVERSE_LOOKUP
+
+        self._lookup_levels = lookup_levels
+        self._encode_table = None
+        self._decode_table = None
+        if lookup_levels:
+            from ._lookup import MAX_LOOKUP_LEVELS, get_decode_table, get_encode_table
+
+            if not (0 < lookup_levels <= MAX_LOOKUP_LEVELS):
+                raise ValueError(
+                    f"lookup_levels must be between 0 and {MAX_LOOKUP_LEVELS}, "
+                    f"got {lookup_levels}."
+                )
+            self._encode_table = get_encode_table(lookup_levels)
+            self._decode_table = get_decode_table(lookup_levels)
 
-    def get_digipin(self, lat: float, lon: float) -> str:
+        if cache_size < 0:
+            raise ValueError(f"cache_size must be a non-negative integer, got {cache_size}.")
+        self._cache_decimals = cache_decimals
+        self._encode_cache = None
+        self._decode_cache = None
+        if cache_size:
+            from .cache import LRUCache
+
+            self._encode_cache = LRUCache(cache_size, ttl=cache_ttl)
+            self._decode_cache = LRUCache(cache_size, ttl=cache_ttl)
+
+        # Resolved (and imported) on the first batch call
+        self._backend_name = backend
+        self._backend = None
+        if backend is not None:
+            from .backends import check_backend_name
+
+            check_backend_name(backend)
+
+        if metrics is not None:
+            from .metrics import instrument_digipin
+
+            instrument_digipin(self, metrics)
+
+    def get_digipin(self, lat: float, lon: float, precision: int = DIGIPIN_LENGTH) -> str:
         """
-        Encodes latitude and longitude into a 10-digit alphanumeric DIGIPIN.
+        Encodes latitude and longitude into an alphanumeric DIGIPIN of `precision` characters.
 
         Args:
             lat (float): Latitude in decimal degrees.
             lon (float): Longitude in decimal degrees.
+            precision (int): Number of grid levels to encode, from 1 to 10. Lower
+                             precisions return the matching prefix of the full pin
+                             (e.g. "2TF-J" for 4) and skip the remaining levels.
 
         Returns:
-            str: The generated 10-digit DIGIPIN string (e.g., "F3K-C4M-95P-86T").
+            str: The hyphenated DIGIPIN, with `precision` characters excluding hyphens
+                 (e.g. "2TF-J7F-86MM" for 10).
 
         Raises:
             LatitudeOutOfRangeError: If latitude is outside the defined bounds.
             LongitudeOutOfRangeError: If longitude is outside the defined bounds.
+            InvalidPrecisionError: If precision is not between 1 and 10.
         """
-        if not (self.bounds.min_lat <= lat <= self.bounds.max_lat):
-            raise LatitudeOutOfRangeError(
-                f"Latitude {lat} out of range " f"[{self.bounds.min_lat}, {self.bounds.max_lat}]"
-            )
-        if not (self.bounds.min_lon <= lon <= self.bounds.max_lon):
-            raise LongitudeOutOfRangeError(
-                f"Longitude {lon} out of range" f"[{self.bounds.min_lon}, {self.bounds.max_lon}]"
-            )
-
-        current_min_lat = self.bounds.min_lat
-        current_max_lat = self.bounds.max_lat
-        current_min_lon = self.bounds.min_lon
-        current_max_lon = self.bounds.max_lon
-
-        digi_pin_chars: List[str] = []
-
-        for level in range(1, 11):  # Levels 1 to 10
+        _check_coordinates(lat, lon, self.bounds)
+        if precision != DIGIPIN_LENGTH:
+            _check_precision(precision)
+
+        if self._encode_cache is None:
+            return self._encode(lat, lon, precision)
+
+        if self._cache_decimals is None:
+            key = (lat, lon, precision)
+        else:
+            key = (round(lat, self._cache_decimals), round(lon, self._cache_decimals), precision)
+        digi_pin = self._encode_cache.get(key)
+        if digi_pin is None:
+            digi_pin = self._encode(lat, lon, precision)
+            self._encode_cache.put(key, digi_pin)
+        return digi_pin
+
+    def _encode(self, lat: float, lon: float, precision: int) -> str:
+        """Runs the level-by-level subdivision for validated coordinates."""
+        if self._encode_table is not None and precision > self._lookup_levels:
+            # Jump straight to level N using the precomputed strip tables
+            (
+                prefix,
+                current_min_lat,
+                current_max_lat,
+                current_min_lon,
+                current_max_lon,
+            ) = self._encode_table.lookup(lat, lon)
+            digi_pin_chars: List[str] = [prefix]
+            first_level = self._lookup_levels + 1
+        else:
+            current_min_lat = self.bounds.min_lat
+            current_max_lat = self.bounds.max_lat
+            current_min_lon = self.bounds.min_lon
+            current_max_lon = self.bounds.max_lon
+
+            digi_pin_chars = []
+            first_level = 1
+
+        for level in range(first_level, precision + 1):  # Levels 1 to precision
             lat_div = (current_max_lat - current_min_lat) / 4
             lon_div = (current_max_lon - current_min_lon) / 4
 
@@ -86,7 +262,7 @@ class Digipin(object):
             digi_pin_chars.append(self.digipin_grid[row_idx][col_idx])
 
             # Add hyphen after 3rd and 6th character
-            if level == 3 or level == 6:
+            if (level == 3 or level == 6) and level < precision:
                 digi_pin_chars.append("-")
 
             # This corresponds to picking the specific sub-quadrant.
@@ -108,32 +284,291 @@ class Digipin(object):
 
         return "".join(digi_pin_chars)
 
-    def get_lat_lng_from_digipin(self, digi_pin: str) -> Coordinates:
+    def encode_many(
+        self, lats, lons, return_invalid: bool = False, precision: int = DIGIPIN_LENGTH
+    ):
+        """
+        Encodes arrays of latitudes and longitudes into DIGIPINs in one batch.
+
+        Runs on the selected backend (see `digipin.backends`); with the NumPy
+        backend this is `digipin.vectorized.encode_many`.
+
+        Args:
+            lats (array_like): Latitudes in decimal degrees.
+            lons (array_like): Longitudes in decimal degrees.
+            return_invalid (bool): Flag out-of-range rows in a mask instead of raising.
+            precision (int): Number of grid levels to encode, from 1 to 10.
+
+        Returns:
+            numpy.ndarray: The DIGIPIN of every row (a list only where NumPy is not
+                           installed), or a `(pins, invalid)` tuple when
+                           `return_invalid` is True. Every backend returns the same
+                           types; see `digipin.backends.Backend`.
+
+        Raises:
+            LatitudeOutOfRangeError: If a latitude is outside the defined bounds.
+            LongitudeOutOfRangeError: If a longitude is outside the defined bounds.
+        """
+        return self._batch_backend().encode_many(
+            lats, lons, return_invalid=return_invalid, precision=precision
+        )
+
+    def parallel_encode(
+        self,
+        lats,
+        lons,
+        workers: Optional[int] = None,
+        return_invalid: bool = False,
+        precision: int = DIGIPIN_LENGTH,
+    ):
+        """
+        Encodes large arrays of coordinates into DIGIPINs across several processes.
+
+        Requires NumPy. See `digipin.parallel.parallel_encode` for details.
+
+        Args:
+            lats (array_like): Latitudes in decimal degrees.
+            lons (array_like): Longitudes in decimal degrees.
+            workers (int, optional): Number of worker processes; defaults to the CPU count.
+            return_invalid (bool): Flag out-of-range rows in a mask instead of raising.
+            precision (int): Number of grid levels to encode, from 1 to 10.
+
+        Returns:
+            numpy.ndarray: The DIGIPIN of every row in input order, or a
+                           `(pins, invalid)` tuple when `return_invalid` is True.
+
+        Raises:
+            LatitudeOutOfRangeError: If a latitude is outside the defined bounds.
+            LongitudeOutOfRangeError: If a longitude is outside the defined bounds.
+        """
+        from .parallel import parallel_encode
+
+        return parallel_encode(
+            lats, lons, workers=workers, return_invalid=return_invalid, precision=precision
+        )
+
+    def decode_many(
+        self, digi_pins, return_bounds: bool = False, precision: int = DIGIPIN_LENGTH
+    ):
+        """
+        Decodes an array of DIGIPINs into central latitudes and longitudes in one batch.
+
+        Invalid pins are reported through a per-row error code instead of
+        raising. Runs on the selected backend (see `digipin.backends`); with the
+        NumPy backend this is `digipin.vectorized.decode_many`.
+
+        Args:
+            digi_pins (array_like): DIGIPIN strings.
+            return_bounds (bool): Also return the bounding box of every cell.
+            precision (int): Expected number of characters, from 1 to 10.
+
+        Returns:
+            DecodedDigipins: Latitude, longitude and error-code arrays (lists only
+                             where NumPy is not installed).
+        """
+        return self._batch_backend().decode_many(
+            digi_pins, return_bounds=return_bounds, precision=precision
+        )
+
+    @property
+    def backend(self) -> str:
+        """Name of the batch backend, importing it if not done yet."""
+        return self._batch_backend().name
+
+    def _batch_backend(self):
+        if self._backend is None:
+            from .backends import AUTO, get_backend
+
+            self._backend = get_backend(self._backend_name or AUTO)
+        return self._backend
+
+    def encode_int(self, lat: float, lon: float) -> int:
+        """
+        Encodes latitude and longitude into the 40-bit integer form of the DIGIPIN.
+
+        See `digipin.intcode` for the bit layout and the string conversions.
+
+        Args:
+            lat (float): Latitude in decimal degrees.
+            lon (float): Longitude in decimal degrees.
+
+        Returns:
+            int: The integer code, equal to `pin_to_int(get_digipin(lat, lon))`.
+
+        Raises:
+            LatitudeOutOfRangeError: If latitude is outside the defined bounds.
+            LongitudeOutOfRangeError: If longitude is outside the defined bounds.
+        """
+        from .intcode import encode_int
+
+        return encode_int(lat, lon)
+
+    def decode_int(self, code: int) -> Coordinates:
+        """
+        Decodes the 40-bit integer form of a DIGIPIN into its central latitude & longitude.
+
+        Args:
+            code (int): The integer code of a DIGIPIN.
+
+        Returns:
+            Coordinates: The centre of the cell, rounded to 6 decimal places.
+
+        Raises:
+            InvalidDigipinError: If the code is not a 40-bit unsigned integer.
+        """
+        from .intcode import decode_int
+
+        return decode_int(code)
+
+    def get_lat_lng_from_digipin(
+        self, digi_pin: str, precision: int = DIGIPIN_LENGTH
+    ) -> Coordinates:
         """
         Decodes a DIGIPIN back into its central latitude & longitude.
 
         Args:
-            digi_pin (str): The 10-digit alphanumeric DIGIPIN string.
+            digi_pin (str): The DIGIPIN string, with `precision` characters excluding
+                            hyphens.
+            precision (int): Expected number of characters (excluding hyphens), from
+                             1 to 10. Use a lower precision to decode partial pins.
 
         Returns:
-            Coordinates: A Coordinates dataclass containing the central latitude and longitude,
-                         rounded to 6 decimal places.
+            Coordinates: A Coordinates object containing the central latitude and
+                         longitude, rounded to 6 decimal places.
+
+        Raises:
+            InvalidDigipinError: If the DIGIPIN string has an invalid length.
+            InvalidDigipinCharError: If the DIGIPIN string contains an unknown character.
+            InvalidPrecisionError: If precision is not between 1 and 10.
+        """
+        pin_cleaned = _clean_digipin(digi_pin, precision)
+        if self._decode_cache is not None:
+            return Coordinates(*self._decode_cached(pin_cleaned))
+        return Coordinates(*self._decode(pin_cleaned))
+
+    def get_lat_lng_tuple(
+        self, digi_pin: str, precision: int = DIGIPIN_LENGTH
+    ) -> Tuple[float, float]:
+        """
+        Decodes a DIGIPIN into a plain `(latitude, longitude)` tuple.
+
+        Same values as `get_lat_lng_from_digipin`, without building a
+        `Coordinates` object; meant for hot loops that unpack the result.
+
+        Args:
+            digi_pin (str): The DIGIPIN string, with `precision` characters excluding
+                            hyphens.
+            precision (int): Expected number of characters (excluding hyphens), from 1 to 10.
+
+        Returns:
+            Tuple[float, float]: The central latitude and longitude, rounded to 6
+                                 decimal places.
+
+        Raises:
+            InvalidDigipinError: If the DIGIPIN string has an invalid length.
+            InvalidDigipinCharError: If the DIGIPIN string contains an unknown character.
+            InvalidPrecisionError: If precision is not between 1 and 10.
+        """
+        pin_cleaned = _clean_digipin(digi_pin, precision)
+        if self._decode_cache is not None:
+            return self._decode_cached(pin_cleaned)
+        return self._decode(pin_cleaned)
+
+    def _decode_cached(self, pin_cleaned: str) -> Tuple[float, float]:
+        """Decodes through the decode cache, filling it on a miss."""
+        center = self._decode_cache.get(pin_cleaned)
+        if center is None:
+            center = self._decode(pin_cleaned)
+            self._decode_cache.put(pin_cleaned, center)
+        return center
+
+    def _decode(self, pin_cleaned: str) -> Tuple[float, float]:
+        """Decodes a hyphen-free DIGIPIN of the expected length into its centre."""
+        current_min_lat, current_max_lat, current_min_lon, current_max_lon = self._decode_bounds(
+            pin_cleaned
+        )
+
+        center_lat = (current_min_lat + current_max_lat) / 2
+        center_lon = (current_min_lon + current_max_lon) / 2
+
+        # Round to 6 decimal places as in the JavaScript example
+        return round(center_lat, 6), round(center_lon, 6)
+
+    def cache_stats(self) -> Dict[str, "CacheStats"]:
+        """
+        Returns the hit, miss and eviction counters of the encode and decode caches.
+
+        Returns:
+            Dict[str, CacheStats]: Snapshots under the keys "encode" and "decode",
+                                   or an empty dict when caching is disabled.
+        """
+        if self._encode_cache is None:
+            return {}
+        return {"encode": self._encode_cache.stats(), "decode": self._decode_cache.stats()}
+
+    def clear_cache(self) -> None:
+        """Empties the encode and decode caches and resets their counters."""
+        if self._encode_cache is not None:
+            self._encode_cache.clear()
+            self._decode_cache.clear()
+
+    def get_cell(self, digi_pin: str) -> DigipinCell:
+        """
+        Describes the grid cell identified by a full or partial DIGIPIN.
+
+        Args:
+            digi_pin (str): A DIGIPIN or DIGIPIN prefix of 1 to 10 characters
+                            (excluding hyphens), e.g. "2TF" or "2TF-J7F-86MM".
+
+        Returns:
+            DigipinCell: The hyphenated pin, its level, bounds, exact centre and size.
 
         Raises:
             InvalidDigipinError: If the DIGIPIN string has an invalid length.
             InvalidDigipinCharError: If the DIGIPIN string contains an unknown character.
         """
         pin_cleaned = digi_pin.replace("-", "")
-        if len(pin_cleaned) != 10:
+        if not (1 <= len(pin_cleaned) <= DIGIPIN_LENGTH):
             raise InvalidDigipinError(
-                "Invalid DIGIPIN: Must be 10 alphanumeric characters (excluding hyphens)."
+                "Invalid DIGIPIN: Must be 1 to 10 alphanumeric characters (excluding hyphens)."
             )
 
+        min_lat, max_lat, min_lon, max_lon = self._decode_bounds(pin_cleaned)
+        return DigipinCell(
+            digipin=format_digipin(pin_cleaned),
+            level=len(pin_cleaned),
+            bounds=DigipinBounds(
+                min_lat=min_lat, max_lat=max_lat, min_lon=min_lon, max_lon=max_lon
+            ),
+            center=Coordinates(
+                latitude=(min_lat + max_lat) / 2, longitude=(min_lon + max_lon) / 2
+            ),
+            lat_size=max_lat - min_lat,
+            lon_size=max_lon - min_lon,
+        )
+
+    def _decode_bounds(self, pin_cleaned: str) -> Tuple[float, float, float, float]:
+        """
+        Narrows the bounds level by level for a hyphen-free (partial) DIGIPIN.
+
+        Returns the (min_lat, max_lat, min_lon, max_lon) of the final cell.
+
+        Raises:
+            InvalidDigipinCharError: If the DIGIPIN string contains an unknown character.
+        """
         current_min_lat = self.bounds.min_lat
         current_max_lat = self.bounds.max_lat
         current_min_lon = self.bounds.min_lon
         current_max_lon = self.bounds.max_lon
 
+        if self._decode_table is not None:
+            # A miss means the prefix holds an invalid character; the loop below reports it.
+            levels = self._lookup_levels
+            prefix_bounds = self._decode_table.get(pin_cleaned[:levels])
+            if prefix_bounds is not None:
+                current_min_lat, current_max_lat, current_min_lon, current_max_lon = prefix_bounds
+                pin_cleaned = pin_cleaned[levels:]
+
         for char in pin_cleaned:
             if char not in self._grid_reverse_lookup:
                 raise InvalidDigipinCharError(f"Invalid character '{char}' found in DIGIPIN.")
@@ -162,8 +597,4 @@ class Digipin(object):
             current_min_lon = new_min_lon
             current_max_lon = new_max_lon
 
-        center_lat = (current_min_lat + current_max_lat) / 2
-        center_lon = (current_min_lon + current_max_lon) / 2
-
-        # Round to 6 decimal places as in the JavaScript example
-        return Coordinates(latitude=round(center_lat, 6), longitude=round(center_lon, 6))
+        return current_min_lat, current_max_lat, current_min_lon, current_max_lon
@@ -0,0 +1,548 @@
+"""
+Great-circle distances and nearest-neighbour search between DIGIPINs.
+
+Distances are haversine distances, in kilometres, between cell centres as
+returned by `Digipin.get_lat_lng_from_digipin`. The batch functions decode
+whole arrays at once with `digipin.vectorized.decode_many` and need NumPy;
+invalid pins give NaN instead of raising.
+
+`nearest` does not compare every query with every candidate. Candidates are
+bucketed by cell on a level picked from their own density, so clustered
+inputs (e.g. one city) get fine buckets. Queries are sorted along a Z-order
+curve and cut into compact ranges, each searching a growing block of cells
+around its bounding box. Large blocks are pruned per query through a
+quadtree of their buckets, so queries far from a dense cluster only compare
+with its near edge. The search stops once no cell outside the block can hold
+anything closer than the k-th best match found so far. Distances are
+computed in slices of at most `_MAX_PAIRS` query-candidate pairs, so memory
+stays bounded whatever the inputs.
+"""
+
+import math
+
+from .core import BOUNDS, DIGIPIN_LENGTH, Digipin
+
+# Mean radius of the Earth in kilometres
+EARTH_RADIUS_KM = 6371.0088
+
+# Coarsest and finest levels `nearest` buckets candidates on
+_MIN_BUCKET_LEVEL = 1
+_MAX_BUCKET_LEVEL = DIGIPIN_LENGTH
+
+# `nearest` uses the coarsest level on which the bucket of a typical candidate
+# holds at most max(k, _BUCKET_TARGET) candidates.
+_BUCKET_TARGET = 8
+
+# Most queries searched together from one block
+_QUERY_RANGE = 1024
+
+# Blocks with more candidates than this are pruned through a quadtree of their
+# buckets before ranking, starting from at most _PRUNE_FANOUT quadtree cells
+_PRUNE_SIZE = 256
+_PRUNE_FANOUT = 16
+
+# Allowance for rounding in the pruning bounds, in kilometres
+_BOUND_SLACK_KM = 1e-6
+
+# Most query-candidate distances held in memory at once (unless one query alone
+# has more candidates in its block)
+_MAX_PAIRS = 1 << 21
+
+
+def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points, in kilometres."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def distance(pin_a: str, pin_b: str, precision: int = DIGIPIN_LENGTH) -> float:
+    """
+    Returns the distance between the centres of two cells.
+
+    Args:
+        pin_a (str): The first DIGIPIN.
+        pin_b (str): The second DIGIPIN.
+        precision (int): Number of characters (excluding hyphens) of both pins, from 1 to 10.
+
+    Returns:
+        float: The haversine distance in kilometres.
+
+    Raises:
+        InvalidDigipinError: If a DIGIPIN string has an invalid length.
+        InvalidDigipinCharError: If a DIGIPIN string contains an unknown character.
+    """
+    digipin = Digipin()
+    lat1, lon1 = digipin.get_lat_lng_tuple(pin_a, precision)
+    lat2, lon2 = digipin.get_lat_lng_tuple(pin_b, precision)
+    return _haversine_km(lat1, lon1, lat2, lon2)
+
+
+def _centres(pins, precision: int):
+    """Decoded centres of an array of pins, in radians, with NaN for invalid rows."""
+    import numpy as np
+
+    from .vectorized import decode_many
+
+    decoded = decode_many(pins, precision=precision)
+    return np.radians(decoded.latitude), np.radians(decoded.longitude)
+
+
+def _haversine_array(phi1, lambda1, phi2, lambda2):
+    """Vectorized `_haversine_km` over broadcastable arrays of radians."""
+    import numpy as np
+
+    a = (
+        np.sin((phi2 - phi1) / 2) ** 2
+        + np.cos(phi1) * np.cos(phi2) * np.sin((lambda2 - lambda1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.minimum(1.0, np.sqrt(a)))
+
+
+def distance_many(pins_a, pins_b, precision: int = DIGIPIN_LENGTH):
+    """
+    Computes the distance between each pair of pins from two arrays.
+
+    Args:
+        pins_a (array_like): DIGIPIN strings.
+        pins_b (array_like): DIGIPIN strings, with the same shape as `pins_a`.
+        precision (int): Number of characters (excluding hyphens) of every pin, from 1 to 10.
+
+    Returns:
+        numpy.ndarray: float64 distances in kilometres, shaped like the inputs; NaN
+                       where either pin is invalid.
+
+    Raises:
+        ValueError: If the inputs have different shapes.
+        InvalidPrecisionError: If precision is not between 1 and 10.
+    """
+    phi1, lambda1 = _centres(pins_a, precision)
+    phi2, lambda2 = _centres(pins_b, precision)
+    if phi1.shape != phi2.shape:
+        raise ValueError(
+            f"pins_a and pins_b must have the same shape, got {phi1.shape} and {phi2.shape}."
+        )
+    return _haversine_array(phi1, lambda1, phi2, lambda2)
+
+
+def distance_matrix(pins_a, pins_b, precision: int = DIGIPIN_LENGTH):
+    """
+    Computes the distance between every pin of one array and every pin of another.
+
+    Args:
+        pins_a (array_like): M DIGIPIN strings.
+        pins_b (array_like): N DIGIPIN strings.
+        precision (int): Number of characters (excluding hyphens) of every pin, from 1 to 10.
+
+    Returns:
+        numpy.ndarray: An `(M, N)` float64 matrix of distances in kilometres; NaN
+                       rows and columns for invalid pins.
+
+    Raises:
+        InvalidPrecisionError: If precision is not between 1 and 10.
+    """
+    phi1, lambda1 = _centres(pins_a, precision)
+    phi2, lambda2 = _centres(pins_b, precision)
+    return _haversine_array(
+        phi1.ravel()[:, None],
+        lambda1.ravel()[:, None],
+        phi2.ravel()[None, :],
+        lambda2.ravel()[None, :],
+    )
+
+
+def nearest(query_pins, candidate_pins, k: int = 1, precision: int = DIGIPIN_LENGTH):
+    """
+    Finds the `k` closest candidate pins to every query pin.
+
+    The result is exact: the same as sorting each row of `distance_matrix`,
+    without computing the full matrix.
+
+    Args:
+        query_pins (array_like): N DIGIPIN strings to match.
+        candidate_pins (array_like): DIGIPIN strings to match against (e.g. depots).
+        k (int): Number of matches per query.
+        precision (int): Number of characters (excluding hyphens) of every pin, from 1 to 10.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: `(indices, distances)`, both of shape
+            `(N, k)` and ordered nearest first: positions in `candidate_pins`
+            (int64) and distances in kilometres. Missing matches (an invalid
+            query, or fewer than k valid candidates) have index -1 and an
+            infinite distance.
+
+    Raises:
+        ValueError: If k is not positive.
+        InvalidPrecisionError: If precision is not between 1 and 10.
+    """
+    import numpy as np
+
+    if k < 1:
+        raise ValueError(f"k must be a positive integer, got {k}.")
+    q_phi, q_lambda = (values.ravel() for values in _centres(query_pins, precision))
+    c_phi, c_lambda = (values.ravel() for values in _centres(candidate_pins, precision))
+
+    indices = np.full((q_phi.shape[0], k), -1, dtype=np.int64)
+    distances = np.full((q_phi.shape[0], k), np.inf)
+    candidates = np.flatnonzero(~np.isnan(c_phi))
+    queries = np.flatnonzero(~np.isnan(q_phi))
+    if not candidates.size or not queries.size:
+        return indices, distances
+
+    # Only the first k candidates at one location can be among the k nearest, and
+    # queries at one location share their matches.
+    c_cell = _cell_key(c_phi[candidates], c_lambda[candidates], precision)
+    order = np.argsort(c_cell, kind="stable")
+    c_cell = c_cell[order]
+    starts = np.flatnonzero(np.concatenate(([True], c_cell[1:] != c_cell[:-1])))
+    rank = np.arange(c_cell.size) - np.repeat(starts, np.diff(np.append(starts, c_cell.size)))
+    candidates = np.sort(candidates[order[rank < k]])
+    q_cell = _cell_key(q_phi[queries], q_lambda[queries], precision)
+    _, first, owner = np.unique(q_cell, return_index=True, return_inverse=True)
+    duplicates = queries
+    queries = queries[first]
+    representatives = queries[owner.ravel()]
+
+    level = _bucket_level(c_phi[candidates], c_lambda[candidates], k, precision)
+    side = 4**level
+    c_row, c_col = _cell_indices(c_phi[candidates], c_lambda[candidates], side)
+    c_key = c_row * side + c_col
+    order = np.argsort(c_key, kind="stable")
+    candidates = candidates[order]
+    c_key = c_key[order]
+
+    # Sorted along a Z-order curve, queries sharing a cell prefix are contiguous.
+    q_row, q_col = _cell_indices(q_phi[queries], q_lambda[queries], side)
+    z = _interleave(q_row, q_col, level)
+    order = np.argsort(z, kind="stable")
+    queries = queries[order]
+    q_row = q_row[order]
+    q_col = q_col[order]
+    z = z[order]
+
+    search = _BlockSearch(c_phi, c_lambda, candidates, c_key, level, k)
+    for start, stop in _query_ranges(z, level, _QUERY_RANGE):
+        rows = queries[start:stop]
+        block_rows = q_row[start:stop]
+        block_cols = q_col[start:stop]
+        found, dist = search.run(
+            q_phi[rows],
+            q_lambda[rows],
+            int(block_rows.min()),
+            int(block_rows.max()),
+            int(block_cols.min()),
+            int(block_cols.max()),
+        )
+        indices[rows] = found
+        distances[rows] = dist
+    indices[duplicates] = indices[representatives]
+    distances[duplicates] = distances[representatives]
+    return indices, distances
+
+
+def _cell_key(phi, lam, level: int):
+    """Row-major key of the level cell containing each point."""
+    side = 4**level
+    row, col = _cell_indices(phi, lam, side)
+    return row * side + col
+
+
+def _bucket_level(phi, lam, k: int, precision: int) -> int:
+    """Coarsest level on which the cell of a typical point holds at most max(k, 8) points."""
+    import numpy as np
+
+    target = max(k, _BUCKET_TARGET)
+    finest = min(_MAX_BUCKET_LEVEL, precision)
+    row, col = _cell_indices(phi, lam, 4**finest)
+    low, high = _MIN_BUCKET_LEVEL, finest
+    while low < high:
+        level = (low + high) // 2
+        shift = 2 * (finest - level)
+        _, counts = np.unique(
+            ((row >> shift) << (2 * level)) | (col >> shift), return_counts=True
+        )
+        if (counts * counts).sum() / counts.sum() <= target:
+            high = level
+        else:
+            low = level + 1
+    return low
+
+
+def _interleave(row, col, level: int):
+    """Z-order key of (row, col) cell indices on a 4**level grid."""
+    import numpy as np
+
+    key = np.zeros(row.shape, dtype=np.int64)
+    for bit in range(2 * level):
+        key |= ((row >> bit) & 1) << (2 * bit + 1)
+        key |= ((col >> bit) & 1) << (2 * bit)
+    return key
+
+
+def _query_ranges(z, level: int, limit: int):
+    """
+    Cuts sorted Z-order keys into ranges of at most `limit` keys, splitting by cell.
+
+    A range sharing only a short key prefix is split into the 16 child cells of
+    that prefix, so every range covers a compact area. Ranges of one bucket are
+    kept whole whatever their size.
+    """
+    import numpy as np
+
+    ranges = []
+    stack = [(0, z.shape[0], 0)]
+    digits = np.arange(1, 16, dtype=np.int64)
+    while stack:
+        start, stop, depth = stack.pop()
+        if stop - start <= limit or depth == level:
+            ranges.append((start, stop))
+            continue
+        shift = 4 * (level - depth - 1)
+        prefix = (int(z[start]) >> (shift + 4)) << 4
+        cuts = start + np.searchsorted(z[start:stop], (prefix | digits) << shift)
+        edges = [start] + cuts.tolist() + [stop]
+        stack.extend(
+            (low, high, depth + 1) for low, high in zip(edges[:-1], edges[1:]) if high > low
+        )
+    return ranges
+
+
+def _cell_indices(phi, lam, side: int):
+    """Global (row, col) of the level cell containing each point, rows from the north."""
+    import numpy as np
+
+    lat = np.degrees(phi)
+    lon = np.degrees(lam)
+    row = np.floor((BOUNDS.max_lat - lat) / (BOUNDS.max_lat - BOUNDS.min_lat) * side)
+    col = np.floor((lon - BOUNDS.min_lon) / (BOUNDS.max_lon - BOUNDS.min_lon) * side)
+    return (
+        np.clip(row, 0, side - 1).astype(np.int64),
+        np.clip(col, 0, side - 1).astype(np.int64),
+    )
+
+
+def _concat_ranges(begin, lengths):
+    """Concatenation of the integer ranges [begin, begin + length), without a Python loop."""
+    import numpy as np
+
+    total = int(lengths.sum())
+    if not total:
+        return np.zeros(0, dtype=np.int64)
+    offsets = np.repeat(begin - np.cumsum(lengths) + lengths, lengths)
+    return np.arange(total) + offsets
+
+
+class _BlockSearch(object):
+    """k-nearest search over candidates bucketed by cell, for one range of queries at a time."""
+
+    def __init__(self, c_phi, c_lambda, candidates, c_key, level: int, k: int):
+        import numpy as np
+
+        self.np = np
+        self.phi = c_phi[candidates]
+        self.lam = c_lambda[candidates]
+        self.candidates = candidates
+        self.c_key = c_key
+        self.level = level
+        self.side = 4**level
+        self.k = k
+        self.lat_size = (BOUNDS.max_lat - BOUNDS.min_lat) / self.side
+        self.lon_size = (BOUNDS.max_lon - BOUNDS.min_lon) / self.side
+
+    def _gather(self, row_lo: int, row_hi: int, col_lo: int, col_hi: int):
+        """Positions (in bucket order) of the candidates in a block of cells."""
+        np = self.np
+        rows = np.arange(row_lo, row_hi + 1) * self.side
+        begin = np.searchsorted(self.c_key, rows + col_lo)
+        end = np.searchsorted(self.c_key, rows + col_hi + 1)
+        return _concat_ranges(begin, end - begin)
+
+    def run(self, phi, lam, row_lo: int, row_hi: int, col_lo: int, col_hi: int):
+        """Searches outwards from a block of buckets until every point has its k nearest."""
+        np = self.np
+        k = self.k
+        n = phi.shape[0]
+        found = np.full((n, k), -1, dtype=np.int64)
+        best = np.full((n, k), np.inf)
+        pending = np.arange(n)
+        last = self.side - 1
+        radius = 0
+        while pending.size:
+            top, bottom = max(row_lo - radius, 0), min(row_hi + radius, last)
+            left, right = max(col_lo - radius, 0), min(col_hi + radius, last)
+            whole_grid = top == 0 and left == 0 and bottom == last and right == last
+            positions = self._gather(top, bottom, left, right)
+            if positions.size >= k or whole_grid:
+                done = np.zeros(pending.size, dtype=bool)
+                step = max(1, _MAX_PAIRS // max(positions.size, 1))
+                for offset in range(0, pending.size, step):
+                    end = offset + step
+                    chunk = pending[offset:end]
+                    dist, positions_k = self._rank(phi[chunk], lam[chunk], positions)
+                    width = dist.shape[1]  # Below k only once the whole grid is searched
+                    if whole_grid:
+                        chunk_done = np.ones(chunk.size, dtype=bool)
+                    else:
+                        bound = self._outside_bound(
+                            phi[chunk], lam[chunk], top, bottom, left, right
+                        )
+                        chunk_done = dist[:, -1] <= bound
+                    rows = chunk[chunk_done]
+                    found[rows, :width] = self.candidates[positions_k[chunk_done]]
+                    best[rows, :width] = dist[chunk_done]
+                    done[offset:end] = chunk_done
+                pending = pending[~done]
+            radius = max(1, 2 * radius)
+        return found, best
+
+    def _rank(self, phi, lam, positions):
+        """Up to k nearest of `positions` for each point, as sorted (distances, positions)."""
+        np = self.np
+        k = self.k
+        if positions.size > max(_PRUNE_SIZE, 16 * k):
+            return self._rank_pruned(phi, lam, positions)
+        dist = _haversine_array(
+            phi[:, None], lam[:, None], self.phi[positions], self.lam[positions]
+        )
+        if positions.size > k:
+            top = np.argpartition(dist, k - 1, axis=1)[:, :k]
+            dist = np.take_along_axis(dist, top, axis=1)
+            positions_k = positions[top]
+        else:
+            positions_k = np.broadcast_to(positions, dist.shape)
+        ranked = np.argsort(dist, axis=1, kind="stable")
+        return (
+            np.take_along_axis(dist, ranked, axis=1),
+            np.take_along_axis(positions_k, ranked, axis=1),
+        )
+
+    def _rank_pruned(self, phi, lam, positions):
+        """
+        `_rank` comparing each point only with candidates that can be among its k nearest.
+
+        The buckets of `positions` form a quadtree through their Z-order keys, which
+        is descended one level at a time. All candidates of a quadtree cell lie
+        within the cell's radius of its centre, so a point's k-th nearest distance is
+        at most the smallest "centre distance plus radius" over cells covering k
+        candidates, and cells whose "centre distance minus radius" exceeds that cap
+        are not descended for the point.
+        """
+        np = self.np
+        k = self.k
+        n = phi.shape[0]
+        keys = self.c_key[positions]
+        starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+        sizes = np.diff(np.append(starts, keys.size))
+        row, col = np.divmod(keys[starts], self.side)
+        z = _interleave(row, col, self.level)
+        by_z = np.argsort(z)
+        z, row, col, sizes_z = z[by_z], row[by_z], col[by_z], sizes[by_z]
+
+        # First bucket (in Z order) of every quadtree cell, from the bucket level up
+        firsts = []
+        for shift in range(2 * self.level + 1):
+            cells = z >> (2 * shift)
+            firsts.append(np.flatnonzero(np.concatenate(([True], cells[1:] != cells[:-1]))))
+            if firsts[-1].size <= _PRUNE_FANOUT:
+                break
+
+        cap = np.full(n, np.inf)
+        point = np.repeat(np.arange(n), firsts[-1].size)
+        cell = np.tile(np.arange(firsts[-1].size), n)
+        for shift in range(len(firsts) - 1, -1, -1):
+            first = firsts[shift]
+            if shift < len(firsts) - 1:
+                parent = firsts[shift + 1]
+                begin = np.searchsorted(first, parent[cell])
+                end = np.searchsorted(first, np.append(parent[1:], z.size)[cell])
+                point = np.repeat(point, end - begin)
+                cell = _concat_ranges(begin, end - begin)
+            keep = self._prune_cells(
+                phi[point],
+                lam[point],
+                point,
+                row[first[cell]] >> shift,
+                col[first[cell]] >> shift,
+                2**shift,
+                np.add.reduceat(sizes_z, first)[cell],
+                cap,
+            )
+            point, cell = point[keep], cell[keep]
+
+        # Every point keeps at least k candidates; rank its pairs and take the first k.
+        bucket = by_z[cell]
+        pair_position = positions[_concat_ranges(starts[bucket], sizes[bucket])]
+        point = np.repeat(point, sizes[bucket])
+        dist = _haversine_array(
+            phi[point], lam[point], self.phi[pair_position], self.lam[pair_position]
+        )
+        order = np.lexsort((dist, point))
+        rank = np.arange(order.size) - np.searchsorted(point, np.arange(n))[point]
+        take = order[rank < k]
+        return dist[take].reshape(n, k), pair_position[take].reshape(n, k)
+
+    def _prune_cells(self, phi, lam, point, row, col, scale: int, counts, cap):
+        """
+        Mask of the (point, quadtree cell) pairs that can hold one of the point's k nearest.
+
+        Pairs are sorted by point. `cap`, the bound on the k-th nearest distance of
+        each point, is lowered in place from the cells' upper bounds.
+        """
+        np = self.np
+        lat_size = self.lat_size * scale
+        lon_size = self.lon_size * scale
+        north = np.radians(BOUNDS.max_lat - row * lat_size)
+        south = north - math.radians(lat_size)
+        west = np.radians(BOUNDS.min_lon + col * lon_size)
+        c_phi = (north + south) / 2
+        c_lam = west + math.radians(lon_size) / 2
+        radius = np.maximum(
+            _haversine_array(c_phi, c_lam, north, west),
+            _haversine_array(c_phi, c_lam, south, west),
+        )
+        centre = _haversine_array(phi, lam, c_phi, c_lam)
+
+        # For each point, the first cell in order of upper bound at which k
+        # candidates are covered; lexsort keeps the pairs grouped by point.
+        upper = centre + radius
+        order = np.lexsort((upper, point))
+        covered = np.cumsum(counts[order])
+        segment = np.searchsorted(point, point)
+        covered -= covered[segment] - counts[order][segment]
+        hit = np.flatnonzero(covered >= self.k)
+        if not hit.size:
+            return np.ones(point.size, dtype=bool)
+        first_hit = hit[np.concatenate(([True], point[hit[1:]] != point[hit[:-1]]))]
+        capped = point[first_hit]
+        cap[capped] = np.minimum(cap[capped], upper[order][first_hit])
+        return centre - radius <= cap[point] + _BOUND_SLACK_KM
+
+    def _outside_bound(self, phi, lam, row_lo: int, row_hi: int, col_lo: int, col_hi: int):
+        """Lower bound on the distance from each point to any cell outside the block."""
+        np = self.np
+        inf = np.full(phi.shape, np.inf)
+        north = BOUNDS.max_lat - row_lo * self.lat_size
+        south = BOUNDS.max_lat - (row_hi + 1) * self.lat_size
+        west = BOUNDS.min_lon + col_lo * self.lon_size
+        east = BOUNDS.min_lon + (col_hi + 1) * self.lon_size
+        # Anything past a parallel is at least the latitude gap away; anything past
+        # a meridian is at least as far as that meridian's great circle.
+        to_north = np.radians(north) - phi if row_lo > 0 else inf
+        to_south = phi - np.radians(south) if row_hi < self.side - 1 else inf
+        cos_phi = np.cos(phi)
+        to_west = (
+            np.arcsin(np.minimum(1.0, cos_phi * np.sin(lam - np.radians(west))))
+            if col_lo > 0
+            else inf
+        )
+        to_east = (
+            np.arcsin(np.minimum(1.0, cos_phi * np.sin(np.radians(east) - lam)))
+            if col_hi < self.side - 1
+            else inf
+        )
+        return EARTH_RADIUS_KM * np.minimum(
+            np.minimum(to_north, to_south), np.minimum(to_west, to_east)
+        )
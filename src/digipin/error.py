@@ -34,3 +34,11 @@ class InvalidDigipinCharError(DigipinBaseError):
     def __init__(self, message="Invalid character found in DIGIPIN."):
         self.message = message
         super().__init__(self.message)
+
+
+class InvalidPrecisionError(DigipinBaseError):
+    """Exception raised when a DIGIPIN precision is not a level between 1 and 10."""
+
+    def __init__(self, message="Invalid DIGIPIN precision."):
+        self.message = message
+        super().__init__(self.message)
@@ -0,0 +1,158 @@
+"""
+Neighbour and k-ring lookups on the DIGIPIN grid.
+
+At level L the cells form a ``4**L x 4**L`` grid. A pin maps to a global
+(row, col) index in that grid, read digit by digit from the grid position of
+each character, with rows counted from the northern edge. Moving to a
+neighbour is plain integer arithmetic on those indices, so carries across
+parent cells come for free and no coordinates are decoded or re-encoded.
+Cells beyond the edge of `BOUNDS` are clipped.
+"""
+
+from typing import Iterable, List, Tuple
+
+from .core import _GRID_REVERSE_LOOKUP, DIGIPIN_GRID, DIGIPIN_LENGTH, format_digipin
+from .error import InvalidDigipinCharError, InvalidDigipinError
+
+# Offsets of the 8 neighbours, clockwise from north: N, NE, E, SE, S, SW, W, NW
+_NEIGHBOR_OFFSETS = ((-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1))
+
+
+def pin_to_grid(digi_pin: str) -> Tuple[int, int, int]:
+    """
+    Converts a full or partial DIGIPIN into its level and global grid indices.
+
+    Args:
+        digi_pin (str): A DIGIPIN or DIGIPIN prefix of 1 to 10 characters.
+
+    Returns:
+        Tuple[int, int, int]: `(level, row, col)`, where row and col lie in
+                              [0, 4**level) and count from the north-west corner.
+
+    Raises:
+        InvalidDigipinError: If the DIGIPIN string has an invalid length.
+        InvalidDigipinCharError: If the DIGIPIN string contains an unknown character.
+    """
+    pin_cleaned = digi_pin.replace("-", "")
+    if not (1 <= len(pin_cleaned) <= DIGIPIN_LENGTH):
+        raise InvalidDigipinError(
+            "Invalid DIGIPIN: Must be 1 to 10 alphanumeric characters (excluding hyphens)."
+        )
+
+    row = 0
+    col = 0
+    for char in pin_cleaned:
+        indices = _GRID_REVERSE_LOOKUP.get(char)
+        if indices is None:
+            raise InvalidDigipinCharError(f"Invalid character '{char}' found in DIGIPIN.")
+        row = (row << 2) | indices[0]
+        col = (col << 2) | indices[1]
+    return len(pin_cleaned), row, col
+
+
+def grid_to_pin(level: int, row: int, col: int) -> str:
+    """
+    Converts global grid indices at a level back into a hyphenated DIGIPIN.
+
+    Args:
+        level (int): Grid level, from 1 to 10.
+        row (int): Global row index in [0, 4**level), counted from the north.
+        col (int): Global column index in [0, 4**level), counted from the west.
+
+    Returns:
+        str: The DIGIPIN of the cell, with `level` characters.
+    """
+    chars = [
+        DIGIPIN_GRID[(row >> shift) & 3][(col >> shift) & 3]
+        for shift in range(2 * (level - 1), -2, -2)
+    ]
+    return format_digipin("".join(chars))
+
+
+def neighbors(digi_pin: str) -> List[str]:
+    """
+    Returns the up to 8 cells adjacent to a cell, at the same level.
+
+    Args:
+        digi_pin (str): A DIGIPIN or DIGIPIN prefix of 1 to 10 characters.
+
+    Returns:
+        List[str]: Neighbouring DIGIPINs clockwise from north (N, NE, E, SE, S, SW,
+                   W, NW). Neighbours beyond the edge of the grid are left out.
+
+    Raises:
+        InvalidDigipinError: If the DIGIPIN string has an invalid length.
+        InvalidDigipinCharError: If the DIGIPIN string contains an unknown character.
+    """
+    level, row, col = pin_to_grid(digi_pin)
+    size = 1 << (2 * level)
+    return [
+        grid_to_pin(level, row + d_row, col + d_col)
+        for d_row, d_col in _NEIGHBOR_OFFSETS
+        if 0 <= row + d_row < size and 0 <= col + d_col < size
+    ]
+
+
+def k_ring(digi_pin: str, k: int) -> List[str]:
+    """
+    Returns every cell within k steps (including diagonals) of a cell.
+
+    Args:
+        digi_pin (str): A DIGIPIN or DIGIPIN prefix of 1 to 10 characters.
+        k (int): Ring radius in cells. 0 returns just the cell itself.
+
+    Returns:
+        List[str]: The DIGIPINs of the `(2k + 1) x (2k + 1)` block centred on the
+                   cell, north to south and west to east, clipped at the grid edge.
+
+    Raises:
+        ValueError: If k is negative.
+        InvalidDigipinError: If the DIGIPIN string has an invalid length.
+        InvalidDigipinCharError: If the DIGIPIN string contains an unknown character.
+    """
+    if k < 0:
+        raise ValueError(f"k must be a non-negative integer, got {k}.")
+
+    level, row, col = pin_to_grid(digi_pin)
+    size = 1 << (2 * level)
+    rows = range(max(0, row - k), min(size, row + k + 1))
+    cols = range(max(0, col - k), min(size, col + k + 1))
+    return [grid_to_pin(level, r, c) for r in rows for c in cols]
+
+
+def neighbors_many(digi_pins: Iterable[str]) -> List[List[str]]:
+    """
+    Returns the neighbours of many cells at once.
+
+    Args:
+        digi_pins (Iterable[str]): DIGIPINs or DIGIPIN prefixes.
+
+    Returns:
+        List[List[str]]: The `neighbors` of each pin, in input order.
+
+    Raises:
+        InvalidDigipinError: If a DIGIPIN string has an invalid length.
+        InvalidDigipinCharError: If a DIGIPIN string contains an unknown character.
+    """
+    return [neighbors(digi_pin) for digi_pin in digi_pins]
+
+
+def k_ring_many(digi_pins: Iterable[str], k: int) -> List[List[str]]:
+    """
+    Returns the k-ring of many cells at once.
+
+    Args:
+        digi_pins (Iterable[str]): DIGIPINs or DIGIPIN prefixes.
+        k (int): Ring radius in cells.
+
+    Returns:
+        List[List[str]]: The `k_ring` of each pin, in input order.
+
+    Raises:
+        ValueError: If k is negative.
+        InvalidDigipinError: If a DIGIPIN string has an invalid length.
+        InvalidDigipinCharError: If a DIGIPIN string contains an unknown character.
+    """
+    if k < 0:
+        raise ValueError(f"k must be a non-negative integer, got {k}.")
+    return [k_ring(digi_pin, k) for digi_pin in digi_pins]
@@ -0,0 +1,241 @@
+"""
+Parent/child traversal of the DIGIPIN hierarchy and prefix roll-ups.
+
+A DIGIPIN of level L is the prefix of every pin inside its cell, so the parent
+of a cell is a shorter prefix and its children append one more character. In
+the 40-bit integer code (see `digipin.intcode`) each level is one nibble,
+first level most significant: the level-L ancestor of a code is simply
+``code >> 4 * (10 - L)``. `aggregate` relies on that to roll up counts with
+integer shifts, vectorized when given a NumPy array of codes.
+"""
+
+from itertools import product
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+from .core import DIGIPIN_GRID, DIGIPIN_LENGTH, _check_precision, format_digipin
+from .error import InvalidDigipinError
+from .intcode import _NIBBLE_TO_CHAR, CODE_BITS, MAX_CODE, _check_code, _pack, int_to_pin
+
+# Grid characters in child order: north to south, then west to east
+_CHILD_CHARS = [char for row in DIGIPIN_GRID for char in row]
+
+_Number = Union[int, float]
+
+# Up to this level, `aggregate` counts into a dense array of 16**level cells,
+# provided there are at most `_DENSE_FACTOR` cells per input code.
+_DENSE_LEVELS = 6
+_DENSE_FACTOR = 4
+
+
+def _clean(digi_pin: str) -> str:
+    """Strips hyphens and validates a full or partial DIGIPIN."""
+    pin_cleaned = digi_pin.replace("-", "")
+    if not (1 <= len(pin_cleaned) <= DIGIPIN_LENGTH):
+        raise InvalidDigipinError(
+            "Invalid DIGIPIN: Must be 1 to 10 alphanumeric characters (excluding hyphens)."
+        )
+    _pack(pin_cleaned)  # Raises InvalidDigipinCharError on an unknown character
+    return pin_cleaned
+
+
+def parent(digi_pin: str, level: Optional[int] = None) -> str:
+    """
+    Returns the ancestor of a cell at a coarser level.
+
+    Args:
+        digi_pin (str): A DIGIPIN or DIGIPIN prefix of 1 to 10 characters.
+        level (int, optional): Level of the ancestor, from 1 up to the level of
+                               `digi_pin`. Defaults to the immediate parent.
+
+    Returns:
+        str: The hyphenated DIGIPIN of the ancestor cell.
+
+    Raises:
+        ValueError: If level is finer than the cell itself, or the cell is at level 1
+                    and no level is given.
+        InvalidPrecisionError: If level is not between 1 and 10.
+        InvalidDigipinError: If the DIGIPIN string has an invalid length.
+        InvalidDigipinCharError: If the DIGIPIN string contains an unknown character.
+    """
+    pin_cleaned = _clean(digi_pin)
+    if level is None:
+        level = len(pin_cleaned) - 1
+        if level == 0:
+            raise ValueError(f"{digi_pin!r} is a level-1 cell and has no parent.")
+    _check_precision(level)
+    if level > len(pin_cleaned):
+        raise ValueError(
+            f"level must not exceed the level of {digi_pin!r} ({len(pin_cleaned)}), got {level}."
+        )
+    return format_digipin(pin_cleaned[:level])
+
+
+def children(digi_pin: str) -> List[str]:
+    """
+    Returns the 16 cells one level below a cell.
+
+    Args:
+        digi_pin (str): A DIGIPIN prefix of 1 to 9 characters.
+
+    Returns:
+        List[str]: Hyphenated child DIGIPINs, north to south and west to east.
+
+    Raises:
+        ValueError: If the cell is already at level 10.
+        InvalidDigipinError: If the DIGIPIN string has an invalid length.
+        InvalidDigipinCharError: If the DIGIPIN string contains an unknown character.
+    """
+    pin_cleaned = _clean(digi_pin)
+    if len(pin_cleaned) == DIGIPIN_LENGTH:
+        raise ValueError(f"{digi_pin!r} is a level-10 cell and has no children.")
+    return [format_digipin(pin_cleaned + char) for char in _CHILD_CHARS]
+
+
+def descendants(digi_pin: str, level: int) -> Iterator[str]:
+    """
+    Yields every cell inside a cell at a finer level.
+
+    Args:
+        digi_pin (str): A DIGIPIN or DIGIPIN prefix of 1 to 10 characters.
+        level (int): Level of the descendants, from the level of `digi_pin` to 10.
+                     A cell has ``16 ** (level - len(digi_pin))`` descendants.
+
+    Yields:
+        str: Hyphenated DIGIPINs in depth-first order, i.e. the order of
+             `children` applied recursively.
+
+    Raises:
+        ValueError: If level is coarser than the cell itself.
+        InvalidPrecisionError: If level is not between 1 and 10.
+        InvalidDigipinError: If the DIGIPIN string has an invalid length.
+        InvalidDigipinCharError: If the DIGIPIN string contains an unknown character.
+    """
+    pin_cleaned = _clean(digi_pin)
+    _check_precision(level)
+    if level < len(pin_cleaned):
+        raise ValueError(
+            f"level must not be below the level of {digi_pin!r} ({len(pin_cleaned)}), "
+            f"got {level}."
+        )
+    return _expand(pin_cleaned, level)
+
+
+def _expand(pin_cleaned: str, level: int) -> Iterator[str]:
+    """Yields the level-`level` descendants of a validated hyphen-free prefix."""
+    for suffix in product(_CHILD_CHARS, repeat=level - len(pin_cleaned)):
+        yield format_digipin(pin_cleaned + "".join(suffix))
+
+
+def aggregate(pins, counts: Optional[Iterable[_Number]], level: int) -> Dict[str, _Number]:
+    """
+    Rolls values up from fine cells to their ancestors at one level.
+
+    Args:
+        pins (Iterable[str | int] | numpy.ndarray): DIGIPINs (full or partial, at
+            least `level` characters) or 40-bit integer codes. A NumPy integer
+            array of codes is grouped fully vectorized.
+        counts (Iterable[int | float], optional): The value of each pin, summed per
+            ancestor. None counts every pin once.
+        level (int): Level of the ancestor cells, from 1 to 10.
+
+    Returns:
+        Dict[str, int | float]: Totals keyed by hyphenated ancestor DIGIPIN, in
+                                integer-code (Z-order) order.
+
+    Raises:
+        ValueError: If `pins` and `counts` have different lengths.
+        InvalidPrecisionError: If level is not between 1 and 10.
+        InvalidDigipinError: If a pin is shorter than `level` or longer than 10
+                             characters, or a code is not a 40-bit unsigned integer.
+        InvalidDigipinCharError: If one of the first `level` characters of a pin is
+                                 not a DIGIPIN character.
+    """
+    _check_precision(level)
+    shift = 4 * (DIGIPIN_LENGTH - level)
+
+    dtype = getattr(pins, "dtype", None)
+    if dtype is not None and dtype.kind in ("i", "u"):
+        return _aggregate_array(pins, counts, level, shift)
+
+    totals: Dict[int, _Number] = {}
+    if counts is None:
+        pairs = ((pin, 1) for pin in pins)
+    else:
+        counts = list(counts)
+        pins = list(pins)
+        if len(pins) != len(counts):
+            raise ValueError(
+                f"pins and counts must have the same length, got {len(pins)} and {len(counts)}."
+            )
+        pairs = zip(pins, counts)
+
+    for pin, count in pairs:
+        if isinstance(pin, str):
+            pin_cleaned = pin.replace("-", "")
+            if not (level <= len(pin_cleaned) <= DIGIPIN_LENGTH):
+                raise InvalidDigipinError(
+                    f"Invalid DIGIPIN: Must be {level} to 10 alphanumeric characters "
+                    "(excluding hyphens)."
+                )
+            key = _pack(pin_cleaned[:level])
+        else:
+            _check_code(pin)
+            key = pin >> shift
+        totals[key] = totals.get(key, 0) + count
+
+    return {_prefix_pin(key, level, shift): totals[key] for key in sorted(totals)}
+
+
+def _aggregate_array(codes, counts, level: int, shift: int) -> Dict[str, _Number]:
+    import numpy as np
+
+    codes = np.asarray(codes).ravel()
+    if codes.size and (codes.min() < 0 or codes.max() > MAX_CODE):
+        raise InvalidDigipinError(
+            f"Invalid DIGIPIN code: codes must be {CODE_BITS}-bit unsigned integers."
+        )
+    weights = None
+    if counts is not None:
+        weights = np.asarray(counts).ravel()
+        if weights.shape != codes.shape:
+            raise ValueError(
+                "pins and counts must have the same length, "
+                f"got {codes.shape[0]} and {weights.shape[0]}."
+            )
+
+    prefixes = (codes.astype(np.uint64) >> np.uint64(shift)).astype(np.intp)
+    cells = 16**level
+    if level <= _DENSE_LEVELS and cells <= _DENSE_FACTOR * codes.size:
+        # Few cells compared with the input: one counter per cell, no sort needed.
+        if weights is None:
+            totals = np.bincount(prefixes, minlength=cells)
+            keys = np.flatnonzero(totals)
+        else:
+            totals = np.bincount(prefixes, weights=weights, minlength=cells)
+            # Zero weights still make a cell present
+            present = np.zeros(cells, dtype=bool)
+            present[prefixes] = True
+            keys = np.flatnonzero(present)
+        totals = totals[keys]
+    elif weights is None:
+        keys, totals = np.unique(prefixes, return_counts=True)
+    else:
+        keys, inverse = np.unique(prefixes, return_inverse=True)
+        totals = np.bincount(inverse.ravel(), weights=weights, minlength=keys.shape[0])
+    if weights is not None and weights.dtype.kind in ("i", "u", "b"):
+        # bincount sums weights as float64; integer totals below 2**53 are exact.
+        totals = totals.astype(np.int64)
+    # Spell out every key at once: one column of code points per level, plus hyphens.
+    nibble_chars = np.array([ord(char) for char in _NIBBLE_TO_CHAR], dtype=np.uint32)
+    columns = [nibble_chars[(keys >> (4 * (level - 1 - index))) & 0xF] for index in range(level)]
+    for position in (6, 3):
+        if level > position:
+            columns.insert(position, np.full(keys.shape[0], ord("-"), dtype=np.uint32))
+    codepoints = np.ascontiguousarray(np.stack(columns, axis=1))
+    pins = codepoints.view(f"U{codepoints.shape[1]}").ravel()
+    return dict(zip(pins.tolist(), totals.tolist()))
+
+
+def _prefix_pin(key: int, level: int, shift: int) -> str:
+    """Hyphenated DIGIPIN of the level-`level` cell whose code prefix is `key`."""
+    return format_digipin(int_to_pin(key << shift).replace("-", "")[:level])
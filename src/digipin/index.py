@@ -0,0 +1,208 @@
+"""
+In-memory spatial index of records keyed by DIGIPIN.
+
+Records are stored in a list kept sorted by the 40-bit integer code of their
+pin (see `digipin.intcode`). Because the code is a Z-order key, every cell at
+every level owns one contiguous slice of that list: exact-cell and prefix
+lookups are two binary searches, and a radius search only scans the slices of
+the cells that cover the circle before filtering candidates by distance.
+"""
+
+import math
+from bisect import bisect_left, bisect_right
+from typing import Any, Iterable, Iterator, List, Tuple, Union
+
+from .core import BOUNDS, DIGIPIN_LENGTH
+from .distance import EARTH_RADIUS_KM, _haversine_km
+from .intcode import _to_code, code_bounds, int_to_pin, prefix_range
+from .model import DigipinBounds
+from .polyfill import polyfill
+
+_Key = Union[str, int]
+
+
+class DigipinIndex(object):
+    """
+    A sorted-array index of records keyed by full 10-character DIGIPINs.
+
+    Keys may be given either as DIGIPIN strings or as integer codes. Several
+    records can share a pin.
+    """
+
+    def __init__(self, items: Iterable[Tuple[_Key, Any]] = ()):
+        """
+        Initializes the index, optionally bulk loading `(pin, record)` pairs.
+
+        Args:
+            items (Iterable[Tuple[str | int, Any]]): Initial `(pin, record)` pairs.
+        """
+        self._codes: List[int] = []
+        self._records: List[Any] = []
+        self.bulk_load(items)
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __contains__(self, key: _Key) -> bool:
+        code = _to_code(key)
+        position = bisect_left(self._codes, code)
+        return position < len(self._codes) and self._codes[position] == code
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        """Iterates over `(pin, record)` pairs in code order."""
+        return self._slice(0, len(self._codes))
+
+    def bulk_load(self, items: Iterable[Tuple[_Key, Any]]) -> None:
+        """
+        Adds many `(pin, record)` pairs with a single sort.
+
+        Args:
+            items (Iterable[Tuple[str | int, Any]]): The pairs to add.
+
+        Raises:
+            InvalidDigipinError: If a pin has an invalid length or code.
+            InvalidDigipinCharError: If a pin contains an unknown character.
+        """
+        new_items = [(_to_code(key), record) for key, record in items]
+        if not new_items:
+            return
+        merged = list(zip(self._codes, self._records)) + new_items
+        merged.sort(key=lambda item: item[0])
+        self._codes = [code for code, _ in merged]
+        self._records = [record for _, record in merged]
+
+    def insert(self, key: _Key, record: Any) -> None:
+        """
+        Adds one record, keeping the index sorted.
+
+        Args:
+            key (str | int): The DIGIPIN or integer code of the record.
+            record (Any): The record to store.
+
+        Raises:
+            InvalidDigipinError: If a pin has an invalid length or code.
+            InvalidDigipinCharError: If a pin contains an unknown character.
+        """
+        code = _to_code(key)
+        position = bisect_right(self._codes, code)
+        self._codes.insert(position, code)
+        self._records.insert(position, record)
+
+    def remove(self, key: _Key, record: Any) -> None:
+        """
+        Removes the first record under `key` that compares equal to `record`.
+
+        Args:
+            key (str | int): The DIGIPIN or integer code of the record.
+            record (Any): The record to remove.
+
+        Raises:
+            KeyError: If no such record is stored under the pin.
+        """
+        code = _to_code(key)
+        low = bisect_left(self._codes, code)
+        high = bisect_right(self._codes, code, lo=low)
+        for position in range(low, high):
+            if self._records[position] == record:
+                del self._codes[position]
+                del self._records[position]
+                return
+        raise KeyError(f"Record {record!r} not found under {key!r}.")
+
+    def get(self, key: _Key) -> List[Any]:
+        """
+        Returns all records stored in one level-10 cell.
+
+        Args:
+            key (str | int): The DIGIPIN or integer code of the cell.
+
+        Returns:
+            List[Any]: The records, in insertion order.
+        """
+        code = _to_code(key)
+        low = bisect_left(self._codes, code)
+        high = bisect_right(self._codes, code, lo=low)
+        return self._records[low:high]
+
+    def prefix(self, digi_pin: str) -> Iterator[Tuple[str, Any]]:
+        """
+        Yields every record inside a cell of any level.
+
+        Args:
+            digi_pin (str): A DIGIPIN or DIGIPIN prefix of 1 to 10 characters.
+
+        Yields:
+            Tuple[str, Any]: `(pin, record)` pairs in code order.
+
+        Raises:
+            InvalidDigipinError: If the DIGIPIN string has an invalid length.
+            InvalidDigipinCharError: If the DIGIPIN string contains an unknown character.
+        """
+        low, high = prefix_range(digi_pin)
+        return self._slice(bisect_left(self._codes, low), bisect_left(self._codes, high))
+
+    def radius(self, lat: float, lon: float, radius_km: float) -> List[Tuple[str, Any, float]]:
+        """
+        Finds every record whose cell centre lies within `radius_km` of a point.
+
+        The circle's bounding box is covered with DIGIPIN cells (see
+        `digipin.polyfill.polyfill`); only records inside those cells are
+        decoded and checked with the haversine distance.
+
+        Args:
+            lat (float): Latitude of the centre in decimal degrees.
+            lon (float): Longitude of the centre in decimal degrees.
+            radius_km (float): Search radius in kilometres.
+
+        Returns:
+            List[Tuple[str, Any, float]]: `(pin, record, distance_km)` tuples, nearest first.
+
+        Raises:
+            ValueError: If radius_km is negative.
+        """
+        if radius_km < 0:
+            raise ValueError(f"radius_km must be non-negative, got {radius_km}.")
+
+        lat_span = math.degrees(radius_km / EARTH_RADIUS_KM)
+        cos_lat = max(math.cos(math.radians(min(abs(lat) + lat_span, 89.0))), 1e-6)
+        lon_span = lat_span / cos_lat
+        box = DigipinBounds(
+            min_lat=max(lat - lat_span, BOUNDS.min_lat),
+            max_lat=min(lat + lat_span, BOUNDS.max_lat),
+            min_lon=max(lon - lon_span, BOUNDS.min_lon),
+            max_lon=min(lon + lon_span, BOUNDS.max_lon),
+        )
+        if box.min_lat > box.max_lat or box.min_lon > box.max_lon:
+            return []
+
+        results = []
+        for cell in polyfill(box, _cover_level(lat_span), compact=True):
+            low, high = prefix_range(cell)
+            start = bisect_left(self._codes, low)
+            stop = bisect_left(self._codes, high, lo=start)
+            for position in range(start, stop):
+                code = self._codes[position]
+                bounds = code_bounds(code)
+                distance = _haversine_km(
+                    lat,
+                    lon,
+                    (bounds.min_lat + bounds.max_lat) / 2,
+                    (bounds.min_lon + bounds.max_lon) / 2,
+                )
+                if distance <= radius_km:
+                    results.append((int_to_pin(code), self._records[position], distance))
+        results.sort(key=lambda result: result[2])
+        return results
+
+    def _slice(self, start: int, stop: int) -> Iterator[Tuple[str, Any]]:
+        for position in range(start, stop):
+            yield int_to_pin(self._codes[position]), self._records[position]
+
+
+def _cover_level(span: float) -> int:
+    """Finest level whose cells are still at least `span` degrees tall (1 to 10)."""
+    size = BOUNDS.max_lat - BOUNDS.min_lat
+    level = 1
+    while level < DIGIPIN_LENGTH and size / 4 ** (level + 1) >= span:
+        level += 1
+    return level
@@ -0,0 +1,284 @@
+"""
+Integer-packed DIGIPIN representation.
+
+Every level of a DIGIPIN selects one row and one column of the 4x4 grid, each
+a 2-bit index. A full 10-level pin therefore fits in 40 bits. Levels are packed
+most significant first, and within a level the row and column bits are
+interleaved as ``row_hi col_hi row_lo col_lo``, so the integer is the Morton
+(Z-order) code of the cell's global row and column. Sorting codes sorts cells
+along the Z-curve, and all descendants of a cell occupy one contiguous range.
+"""
+
+import math
+import numbers
+from typing import Dict, Tuple, Union
+
+from .core import BOUNDS, DIGIPIN_GRID, _check_coordinates
+from .error import InvalidDigipinCharError, InvalidDigipinError
+from .model import Coordinates, DigipinBounds
+
+DIGIPIN_LEVELS = 10
+CODE_BITS = 4 * DIGIPIN_LEVELS
+MAX_CODE = (1 << CODE_BITS) - 1
+
+# Size of a level-10 cell in degrees. 36 / 4**10 is exact in binary floating point.
+_CELL_LAT_SIZE = (BOUNDS.max_lat - BOUNDS.min_lat) / 4**DIGIPIN_LEVELS
+_CELL_LON_SIZE = (BOUNDS.max_lon - BOUNDS.min_lon) / 4**DIGIPIN_LEVELS
+
+
+def _interleave_nibble(row_idx: int, col_idx: int) -> int:
+    """Interleaves 2-bit row and column indices as row_hi col_hi row_lo col_lo."""
+    return ((row_idx & 2) << 2) | ((col_idx & 2) << 1) | ((row_idx & 1) << 1) | (col_idx & 1)
+
+
+_CHAR_TO_NIBBLE: Dict[str, int] = {}
+_NIBBLE_TO_CHAR = [""] * 16
+for _r_idx, _row in enumerate(DIGIPIN_GRID):
+    for _c_idx, _char in enumerate(_row):
+        _nibble = _interleave_nibble(_r_idx, _c_idx)
+        _CHAR_TO_NIBBLE[_char] = _nibble
+        _NIBBLE_TO_CHAR[_nibble] = _char
+
+
+def _spread_bits(value: int) -> int:
+    """Spreads the low 20 bits of value so that bit i moves to bit 2i."""
+    value &= 0xFFFFF
+    value = (value | (value << 16)) & 0x0000FFFF0000FFFF
+    value = (value | (value << 8)) & 0x00FF00FF00FF00FF
+    value = (value | (value << 4)) & 0x0F0F0F0F0F0F0F0F
+    value = (value | (value << 2)) & 0x3333333333333333
+    value = (value | (value << 1)) & 0x5555555555555555
+    return value
+
+
+def _compact_bits(value: int) -> int:
+    """Inverse of `_spread_bits`: gathers every even bit into the low 20 bits."""
+    value &= 0x5555555555555555
+    value = (value | (value >> 1)) & 0x3333333333333333
+    value = (value | (value >> 2)) & 0x0F0F0F0F0F0F0F0F
+    value = (value | (value >> 4)) & 0x00FF00FF00FF00FF
+    value = (value | (value >> 8)) & 0x0000FFFF0000FFFF
+    value = (value | (value >> 16)) & 0x00000000FFFFFFFF
+    return value
+
+
+def interleave(row: int, col: int) -> int:
+    """
+    Packs global level-10 row and column indices into a DIGIPIN integer code.
+
+    Args:
+        row (int): Global row index in [0, 4**10), counted from the northern edge.
+        col (int): Global column index in [0, 4**10), counted from the western edge.
+
+    Returns:
+        int: The 40-bit Morton code of the cell.
+    """
+    return (_spread_bits(row) << 1) | _spread_bits(col)
+
+
+def deinterleave(code: int) -> Tuple[int, int]:
+    """
+    Splits a DIGIPIN integer code into its global level-10 row and column indices.
+
+    Args:
+        code (int): A 40-bit DIGIPIN integer code.
+
+    Returns:
+        Tuple[int, int]: The (row, col) indices, counted from the north-west corner.
+    """
+    return _compact_bits(code >> 1), _compact_bits(code)
+
+
+def _check_code(code: int) -> None:
+    if not (0 <= code <= MAX_CODE):
+        raise InvalidDigipinError(
+            f"Invalid DIGIPIN code: {code} is not a {CODE_BITS}-bit unsigned integer."
+        )
+
+
+def _to_code(key: Union[str, int]) -> int:
+    """Converts a pin or integer code (including NumPy integers) to a checked int code."""
+    if isinstance(key, numbers.Integral):
+        code = int(key)
+        _check_code(code)
+        return code
+    return pin_to_int(key)
+
+
+def _pack(pin_cleaned: str) -> int:
+    """Packs hyphen-free DIGIPIN characters into nibbles, first character most significant."""
+    code = 0
+    for char in pin_cleaned:
+        nibble = _CHAR_TO_NIBBLE.get(char)
+        if nibble is None:
+            raise InvalidDigipinCharError(f"Invalid character '{char}' found in DIGIPIN.")
+        code = (code << 4) | nibble
+    return code
+
+
+def pin_to_int(digi_pin: str) -> int:
+    """
+    Converts a DIGIPIN string into its integer code.
+
+    Args:
+        digi_pin (str): The 10-digit DIGIPIN, with or without hyphens.
+
+    Returns:
+        int: The 40-bit integer code.
+
+    Raises:
+        InvalidDigipinError: If the DIGIPIN string has an invalid length.
+        InvalidDigipinCharError: If the DIGIPIN string contains an unknown character.
+    """
+    pin_cleaned = digi_pin.replace("-", "")
+    if len(pin_cleaned) != DIGIPIN_LEVELS:
+        raise InvalidDigipinError(
+            "Invalid DIGIPIN: Must be 10 alphanumeric characters (excluding hyphens)."
+        )
+
+    return _pack(pin_cleaned)
+
+
+def prefix_range(digi_pin: str) -> Tuple[int, int]:
+    """
+    Returns the half-open range of integer codes covered by a full or partial DIGIPIN.
+
+    Every level-10 pin that starts with `digi_pin` has a code in `[low, high)`.
+
+    Args:
+        digi_pin (str): A DIGIPIN or DIGIPIN prefix of 1 to 10 characters.
+
+    Returns:
+        Tuple[int, int]: The `(low, high)` bounds of the range.
+
+    Raises:
+        InvalidDigipinError: If the DIGIPIN string has an invalid length.
+        InvalidDigipinCharError: If the DIGIPIN string contains an unknown character.
+    """
+    pin_cleaned = digi_pin.replace("-", "")
+    if not (1 <= len(pin_cleaned) <= DIGIPIN_LEVELS):
+        raise InvalidDigipinError(
+            "Invalid DIGIPIN: Must be 1 to 10 alphanumeric characters (excluding hyphens)."
+        )
+
+    code = _pack(pin_cleaned)
+    shift = 4 * (DIGIPIN_LEVELS - len(pin_cleaned))
+    return code << shift, (code + 1) << shift
+
+
+def int_to_pin(code: int) -> str:
+    """
+    Converts an integer code back into the hyphenated DIGIPIN string.
+
+    Args:
+        code (int): A 40-bit DIGIPIN integer code.
+
+    Returns:
+        str: The DIGIPIN in the "XXX-XXX-XXXX" form produced by `Digipin.get_digipin`.
+
+    Raises:
+        InvalidDigipinError: If the code is not a 40-bit unsigned integer.
+    """
+    _check_code(code)
+    chars = [_NIBBLE_TO_CHAR[(code >> shift) & 0xF] for shift in range(CODE_BITS - 4, -4, -4)]
+    return f"{''.join(chars[:3])}-{''.join(chars[3:6])}-{''.join(chars[6:])}"
+
+
+def encode_int(lat: float, lon: float) -> int:
+    """
+    Encodes latitude and longitude directly into a DIGIPIN integer code.
+
+    The grid subdivision uses the same floating point steps as
+    `Digipin.get_digipin`, so `int_to_pin(encode_int(lat, lon))` always equals
+    `get_digipin(lat, lon)`.
+
+    Args:
+        lat (float): Latitude in decimal degrees.
+        lon (float): Longitude in decimal degrees.
+
+    Returns:
+        int: The 40-bit integer code.
+
+    Raises:
+        LatitudeOutOfRangeError: If latitude is outside the defined bounds.
+        LongitudeOutOfRangeError: If longitude is outside the defined bounds.
+    """
+    _check_coordinates(lat, lon)
+
+    current_min_lat = BOUNDS.min_lat
+    current_max_lat = BOUNDS.max_lat
+    current_min_lon = BOUNDS.min_lon
+    current_max_lon = BOUNDS.max_lon
+
+    row = 0
+    col = 0
+    for _ in range(DIGIPIN_LEVELS):
+        lat_div = (current_max_lat - current_min_lat) / 4
+        lon_div = (current_max_lon - current_min_lon) / 4
+
+        row_idx = 3 - math.floor((lat - current_min_lat) / lat_div)
+        col_idx = math.floor((lon - current_min_lon) / lon_div)
+        row_idx = max(0, min(row_idx, 3))
+        col_idx = max(0, min(col_idx, 3))
+
+        row = (row << 2) | row_idx
+        col = (col << 2) | col_idx
+
+        new_max_lat = current_min_lat + lat_div * (4 - row_idx)
+        current_min_lat = current_min_lat + lat_div * (3 - row_idx)
+        current_max_lat = new_max_lat
+
+        current_min_lon = current_min_lon + lon_div * col_idx
+        current_max_lon = current_min_lon + lon_div
+
+    return interleave(row, col)
+
+
+def code_bounds(code: int) -> DigipinBounds:
+    """
+    Returns the bounding box of the level-10 cell identified by an integer code.
+
+    Cell edges are multiples of 36 / 4**10 degrees from the grid origin, which are
+    exact in binary floating point, so the result is identical to the bounds
+    reached by the level-by-level loop in `Digipin.get_lat_lng_from_digipin`.
+
+    Args:
+        code (int): A 40-bit DIGIPIN integer code.
+
+    Returns:
+        DigipinBounds: The bounds of the cell.
+
+    Raises:
+        InvalidDigipinError: If the code is not a 40-bit unsigned integer.
+    """
+    _check_code(code)
+    row, col = deinterleave(code)
+    max_lat = BOUNDS.max_lat - row * _CELL_LAT_SIZE
+    min_lon = BOUNDS.min_lon + col * _CELL_LON_SIZE
+    return DigipinBounds(
+        min_lat=max_lat - _CELL_LAT_SIZE,
+        max_lat=max_lat,
+        min_lon=min_lon,
+        max_lon=min_lon + _CELL_LON_SIZE,
+    )
+
+
+def decode_int(code: int) -> Coordinates:
+    """
+    Decodes a DIGIPIN integer code into its central latitude & longitude.
+
+    Args:
+        code (int): A 40-bit DIGIPIN integer code.
+
+    Returns:
+        Coordinates: The centre of the cell, rounded to 6 decimal places, equal to
+                     `get_lat_lng_from_digipin(int_to_pin(code))`.
+
+    Raises:
+        InvalidDigipinError: If the code is not a 40-bit unsigned integer.
+    """
+    _check_code(code)
+    row, col = deinterleave(code)
+    center_lat = BOUNDS.max_lat - (row + 0.5) * _CELL_LAT_SIZE
+    center_lon = BOUNDS.min_lon + (col + 0.5) * _CELL_LON_SIZE
+    return Coordinates(latitude=round(center_lat, 6), longitude=round(center_lon, 6))
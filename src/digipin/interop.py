@@ -0,0 +1,326 @@
+"""
+Zero-copy encoding and decoding over raw buffers and Apache Arrow arrays.
+
+Coordinates are read straight from the memory of any buffer-protocol object
+(NumPy arrays, `array.array("d")`, `memoryview`) or of an Arrow float64 array,
+without converting rows to Python floats. Arrow nulls are read from the
+validity bitmap and come back as nulls. Results are written to fixed-width
+NumPy bytes arrays (`S12` at full precision), `uint64` integer codes, or Arrow
+arrays assembled directly from buffers, so no per-row Python object is created
+anywhere.
+
+Requires NumPy; the Arrow functions also require ``pyarrow`` (install with
+``pip install digipin-python[arrow]``).
+"""
+
+from typing import Any, Optional, Tuple
+
+from .core import DIGIPIN_LENGTH, _check_precision
+from .intcode import _CHAR_TO_NIBBLE
+from .vectorized import (
+    _CHAR_POSITIONS,
+    DECODE_NULL,
+    DECODE_OK,
+    DecodedDigipins,
+    _decode_codepoints,
+    _encode_rows,
+    _to_codepoints,
+    np,
+)
+
+# Longest Arrow string row copied into the decode matrix; longer rows are
+# flagged as having an invalid length without being read.
+MAX_PIN_BYTES = 32
+
+# Largest data buffer addressable by the int32 offsets of an Arrow `string` array
+_MAX_STRING_BYTES = 2**31 - 1
+
+# Integer-code nibble of each ASCII grid character
+_NIBBLE_OF = np.zeros(128, dtype=np.uint64)
+for _char, _nibble in _CHAR_TO_NIBBLE.items():
+    _NIBBLE_OF[ord(_char)] = _nibble
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as exc:  # pragma: no cover - exercised only without pyarrow
+        raise ImportError(
+            "Arrow interop requires pyarrow. "
+            "Install it with `pip install digipin-python[arrow]`."
+        ) from exc
+    return pyarrow
+
+
+def _is_arrow(values: Any) -> bool:
+    return type(values).__module__.startswith("pyarrow")
+
+
+def _validity(array, pa) -> Optional["np.ndarray"]:
+    """Boolean validity of an Arrow array from its bitmap, or None without nulls."""
+    if array.null_count == 0:
+        return None
+    bitmap = np.frombuffer(array.buffers()[0], dtype=np.uint8)
+    bits = np.unpackbits(bitmap, bitorder="little")
+    start = array.offset
+    stop = start + len(array)
+    return bits[start:stop].astype(bool)
+
+
+def as_float64(values: Any) -> Tuple["np.ndarray", Optional["np.ndarray"]]:
+    """
+    Views coordinates as a 1-D float64 NumPy array, without copying when possible.
+
+    Args:
+        values (Any): A buffer-protocol object or NumPy array of float64, or a
+                      pyarrow float64 `Array` / `ChunkedArray`. Other numeric
+                      types are converted, which copies.
+
+    Returns:
+        Tuple[numpy.ndarray, Optional[numpy.ndarray]]: The values, and a boolean
+            validity mask for Arrow input with nulls (None otherwise). The values
+            of null slots are undefined.
+    """
+    if _is_arrow(values):
+        pa = _import_pyarrow()
+        if isinstance(values, pa.ChunkedArray):
+            values = values.combine_chunks()
+        if values.type != pa.float64():
+            values = values.cast(pa.float64())
+        data = np.frombuffer(values.buffers()[1], dtype=np.float64)
+        start = values.offset
+        stop = start + len(values)
+        return data[start:stop], _validity(values, pa)
+    return np.asarray(values, dtype=np.float64).ravel(), None
+
+
+def _encode(lats, lons, precision: int) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Code point matrix and validity of every row; nulls and bad rows are zeroed."""
+    _check_precision(precision)
+    lat, lat_valid = as_float64(lats)
+    lon, lon_valid = as_float64(lons)
+    if lat.shape != lon.shape:
+        raise ValueError(
+            "Latitude and longitude arrays must have the same length, "
+            f"got {lat.shape[0]} and {lon.shape[0]}."
+        )
+    codepoints, invalid = _encode_rows(lat, lon, precision)
+    for valid in (lat_valid, lon_valid):
+        if valid is not None:
+            invalid |= ~valid
+    codepoints[invalid] = 0
+    return codepoints, ~invalid
+
+
+def encode_to_bytes(
+    lats, lons, precision: int = DIGIPIN_LENGTH
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Encodes coordinate buffers into a fixed-width bytes array.
+
+    Args:
+        lats (Any): Latitudes, in any form accepted by `as_float64`.
+        lons (Any): Longitudes, with the same length as `lats`.
+        precision (int): Number of grid levels to encode, from 1 to 10.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The hyphenated ASCII DIGIPINs as an
+            `S12` array (narrower below precision 7), with b"" for null or
+            out-of-range rows, and the boolean validity of each row.
+
+    Raises:
+        ValueError: If the inputs have different lengths.
+        InvalidPrecisionError: If precision is not between 1 and 10.
+    """
+    codepoints, valid = _encode(lats, lons, precision)
+    width = codepoints.shape[1]
+    return codepoints.astype(np.uint8).view(f"S{width}").ravel(), valid
+
+
+def encode_to_codes(lats, lons) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Encodes coordinate buffers into 40-bit integer codes (see `digipin.intcode`).
+
+    Args:
+        lats (Any): Latitudes, in any form accepted by `as_float64`.
+        lons (Any): Longitudes, with the same length as `lats`.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: A `uint64` array of codes (0 for null
+            or out-of-range rows) and the boolean validity of each row.
+
+    Raises:
+        ValueError: If the inputs have different lengths.
+    """
+    codepoints, valid = _encode(lats, lons, DIGIPIN_LENGTH)
+    codes = np.zeros(codepoints.shape[0], dtype=np.uint64)
+    for level, position in enumerate(_CHAR_POSITIONS):
+        codes |= _NIBBLE_OF[codepoints[:, position]] << np.uint64(
+            4 * (DIGIPIN_LENGTH - 1 - level)
+        )
+    codes[~valid] = 0
+    return codes, valid
+
+
+def encode_to_arrow(lats, lons, precision: int = DIGIPIN_LENGTH, codes: bool = False):
+    """
+    Encodes coordinate buffers into an Arrow array built directly from buffers.
+
+    Args:
+        lats (Any): Latitudes, in any form accepted by `as_float64`.
+        lons (Any): Longitudes, with the same length as `lats`.
+        precision (int): Number of grid levels to encode, from 1 to 10.
+        codes (bool): If True, return 40-bit integer codes as `uint64` instead of
+                      strings. Requires precision 10.
+
+    Returns:
+        pyarrow.Array: A `string` (or `uint64`) array with nulls for null or
+                       out-of-range input rows. Pins totalling more than 2 GiB,
+                       beyond the reach of 32-bit offsets, give a `large_string`
+                       array instead.
+
+    Raises:
+        ValueError: If the inputs have different lengths, or codes are requested
+                    below precision 10.
+        InvalidPrecisionError: If precision is not between 1 and 10.
+    """
+    pa = _import_pyarrow()
+    if codes:
+        if precision != DIGIPIN_LENGTH:
+            raise ValueError("Integer codes are only defined at precision 10.")
+        values, valid = encode_to_codes(lats, lons)
+        return pa.Array.from_buffers(
+            pa.uint64(), len(values), [_bitmap(valid, pa), pa.py_buffer(values)]
+        )
+
+    pins, valid = encode_to_bytes(lats, lons, precision)
+    width = pins.dtype.itemsize
+    data = pins[valid].view(np.uint8)
+    large = data.size > _MAX_STRING_BYTES
+    offsets = np.zeros(len(pins) + 1, dtype=np.int64 if large else np.int32)
+    np.cumsum(valid * width, out=offsets[1:])
+    return pa.Array.from_buffers(
+        pa.large_string() if large else pa.string(),
+        len(pins),
+        [_bitmap(valid, pa), pa.py_buffer(offsets), pa.py_buffer(data)],
+    )
+
+
+def _bitmap(valid: "np.ndarray", pa):
+    """Arrow validity buffer for a boolean mask, or None when every row is valid."""
+    if valid.all():
+        return None
+    return pa.py_buffer(np.packbits(valid, bitorder="little"))
+
+
+def decode_buffer(
+    pins, precision: int = DIGIPIN_LENGTH, return_bounds: bool = False
+) -> DecodedDigipins:
+    """
+    Decodes DIGIPINs held in a bytes array or an Arrow string array.
+
+    Args:
+        pins (Any): A NumPy `S`/`U` array, or a pyarrow `string`/`binary`
+                    (`large_*` included) `Array` / `ChunkedArray`. Arrow rows are
+                    read from the data buffer in place; uniform-length columns
+                    are not copied at all.
+        precision (int): Expected number of characters (excluding hyphens), from 1 to 10.
+        return_bounds (bool): If True, also return the bounding box of every cell.
+
+    Returns:
+        DecodedDigipins: As from `digipin.vectorized.decode_many`, with
+                         `DECODE_NULL` for null Arrow rows.
+
+    Raises:
+        InvalidPrecisionError: If precision is not between 1 and 10.
+    """
+    _check_precision(precision)
+    if not _is_arrow(pins):
+        arr = np.asarray(pins)
+        if arr.dtype.kind not in ("U", "S"):
+            arr = arr.astype(str)
+        return _decode_codepoints(
+            _to_codepoints(arr.ravel()), arr.shape, return_bounds, precision
+        )
+
+    pa = _import_pyarrow()
+    if isinstance(pins, pa.ChunkedArray):
+        pins = pins.combine_chunks()
+    matrix, valid = _arrow_matrix(pins, pa)
+    decoded = _decode_codepoints(matrix, (len(pins),), return_bounds, precision)
+    if valid is not None:
+        decoded.errors[~valid] = DECODE_NULL
+        for values in (
+            decoded.latitude,
+            decoded.longitude,
+            decoded.min_lat,
+            decoded.max_lat,
+            decoded.min_lon,
+            decoded.max_lon,
+        ):
+            if values is not None:
+                values[~valid] = np.nan
+    return decoded
+
+
+def _arrow_matrix(pins, pa) -> Tuple["np.ndarray", Optional["np.ndarray"]]:
+    """
+    Lays the rows of an Arrow string/binary array out as a NUL-padded uint8 matrix.
+
+    Returns the matrix and the validity mask (None without nulls). Rows longer
+    than `MAX_PIN_BYTES` are replaced by a row that fails the length check.
+    """
+    large = pa.types.is_large_string(pins.type) or pa.types.is_large_binary(pins.type)
+    if not (large or pa.types.is_string(pins.type) or pa.types.is_binary(pins.type)):
+        raise TypeError(f"Expected an Arrow string or binary array, got {pins.type}.")
+    n = len(pins)
+    _, offset_buffer, data_buffer = pins.buffers()
+    offsets = np.frombuffer(offset_buffer, dtype=np.int64 if large else np.int32)
+    first = pins.offset
+    offsets = offsets[first:][: n + 1]
+    data = np.frombuffer(data_buffer, dtype=np.uint8) if data_buffer else np.zeros(0, np.uint8)
+    starts = offsets[:-1]
+    lengths = np.diff(offsets)
+    valid = _validity(pins, pa)
+
+    width = int(min(lengths.max(initial=0), MAX_PIN_BYTES))
+    if n and width and (lengths == width).all():
+        # Uniform rows are contiguous: view the data buffer as the matrix directly.
+        begin = starts[0]
+        end = begin + n * width
+        return data[begin:end].reshape(n, width), valid
+
+    width = max(width, 1)
+    columns = np.arange(width)
+    present = columns[None, :] < lengths[:, None]
+    index = np.minimum(starts[:, None] + columns[None, :], max(len(data) - 1, 0))
+    matrix = np.where(present, data[index] if len(data) else 0, 0).astype(np.uint8)
+    # Fill overlong rows with one more character than any precision allows.
+    matrix[lengths > MAX_PIN_BYTES] = ord("F")
+    return matrix, valid
+
+
+def decode_to_arrow(pins, precision: int = DIGIPIN_LENGTH):
+    """
+    Decodes DIGIPINs into Arrow latitude and longitude arrays.
+
+    Args:
+        pins (Any): Anything accepted by `decode_buffer`.
+        precision (int): Expected number of characters (excluding hyphens), from 1 to 10.
+
+    Returns:
+        Tuple[pyarrow.Array, pyarrow.Array]: float64 latitude and longitude arrays,
+            null wherever the pin was null or invalid. They share memory with the
+            decoded NumPy arrays.
+
+    Raises:
+        InvalidPrecisionError: If precision is not between 1 and 10.
+    """
+    pa = _import_pyarrow()
+    decoded = decode_buffer(pins, precision)
+    valid = decoded.errors.ravel() == DECODE_OK
+    bitmap = _bitmap(valid, pa)
+    return tuple(
+        pa.Array.from_buffers(pa.float64(), len(valid), [bitmap, pa.py_buffer(values.ravel())])
+        for values in (decoded.latitude, decoded.longitude)
+    )
@@ -0,0 +1,389 @@
+"""
+Memory-mapped on-disk lookup files of records keyed by DIGIPIN.
+
+A lookup file holds opaque byte payloads (serialized addresses, POIs, ...)
+sorted by the 40-bit integer code of their cell (see `digipin.intcode`). The
+layout is four little-endian sections:
+
+    header    magic, format version, record count, payload size (32 bytes)
+    codes     uint64[count], sorted
+    offsets   uint64[count + 1], start of each payload in the payload section
+    payload   the payload bytes, in code order
+
+`LookupFileWriter` builds a file in one streaming pass over the input, keeping
+only sorted runs of fixed-size entries in temporary files, never the records.
+`LookupFile` maps the file read-only and answers exact-cell and prefix queries
+with binary searches over the mapped code section, so opening a file costs a
+few system calls and every process reading it shares the OS page cache.
+"""
+
+import heapq
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left, bisect_right
+from contextlib import ExitStack
+from typing import IO, Iterable, Iterator, List, Tuple, Union
+
+from .intcode import _to_code, encode_int, int_to_pin, prefix_range
+
+MAGIC = b"DGPNLKUP"
+FORMAT_VERSION = 1
+
+# magic, version, reserved, record count, payload size
+_HEADER = struct.Struct("<8sIIQQ")
+# One pending record: code, offset and length of its payload in the spill file
+_ENTRY = struct.Struct("<QQQ")
+
+_Key = Union[str, int]
+_Payload = Union[bytes, bytearray, memoryview, str]
+
+
+def _to_bytes(payload: _Payload) -> bytes:
+    return payload.encode("utf-8") if isinstance(payload, str) else bytes(payload)
+
+
+class LookupFileWriter(object):
+    """
+    Streams `(pin, payload)` records into a lookup file.
+
+    Use it as a context manager: the file is written when the block exits
+    normally and is not created at all if the block raises. The target path is
+    replaced atomically, so readers never see a partial file.
+    """
+
+    def __init__(self, path: str, run_size: int = 1_000_000):
+        """
+        Prepares a writer; nothing is written to `path` until `close`.
+
+        Args:
+            path (str): Destination of the lookup file.
+            run_size (int): Records sorted in memory at a time. Larger runs use
+                            more memory (about 100 bytes per record) but fewer
+                            temporary files.
+
+        Raises:
+            ValueError: If run_size is not positive.
+        """
+        if run_size < 1:
+            raise ValueError(f"run_size must be a positive integer, got {run_size}.")
+        self.path = path
+        self._run_size = run_size
+        self._dir = os.path.dirname(os.path.abspath(path))
+        self._payloads: IO[bytes] = tempfile.TemporaryFile(dir=self._dir)
+        self._payload_size = 0
+        self._pending: List[Tuple[int, int, int]] = []
+        self._runs: List[IO[bytes]] = []
+        self._count = 0
+        self._closed = False
+
+    def __enter__(self) -> "LookupFileWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def __len__(self) -> int:
+        """Number of records added so far."""
+        return self._count
+
+    def add(self, key: _Key, payload: _Payload) -> None:
+        """
+        Adds one record.
+
+        Args:
+            key (str | int): The full DIGIPIN or integer code of the record's cell.
+            payload (bytes | str): The record; strings are stored as UTF-8.
+
+        Raises:
+            ValueError: If the writer is already closed.
+            InvalidDigipinError: If the pin has an invalid length or code.
+            InvalidDigipinCharError: If the pin contains an unknown character.
+        """
+        self._check_open()
+        code = _to_code(key)
+        data = _to_bytes(payload)
+        self._payloads.write(data)
+        self._pending.append((code, self._payload_size, len(data)))
+        self._payload_size += len(data)
+        self._count += 1
+        if len(self._pending) >= self._run_size:
+            self._spill()
+
+    def add_point(self, lat: float, lon: float, payload: _Payload) -> None:
+        """
+        Encodes a coordinate pair and adds its record under the resulting cell.
+
+        Raises:
+            LatitudeOutOfRangeError: If latitude is outside the defined bounds.
+            LongitudeOutOfRangeError: If longitude is outside the defined bounds.
+        """
+        self.add(encode_int(lat, lon), payload)
+
+    def close(self) -> None:
+        """Sorts the records, writes the lookup file and removes temporary files."""
+        if self._closed:
+            return
+        try:
+            self._write()
+        finally:
+            self.abort()
+
+    def abort(self) -> None:
+        """Discards every added record without writing the lookup file."""
+        self._closed = True
+        self._pending = []
+        for handle in self._runs + [self._payloads]:
+            handle.close()
+        self._runs = []
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise ValueError("Cannot add records to a closed LookupFileWriter.")
+
+    def _spill(self) -> None:
+        """Writes the pending entries to a new sorted run file."""
+        self._pending.sort()
+        run = tempfile.TemporaryFile(dir=self._dir)
+        run.write(b"".join(_ENTRY.pack(*entry) for entry in self._pending))
+        run.seek(0)
+        self._runs.append(run)
+        self._pending = []
+
+    def _sorted_entries(self) -> Iterator[Tuple[int, int, int]]:
+        self._pending.sort()
+        if not self._runs:
+            return iter(self._pending)
+        return heapq.merge(*(_read_run(run) for run in self._runs), self._pending)
+
+    def _write(self) -> None:
+        self._payloads.flush()
+        source = (
+            mmap.mmap(self._payloads.fileno(), 0, access=mmap.ACCESS_READ)
+            if self._payload_size
+            else b""
+        )
+        codes_at = _HEADER.size
+        offsets_at = codes_at + 8 * self._count
+        payload_at = offsets_at + 8 * (self._count + 1)
+
+        handle, temp_path = tempfile.mkstemp(dir=self._dir, suffix=".tmp")
+        try:
+            with open(handle, "wb") as out:
+                out.write(_HEADER.pack(MAGIC, FORMAT_VERSION, 0, self._count, self._payload_size))
+                out.truncate(payload_at + self._payload_size)
+            # Each section is written sequentially through its own handle.
+            with ExitStack() as stack:
+                codes_out, offsets_out, payload_out = (
+                    stack.enter_context(open(temp_path, "r+b")) for _ in range(3)
+                )
+                codes_out.seek(codes_at)
+                offsets_out.seek(offsets_at)
+                payload_out.seek(payload_at)
+                codes = array("Q")
+                offsets = array("Q")
+                position = 0
+                for code, start, length in self._sorted_entries():
+                    stop = start + length
+                    codes.append(code)
+                    offsets.append(position)
+                    payload_out.write(source[start:stop])
+                    position += length
+                    if len(codes) >= 65536:
+                        _write_u64(codes_out, codes)
+                        _write_u64(offsets_out, offsets)
+                offsets.append(position)
+                _write_u64(codes_out, codes)
+                _write_u64(offsets_out, offsets)
+            os.chmod(temp_path, 0o644)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        finally:
+            if isinstance(source, mmap.mmap):
+                source.close()
+
+
+def _read_run(run: IO[bytes]) -> Iterator[Tuple[int, int, int]]:
+    while True:
+        chunk = run.read(_ENTRY.size * 4096)
+        if not chunk:
+            return
+        yield from _ENTRY.iter_unpack(chunk)
+
+
+def _write_u64(out: IO[bytes], values: "array") -> None:
+    """Writes and empties a uint64 array, as little-endian."""
+    if sys.byteorder != "little":
+        values.byteswap()
+    out.write(values.tobytes())
+    del values[:]
+
+
+def write_lookup_file(path: str, items: Iterable[Tuple[_Key, _Payload]], **kwargs) -> int:
+    """
+    Writes `(pin, payload)` records to a lookup file.
+
+    Args:
+        path (str): Destination of the lookup file.
+        items (Iterable[Tuple[str | int, bytes | str]]): The records, in any order.
+        **kwargs: Passed on to `LookupFileWriter`.
+
+    Returns:
+        int: The number of records written.
+    """
+    with LookupFileWriter(path, **kwargs) as writer:
+        for key, payload in items:
+            writer.add(key, payload)
+    return len(writer)
+
+
+class LookupFile(object):
+    """
+    A read-only, memory-mapped view of a lookup file.
+
+    Several records can share a pin; they are returned in the order they were
+    added. Instances may be shared between threads, and each process opening
+    the same file shares its pages with the others.
+    """
+
+    def __init__(self, path: str):
+        """
+        Maps a lookup file.
+
+        Args:
+            path (str): Path of a file written by `LookupFileWriter`.
+
+        Raises:
+            ValueError: If the file is not a lookup file or has an unsupported version.
+        """
+        self.path = path
+        with open(path, "rb") as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._map_sections()
+        except BaseException:
+            self._mmap.close()
+            raise
+
+    def _map_sections(self) -> None:
+        if len(self._mmap) < _HEADER.size:
+            raise ValueError(f"{self.path!r} is not a DIGIPIN lookup file.")
+        magic, version, _, count, payload_size = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path!r} is not a DIGIPIN lookup file.")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported lookup file version {version} in {self.path!r}.")
+        codes_at = _HEADER.size
+        offsets_at = codes_at + 8 * count
+        payload_at = offsets_at + 8 * (count + 1)
+        if len(self._mmap) != payload_at + payload_size:
+            raise ValueError(f"Lookup file {self.path!r} is truncated or corrupt.")
+
+        self._count = count
+        self._payload_at = payload_at
+        self._view = memoryview(self._mmap)
+        self._codes = _u64(self._view[codes_at:offsets_at])
+        self._offsets = _u64(self._view[offsets_at:payload_at])
+
+    def __enter__(self) -> "LookupFile":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, key: _Key) -> bool:
+        code = _to_code(key)
+        position = bisect_left(self._codes, code)
+        return position < self._count and self._codes[position] == code
+
+    def __iter__(self) -> Iterator[Tuple[str, bytes]]:
+        """Iterates over `(pin, payload)` pairs in code order."""
+        return self._slice(0, self._count)
+
+    def close(self) -> None:
+        """Unmaps the file. Further queries raise ValueError."""
+        for view in (self._codes, self._offsets, self._view):
+            if isinstance(view, memoryview):
+                view.release()
+        self._mmap.close()
+
+    def get(self, key: _Key) -> List[bytes]:
+        """
+        Returns the payloads of every record in one level-10 cell.
+
+        Args:
+            key (str | int): The DIGIPIN or integer code of the cell.
+
+        Returns:
+            List[bytes]: The payloads, in the order they were added.
+
+        Raises:
+            InvalidDigipinError: If the pin has an invalid length or code.
+            InvalidDigipinCharError: If the pin contains an unknown character.
+        """
+        code = _to_code(key)
+        low = bisect_left(self._codes, code)
+        high = bisect_right(self._codes, code, lo=low)
+        return [self._payload(position) for position in range(low, high)]
+
+    def count(self, digi_pin: str) -> int:
+        """
+        Counts the records inside a cell of any level without reading their payloads.
+
+        Args:
+            digi_pin (str): A DIGIPIN or DIGIPIN prefix of 1 to 10 characters.
+
+        Returns:
+            int: The number of records.
+        """
+        return len(range(*self._prefix_positions(digi_pin)))
+
+    def prefix(self, digi_pin: str) -> Iterator[Tuple[str, bytes]]:
+        """
+        Yields every record inside a cell of any level.
+
+        Args:
+            digi_pin (str): A DIGIPIN or DIGIPIN prefix of 1 to 10 characters.
+
+        Yields:
+            Tuple[str, bytes]: `(pin, payload)` pairs in code order.
+
+        Raises:
+            InvalidDigipinError: If the DIGIPIN string has an invalid length.
+            InvalidDigipinCharError: If the DIGIPIN string contains an unknown character.
+        """
+        return self._slice(*self._prefix_positions(digi_pin))
+
+    def _prefix_positions(self, digi_pin: str) -> Tuple[int, int]:
+        low, high = prefix_range(digi_pin)
+        start = bisect_left(self._codes, low)
+        return start, bisect_left(self._codes, high, lo=start)
+
+    def _payload(self, position: int) -> bytes:
+        start = self._payload_at + self._offsets[position]
+        stop = self._payload_at + self._offsets[position + 1]
+        return self._mmap[start:stop]
+
+    def _slice(self, start: int, stop: int) -> Iterator[Tuple[str, bytes]]:
+        for position in range(start, stop):
+            yield int_to_pin(self._codes[position]), self._payload(position)
+
+
+def _u64(view: memoryview):
+    """A uint64 sequence over little-endian bytes; zero-copy on little-endian hosts."""
+    if sys.byteorder == "little":
+        return view.cast("Q")
+    values = array("Q", view.tobytes())
+    values.byteswap()
+    return values
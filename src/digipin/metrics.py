@@ -0,0 +1,507 @@
+"""
+Opt-in instrumentation of `Digipin` calls: counters, latency histograms and exporters.
+
+Pass a `Metrics` registry to `Digipin(metrics=...)` to record, per operation,
+the number of calls, the exceptions raised (by class name), a latency
+histogram of one call in `sample_every`, and for the batch methods the number
+of rows and a batch-size histogram. The instrumented methods are installed on
+that one instance only, so a `Digipin` created without metrics runs exactly
+the uninstrumented code.
+
+Snapshots are handed to exporters: `InMemoryExporter` keeps them for tests or
+ad-hoc inspection, and `PrometheusTextExporter` renders the Prometheus text
+exposition format for a scrape endpoint or a node-exporter textfile.
+"""
+
+import functools
+import threading
+import time
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, TextIO, Tuple
+
+# Latency bucket upper bounds, in seconds
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    1e-6,
+    2.5e-6,
+    5e-6,
+    1e-5,
+    2.5e-5,
+    5e-5,
+    1e-4,
+    1e-3,
+    1e-2,
+    0.1,
+    1.0,
+)
+
+# Batch-size bucket upper bounds, in rows
+DEFAULT_BATCH_BUCKETS: Tuple[float, ...] = (1, 10, 100, 1_000, 10_000, 100_000, 1_000_000)
+
+# Operation name of each instrumented `Digipin` method
+_SCALAR_OPERATIONS = {
+    "get_digipin": "encode",
+    "get_lat_lng_from_digipin": "decode",
+    "get_lat_lng_tuple": "decode",
+}
+_BATCH_OPERATIONS = {
+    "encode_many": "encode_many",
+    "parallel_encode": "parallel_encode",
+    "decode_many": "decode_many",
+}
+
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    """
+    A dataclass holding a snapshot of a histogram.
+
+    Attributes:
+        buckets (Tuple[float, ...]): Upper bounds of the finite buckets, ascending.
+        counts (Tuple[int, ...]): Observations per bucket (not cumulative), with
+                                  one extra overflow bucket at the end.
+        count (int): Total number of observations.
+        sum (float): Sum of all observed values.
+    """
+
+    buckets: Tuple[float, ...]
+    counts: Tuple[int, ...]
+    count: int
+    sum: float
+
+    @property
+    def mean(self) -> float:
+        """Average observed value, 0.0 before the first observation."""
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimates a quantile as the upper bound of the bucket that contains it.
+
+        Args:
+            q (float): The quantile, between 0 and 1 (e.g. 0.99).
+
+        Returns:
+            float: A bucket bound, `inf` if the quantile falls in the overflow
+                   bucket, or 0.0 before the first observation.
+        """
+        if not (0 <= q <= 1):
+            raise ValueError(f"q must be between 0 and 1, got {q}.")
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            if cumulative >= target:
+                return bound
+        return float("inf")
+
+
+@dataclass(frozen=True)
+class OperationStats:
+    """
+    A dataclass holding a snapshot of one operation's counters.
+
+    Attributes:
+        calls (int): Number of calls (one per batch for batch operations).
+        items (int): Number of rows processed; equal to `calls` for scalar operations.
+        errors (Dict[str, int]): Errors by exception class name. For batch methods
+                                 that report bad rows instead of raising, each such
+                                 row counts under the exception the scalar method
+                                 would have raised.
+        latency (HistogramSnapshot): Latency of sampled calls, in seconds.
+        batch_sizes (HistogramSnapshot, optional): Rows per batch, for batch operations.
+    """
+
+    calls: int
+    items: int
+    errors: Dict[str, int]
+    latency: HistogramSnapshot
+    batch_sizes: Optional[HistogramSnapshot] = None
+
+
+class _Histogram(object):
+    """Fixed-bucket histogram; callers hold the registry lock."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.clear()
+
+    def clear(self) -> None:
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> HistogramSnapshot:
+        return HistogramSnapshot(
+            buckets=self.buckets, counts=tuple(self.counts), count=self.count, sum=self.sum
+        )
+
+
+class _Operation(object):
+    """Mutable counters of one operation; callers hold the registry lock."""
+
+    def __init__(
+        self, latency_buckets: Sequence[float], batch_buckets: Optional[Sequence[float]]
+    ):
+        self.latency = _Histogram(latency_buckets)
+        self.batch_sizes = _Histogram(batch_buckets) if batch_buckets is not None else None
+        self.clear()
+
+    def clear(self) -> None:
+        self.calls = 0
+        self.items = 0  # Batch operations only; a scalar call is one item
+        self.errors: Dict[str, int] = {}
+        self.latency.clear()
+        if self.batch_sizes is not None:
+            self.batch_sizes.clear()
+
+    def add_errors(self, name: str, count: int = 1) -> None:
+        self.errors[name] = self.errors.get(name, 0) + count
+
+    def snapshot(self) -> OperationStats:
+        return OperationStats(
+            calls=self.calls,
+            items=self.items if self.batch_sizes is not None else self.calls,
+            errors=dict(self.errors),
+            latency=self.latency.snapshot(),
+            batch_sizes=self.batch_sizes.snapshot() if self.batch_sizes is not None else None,
+        )
+
+
+class Exporter(object):
+    """Base class of metrics exporters; subclasses implement `export`."""
+
+    def export(self, snapshot: Dict[str, OperationStats]) -> None:
+        """
+        Publishes one snapshot of a `Metrics` registry.
+
+        Args:
+            snapshot (Dict[str, OperationStats]): Stats keyed by operation name.
+        """
+        raise NotImplementedError
+
+
+class InMemoryExporter(Exporter):
+    """Keeps every exported snapshot in `snapshots`, oldest first."""
+
+    def __init__(self):
+        self.snapshots: List[Dict[str, OperationStats]] = []
+
+    @property
+    def latest(self) -> Optional[Dict[str, OperationStats]]:
+        """The most recent snapshot, or None before the first export."""
+        return self.snapshots[-1] if self.snapshots else None
+
+    def export(self, snapshot: Dict[str, OperationStats]) -> None:
+        self.snapshots.append(snapshot)
+
+
+class PrometheusTextExporter(Exporter):
+    """
+    Renders snapshots in the Prometheus text exposition format.
+
+    The latest rendering is kept in `text`, and is also written to `stream`
+    when one is given.
+    """
+
+    def __init__(self, namespace: str = "digipin", stream: Optional[TextIO] = None):
+        """
+        Initializes the exporter.
+
+        Args:
+            namespace (str): Prefix of every metric name.
+            stream (TextIO, optional): Where to write each rendering.
+        """
+        self.namespace = namespace
+        self.stream = stream
+        self.text = ""
+
+    def export(self, snapshot: Dict[str, OperationStats]) -> None:
+        self.text = format_prometheus(snapshot, self.namespace)
+        if self.stream is not None:
+            self.stream.write(self.text)
+            self.stream.flush()
+
+
+def format_prometheus(snapshot: Dict[str, OperationStats], namespace: str = "digipin") -> str:
+    """
+    Formats a snapshot in the Prometheus text exposition format.
+
+    Args:
+        snapshot (Dict[str, OperationStats]): Stats keyed by operation name.
+        namespace (str): Prefix of every metric name.
+
+    Returns:
+        str: The exposition text, ending with a newline.
+    """
+    lines: List[str] = []
+
+    def family(name: str, kind: str, help_text: str) -> str:
+        metric = f"{namespace}_{name}"
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {kind}")
+        return metric
+
+    def histogram(metric: str, labels: str, hist: HistogramSnapshot) -> None:
+        cumulative = 0
+        for bound, count in zip(hist.buckets, hist.counts):
+            cumulative += count
+            lines.append(f'{metric}_bucket{{{labels},le="{bound:g}"}} {cumulative}')
+        lines.append(f'{metric}_bucket{{{labels},le="+Inf"}} {hist.count}')
+        lines.append(f"{metric}_sum{{{labels}}} {hist.sum!r}")
+        lines.append(f"{metric}_count{{{labels}}} {hist.count}")
+
+    operations = sorted(snapshot.items())
+    metric = family("calls_total", "counter", "Calls per operation (batches for batch methods).")
+    for operation, stats in operations:
+        lines.append(f'{metric}{{operation="{operation}"}} {stats.calls}')
+    metric = family("items_total", "counter", "Rows processed per operation.")
+    for operation, stats in operations:
+        lines.append(f'{metric}{{operation="{operation}"}} {stats.items}')
+    metric = family("errors_total", "counter", "Errors per operation and exception class.")
+    for operation, stats in operations:
+        for error, count in sorted(stats.errors.items()):
+            lines.append(f'{metric}{{operation="{operation}",error="{error}"}} {count}')
+    metric = family("latency_seconds", "histogram", "Latency of sampled calls.")
+    for operation, stats in operations:
+        histogram(metric, f'operation="{operation}"', stats.latency)
+    metric = family("batch_size", "histogram", "Rows per batch call.")
+    for operation, stats in operations:
+        if stats.batch_sizes is not None:
+            histogram(metric, f'operation="{operation}"', stats.batch_sizes)
+    return "\n".join(lines) + "\n"
+
+
+class Metrics(object):
+    """
+    A thread-safe registry of per-operation counters and histograms.
+
+    One registry can be shared by several `Digipin` instances; their calls
+    are then counted together.
+    """
+
+    def __init__(
+        self,
+        sample_every: int = 1,
+        latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        batch_buckets: Sequence[float] = DEFAULT_BATCH_BUCKETS,
+        exporters: Sequence[Exporter] = (),
+    ):
+        """
+        Initializes an empty registry.
+
+        Args:
+            sample_every (int): Time one scalar call in this many. Calls and errors
+                                are always counted; batch calls are always timed.
+            latency_buckets (Sequence[float]): Latency bucket upper bounds, in seconds.
+            batch_buckets (Sequence[float]): Batch-size bucket upper bounds, in rows.
+            exporters (Sequence[Exporter]): Exporters called by `export`.
+
+        Raises:
+            ValueError: If sample_every is not positive or a bucket list is not
+                        strictly ascending.
+        """
+        if sample_every < 1:
+            raise ValueError(f"sample_every must be a positive integer, got {sample_every}.")
+        for buckets in (latency_buckets, batch_buckets):
+            if any(low >= high for low, high in zip(buckets, buckets[1:])):
+                raise ValueError(f"Bucket bounds must be strictly ascending, got {buckets}.")
+        self.sample_every = sample_every
+        self._latency_buckets = tuple(latency_buckets)
+        self._batch_buckets = tuple(batch_buckets)
+        self._exporters: List[Exporter] = list(exporters)
+        self._operations: Dict[str, _Operation] = {}
+        self._lock = threading.Lock()
+
+    def add_exporter(self, exporter: Exporter) -> None:
+        """Registers another exporter for `export`."""
+        self._exporters.append(exporter)
+
+    def snapshot(self) -> Dict[str, OperationStats]:
+        """
+        Returns a consistent snapshot of every operation seen so far.
+
+        Returns:
+            Dict[str, OperationStats]: Stats keyed by operation name (e.g. "encode").
+        """
+        with self._lock:
+            return {name: operation.snapshot() for name, operation in self._operations.items()}
+
+    def export(self) -> Dict[str, OperationStats]:
+        """Takes a snapshot, hands it to every exporter and returns it."""
+        snapshot = self.snapshot()
+        for exporter in self._exporters:
+            exporter.export(snapshot)
+        return snapshot
+
+    def reset(self) -> None:
+        """Resets every counter and histogram to zero."""
+        with self._lock:
+            for operation in self._operations.values():
+                operation.clear()
+
+    def _operation(self, name: str, batch: bool) -> _Operation:
+        with self._lock:
+            operation = self._operations.get(name)
+            if operation is None:
+                operation = _Operation(
+                    self._latency_buckets, self._batch_buckets if batch else None
+                )
+                self._operations[name] = operation
+            return operation
+
+    def record_batch(
+        self,
+        operation: str,
+        size: int,
+        seconds: float,
+        errors: Optional[Dict[str, int]] = None,
+    ) -> None:
+        """
+        Records one batch call made outside an instrumented `Digipin`.
+
+        Args:
+            operation (str): Operation name, e.g. "encode_many".
+            size (int): Number of rows in the batch.
+            seconds (float): Duration of the call.
+            errors (Dict[str, int], optional): Failed rows by exception class name.
+        """
+        counters = self._operation(operation, batch=True)
+        with self._lock:
+            counters.calls += 1
+            counters.items += size
+            counters.latency.observe(seconds)
+            counters.batch_sizes.observe(size)
+            for name, count in (errors or {}).items():
+                counters.add_errors(name, count)
+
+    def instrument(self, operation: str, func: Callable) -> Callable:
+        """
+        Wraps a scalar function so that its calls, errors and sampled latency are recorded.
+
+        Args:
+            operation (str): Operation name the calls are recorded under.
+            func (Callable): The function to wrap.
+
+        Returns:
+            Callable: A wrapper with the same signature and docstring.
+        """
+        # Everything the wrapper touches is bound to locals up front.
+        counters = self._operation(operation, batch=False)
+        lock = self._lock
+        sample_every = self.sample_every
+        timer = time.perf_counter
+
+        @functools.wraps(func)
+        def instrumented(*args, **kwargs):
+            with lock:
+                counters.calls += 1
+                sampled = counters.calls % sample_every == 0
+            if not sampled:
+                try:
+                    return func(*args, **kwargs)
+                except Exception as exc:
+                    with lock:
+                        counters.add_errors(type(exc).__name__)
+                    raise
+            start = timer()
+            try:
+                return func(*args, **kwargs)
+            except Exception as exc:
+                with lock:
+                    counters.add_errors(type(exc).__name__)
+                raise
+            finally:
+                elapsed = timer() - start
+                with lock:
+                    counters.latency.observe(elapsed)
+
+        return instrumented
+
+    def _instrument_batch(self, operation: str, func: Callable) -> Callable:
+        """Wraps a `Digipin` batch method; batch size and row errors come from its result."""
+        counters = self._operation(operation, batch=True)
+        timer = time.perf_counter
+
+        @functools.wraps(func)
+        def instrumented(*args, **kwargs):
+            start = timer()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as exc:
+                with self._lock:
+                    counters.calls += 1
+                    counters.add_errors(type(exc).__name__)
+                raise
+            elapsed = timer() - start
+            size, errors = _batch_outcome(result, args, kwargs)
+            self.record_batch(operation, size, elapsed, errors)
+            return result
+
+        return instrumented
+
+
+def instrument_digipin(digipin: Any, metrics: Metrics) -> None:
+    """
+    Installs instrumented versions of the encode/decode methods on one `Digipin`.
+
+    Called by `Digipin.__init__` when a `Metrics` registry is passed.
+    """
+    for method, operation in _SCALAR_OPERATIONS.items():
+        setattr(digipin, method, metrics.instrument(operation, getattr(digipin, method)))
+    for method, operation in _BATCH_OPERATIONS.items():
+        setattr(digipin, method, metrics._instrument_batch(operation, getattr(digipin, method)))
+
+
+def _batch_outcome(
+    result: Any, args: tuple, kwargs: Dict[str, Any]
+) -> Tuple[int, Dict[str, int]]:
+    """Row count and per-exception row errors of a batch method's result (arrays or lists)."""
+    from .core import BOUNDS
+    from .model import DECODE_INVALID_CHAR, DECODE_INVALID_LENGTH
+
+    if hasattr(result, "errors"):  # DecodedDigipins
+        codes = result.errors
+        errors = {
+            "InvalidDigipinError": _count(codes, DECODE_INVALID_LENGTH),
+            "InvalidDigipinCharError": _count(codes, DECODE_INVALID_CHAR),
+        }
+        return _size(codes), {name: count for name, count in errors.items() if count}
+
+    if not isinstance(result, tuple):
+        return _size(result), {}
+    # (pins, invalid): attribute bad rows the way `_check_coordinates` would, latitude first.
+    pins, invalid = result
+    bad_rows = _count(invalid, True)
+    if not bad_rows:
+        return _size(pins), {}
+    lats = kwargs["lats"] if "lats" in kwargs else args[0]
+    if isinstance(invalid, list):
+        if hasattr(lats, "ravel"):
+            lats = lats.ravel().tolist()
+        bad_lats = [float(lat) for lat, bad in zip(lats, invalid) if bad]
+        bad_lat = sum(1 for lat in bad_lats if not (BOUNDS.min_lat <= lat <= BOUNDS.max_lat))
+    else:
+        import numpy as np
+
+        lat = np.asarray(lats, dtype=np.float64).reshape(invalid.shape)[invalid]
+        bad_lat = int(np.count_nonzero(~((lat >= BOUNDS.min_lat) & (lat <= BOUNDS.max_lat))))
+    errors = {"LatitudeOutOfRangeError": bad_lat, "LongitudeOutOfRangeError": bad_rows - bad_lat}
+    return _size(pins), {name: count for name, count in errors.items() if count}
+
+
+def _count(values: Any, value: Any) -> int:
+    if isinstance(values, list):
+        return values.count(value)
+    return int((values == value).sum())
+
+
+def _size(values: Any) -> int:
+    return len(values) if isinstance(values, list) else int(values.size)
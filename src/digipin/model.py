@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Any, Optional
 
 
 @dataclass(frozen=True)
@@ -6,6 +7,8 @@ class Coordinates:
     """
     A dataclass to represent geographical coordinates.
 
+    Instances use `__slots__`, so they carry no per-instance `__dict__`.
+
     Attributes:
         latitude (float): The latitude in decimal degrees.
                           Must be between -90.0 and 90.0.
@@ -13,9 +16,15 @@ class Coordinates:
                            Must be between -180.0 and 180.0.
     """
 
+    __slots__ = ("latitude", "longitude")
+
     latitude: float
     longitude: float
 
+    def __reduce__(self):
+        # Frozen slotted instances cannot be restored by setting attributes.
+        return (Coordinates, (self.latitude, self.longitude))
+
 
 @dataclass(frozen=True)
 class DigipinBounds:
@@ -29,7 +38,77 @@ class DigipinBounds:
         max_lon (float): Maximum allowed longitude.
     """
 
+    __slots__ = ("min_lat", "max_lat", "min_lon", "max_lon")
+
     min_lat: float
     max_lat: float
     min_lon: float
     max_lon: float
+
+    def __reduce__(self):
+        return (DigipinBounds, (self.min_lat, self.max_lat, self.min_lon, self.max_lon))
+
+
+@dataclass(frozen=True)
+class DigipinCell:
+    """
+    A dataclass to represent a DIGIPIN grid cell at any level.
+
+    Attributes:
+        digipin (str): The hyphenated DIGIPIN (or DIGIPIN prefix) of the cell.
+        level (int): Number of grid levels in the pin, from 1 to 10.
+        bounds (DigipinBounds): The geographical bounds of the cell.
+        center (Coordinates): The exact (unrounded) centre of the cell.
+        lat_size (float): Height of the cell in degrees of latitude.
+        lon_size (float): Width of the cell in degrees of longitude.
+    """
+
+    digipin: str
+    level: int
+    bounds: DigipinBounds
+    center: Coordinates
+    lat_size: float
+    lon_size: float
+
+
+# Per-row status codes reported by batch decoders instead of raising.
+DECODE_OK = 0
+DECODE_INVALID_LENGTH = 1  # The row would raise InvalidDigipinError
+DECODE_INVALID_CHAR = 2  # The row would raise InvalidDigipinCharError
+DECODE_NULL = 3  # The row is null in an Arrow input (see `digipin.interop`)
+
+
+@dataclass(frozen=True)
+class DecodedDigipins:
+    """
+    A dataclass holding the result of a batch decode.
+
+    The fields are NumPy arrays shaped like the input, or flat lists when the
+    decode ran on the pure-Python backend (see `digipin.backends`).
+
+    Attributes:
+        latitude (list | numpy.ndarray): Central latitudes, rounded to 6 decimal
+                                         places. NaN for rows that failed to decode.
+        longitude (list | numpy.ndarray): Central longitudes, rounded to 6 decimal
+                                          places. NaN for rows that failed to decode.
+        errors (list | numpy.ndarray): Per-row status code, one of `DECODE_OK`,
+                                       `DECODE_INVALID_LENGTH`, `DECODE_INVALID_CHAR`
+                                       or `DECODE_NULL`.
+        min_lat, max_lat, min_lon, max_lon (list | numpy.ndarray, optional): Unrounded
+                                bounding box of each cell, only set when requested.
+    """
+
+    latitude: Any
+    longitude: Any
+    errors: Any
+    min_lat: Optional[Any] = None
+    max_lat: Optional[Any] = None
+    min_lon: Optional[Any] = None
+    max_lon: Optional[Any] = None
+
+    @property
+    def valid(self) -> Any:
+        """Per-row booleans of the rows that decoded successfully (a list for list fields)."""
+        if isinstance(self.errors, list):
+            return [code == DECODE_OK for code in self.errors]
+        return self.errors == DECODE_OK
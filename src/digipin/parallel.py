@@ -0,0 +1,179 @@
+"""
+Multi-core bulk encoding of DIGIPINs.
+
+`parallel_encode` splits the input across a pool of worker processes. The
+coordinates and the results live in `multiprocessing.shared_memory` blocks:
+each worker attaches to them by name, encodes its slice of rows with the
+vectorized encoder of `digipin.vectorized` and writes the code points in place.
+Only block names and row ranges cross the process boundary, so nothing is
+pickled per row and results come back in input order by construction.
+
+Requires NumPy; install it with ``pip install digipin-python[numpy]``.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple, Union
+
+from .core import DIGIPIN_LENGTH, _check_precision
+from .vectorized import _CHAR_POSITIONS, _encode_rows, _raise_first_invalid, np
+
+# Below this many rows per worker, process start-up costs more than it saves.
+MIN_ROWS_PER_WORKER = 50_000
+
+# Slices per worker, so that a slow worker does not hold up the whole batch.
+_CHUNKS_PER_WORKER = 4
+
+
+def parallel_encode(
+    lats,
+    lons,
+    workers: Optional[int] = None,
+    return_invalid: bool = False,
+    precision: int = DIGIPIN_LENGTH,
+    chunk_size: Optional[int] = None,
+) -> Union["np.ndarray", Tuple["np.ndarray", "np.ndarray"]]:
+    """
+    Encodes arrays of latitudes and longitudes into DIGIPINs using several processes.
+
+    The result is identical to `digipin.vectorized.encode_many`, and therefore to
+    calling `Digipin.get_digipin` on each row. Inputs too small to benefit from
+    extra processes are encoded in the calling process.
+
+    Args:
+        lats (array_like): Latitudes in decimal degrees.
+        lons (array_like): Longitudes in decimal degrees, with the same shape as `lats`.
+        workers (int, optional): Number of worker processes. Defaults to the
+                                 number of CPUs available to this process.
+        return_invalid (bool): If True, out-of-range rows do not raise. They are
+                               encoded as empty strings and flagged in the returned mask.
+        precision (int): Number of grid levels to encode, from 1 to 10.
+        chunk_size (int, optional): Rows per task handed to a worker. Defaults to
+                                    splitting the input into a few slices per worker.
+
+    Returns:
+        numpy.ndarray: A fixed-width string array of DIGIPINs shaped like the input.
+        When `return_invalid` is True, a tuple `(pins, invalid)` is returned where
+        `invalid` is a boolean array marking rows outside the defined bounds.
+
+    Raises:
+        ValueError: If the shapes differ, or workers or chunk_size is not positive.
+        LatitudeOutOfRangeError: If a latitude is outside the defined bounds
+                                 and `return_invalid` is False.
+        LongitudeOutOfRangeError: If a longitude is outside the defined bounds
+                                  and `return_invalid` is False.
+        InvalidPrecisionError: If precision is not between 1 and 10.
+    """
+    _check_precision(precision)
+    if workers is None:
+        workers = _available_cpus()
+    if workers < 1:
+        raise ValueError(f"workers must be a positive integer, got {workers}.")
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError(f"chunk_size must be a positive integer, got {chunk_size}.")
+
+    lat = np.asarray(lats, dtype=np.float64)
+    lon = np.asarray(lons, dtype=np.float64)
+    if lat.shape != lon.shape:
+        raise ValueError(
+            "Latitude and longitude arrays must have the same shape, "
+            f"got {lat.shape} and {lon.shape}."
+        )
+    shape = lat.shape
+    lat = lat.ravel()
+    lon = lon.ravel()
+    n = lat.shape[0]
+
+    workers = min(workers, max(1, n // MIN_ROWS_PER_WORKER))
+    if workers == 1 and chunk_size is None:
+        codepoints, invalid = _encode_rows(lat, lon, precision)
+    else:
+        if chunk_size is None:
+            chunk_size = -(-n // (workers * _CHUNKS_PER_WORKER))
+        codepoints, invalid = _encode_shared(lat, lon, precision, workers, chunk_size)
+
+    if not return_invalid:
+        _raise_first_invalid(lat, lon, invalid)
+    pins = codepoints.view(f"U{codepoints.shape[1]}").reshape(shape)
+    if return_invalid:
+        return pins, invalid.reshape(shape)
+    return pins
+
+
+def _available_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover - not available on macOS/Windows
+        return os.cpu_count() or 1
+
+
+def _encode_shared(
+    lat: "np.ndarray", lon: "np.ndarray", precision: int, workers: int, chunk_size: int
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Runs `_encode_rows` over shared-memory slices and copies the results out."""
+    n = lat.shape[0]
+    width = _CHAR_POSITIONS[precision - 1] + 1
+    blocks: List[shared_memory.SharedMemory] = []
+    try:
+        for nbytes in (n * 8, n * 8, n * width * 4, n):
+            blocks.append(shared_memory.SharedMemory(create=True, size=max(nbytes, 1)))
+        lat_block, lon_block, out_block, mask_block = blocks
+        np.ndarray(n, dtype=np.float64, buffer=lat_block.buf)[:] = lat
+        np.ndarray(n, dtype=np.float64, buffer=lon_block.buf)[:] = lon
+
+        tasks = [
+            (
+                lat_block.name,
+                lon_block.name,
+                out_block.name,
+                mask_block.name,
+                n,
+                width,
+                precision,
+                start,
+                min(start + chunk_size, n),
+            )
+            for start in range(0, n, chunk_size)
+        ]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for future in [executor.submit(_encode_slice, *task) for task in tasks]:
+                future.result()
+
+        codepoints = np.ndarray((n, width), dtype=np.uint32, buffer=out_block.buf).copy()
+        invalid = np.ndarray(n, dtype=np.bool_, buffer=mask_block.buf).copy()
+        return codepoints, invalid
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def _encode_slice(
+    lat_name: str,
+    lon_name: str,
+    out_name: str,
+    mask_name: str,
+    n: int,
+    width: int,
+    precision: int,
+    start: int,
+    stop: int,
+) -> None:
+    """Worker task: encodes rows [start, stop) of the shared blocks in place."""
+    blocks = [
+        shared_memory.SharedMemory(name=name)
+        for name in (lat_name, lon_name, out_name, mask_name)
+    ]
+    try:
+        lat_block, lon_block, out_block, mask_block = blocks
+        lat = np.ndarray(n, dtype=np.float64, buffer=lat_block.buf)[start:stop]
+        lon = np.ndarray(n, dtype=np.float64, buffer=lon_block.buf)[start:stop]
+        codepoints, invalid = _encode_rows(lat, lon, precision)
+        np.ndarray((n, width), dtype=np.uint32, buffer=out_block.buf)[start:stop] = codepoints
+        np.ndarray(n, dtype=np.bool_, buffer=mask_block.buf)[start:stop] = invalid
+        # Views must be released before the blocks can be closed.
+        del lat, lon
+    finally:
+        for block in blocks:
+            block.close()
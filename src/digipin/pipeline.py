@@ -0,0 +1,378 @@
+"""
+Streaming encode/decode of tabular files.
+
+`encode_file` adds a DIGIPIN column to every row of a CSV, JSONL or Parquet
+file, and `decode_file` adds latitude/longitude columns from a DIGIPIN column.
+Input is read and written in chunks of `chunk_size` rows, so memory use stays
+constant regardless of file size. Each chunk goes through one
+`Digipin.encode_many` / `decode_many` call, on the backend of that `Digipin`
+(see `digipin.backends`). Rows that cannot be encoded or decoded get empty output values and
+are counted as errors instead of aborting the job.
+
+Parquet support requires the optional `pyarrow` package.
+"""
+
+import csv
+import io
+import json
+import math
+import sys
+import time
+from dataclasses import dataclass
+from typing import IO, Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .core import DIGIPIN_LENGTH, Digipin
+
+DEFAULT_CHUNK_SIZE = 65536
+
+FORMATS = ("csv", "jsonl", "parquet")
+_EXTENSIONS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".parquet": "parquet"}
+
+
+@dataclass(frozen=True)
+class PipelineStats:
+    """
+    A dataclass summarising a pipeline run.
+
+    Attributes:
+        rows (int): Number of rows processed.
+        errors (int): Number of rows that could not be encoded or decoded.
+        seconds (float): Wall-clock duration of the run.
+    """
+
+    rows: int
+    errors: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        """Processing throughput over the whole run."""
+        return self.rows / self.seconds if self.seconds > 0 else float("inf")
+
+
+def detect_format(path: str) -> str:
+    """
+    Infers the file format from a path's extension.
+
+    Args:
+        path (str): A file path.
+
+    Returns:
+        str: One of "csv", "jsonl" or "parquet".
+
+    Raises:
+        ValueError: If the extension is not recognised.
+    """
+    for extension, file_format in _EXTENSIONS.items():
+        if path.lower().endswith(extension):
+            return file_format
+    raise ValueError(
+        f"Cannot infer the format of {path!r}; pass one of {', '.join(FORMATS)} explicitly."
+    )
+
+
+def encode_file(
+    input_path: str,
+    output_path: str,
+    lat_column: str = "lat",
+    lon_column: str = "lon",
+    pin_column: str = "digipin",
+    precision: int = DIGIPIN_LENGTH,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    file_format: Optional[str] = None,
+    digipin: Optional[Digipin] = None,
+) -> PipelineStats:
+    """
+    Streams a file, adding the DIGIPIN of each row's coordinates.
+
+    Args:
+        input_path (str): Input file, or "-" for stdin (CSV/JSONL only).
+        output_path (str): Output file, or "-" for stdout (CSV/JSONL only).
+        lat_column (str): Name of the latitude column.
+        lon_column (str): Name of the longitude column.
+        pin_column (str): Name of the DIGIPIN column to add.
+        precision (int): Number of grid levels to encode, from 1 to 10.
+        chunk_size (int): Number of rows processed at a time.
+        file_format (str, optional): "csv", "jsonl" or "parquet"; inferred from
+                                     the input path when omitted.
+        digipin (Digipin, optional): Encoder whose backend runs the batches.
+
+    Returns:
+        PipelineStats: Row, error and timing counts.
+    """
+    digipin_handler = digipin if digipin is not None else Digipin()
+
+    def transform(table: "_Table", chunk: Any) -> Tuple[Any, int]:
+        lats = [_to_float(value) for value in table.column(chunk, lat_column)]
+        lons = [_to_float(value) for value in table.column(chunk, lon_column)]
+        pins, errors = _encode_chunk(digipin_handler, lats, lons, precision)
+        return table.with_columns(chunk, {pin_column: pins}), errors
+
+    return _run(input_path, output_path, file_format, chunk_size, transform)
+
+
+def decode_file(
+    input_path: str,
+    output_path: str,
+    pin_column: str = "digipin",
+    lat_column: str = "latitude",
+    lon_column: str = "longitude",
+    precision: int = DIGIPIN_LENGTH,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    file_format: Optional[str] = None,
+    digipin: Optional[Digipin] = None,
+) -> PipelineStats:
+    """
+    Streams a file, adding the central latitude and longitude of each row's DIGIPIN.
+
+    Args:
+        input_path (str): Input file, or "-" for stdin (CSV/JSONL only).
+        output_path (str): Output file, or "-" for stdout (CSV/JSONL only).
+        pin_column (str): Name of the DIGIPIN column.
+        lat_column (str): Name of the latitude column to add.
+        lon_column (str): Name of the longitude column to add.
+        precision (int): Number of characters (excluding hyphens) of the pins, from
+                         1 to 10; pins of any other length are counted as errors.
+        chunk_size (int): Number of rows processed at a time.
+        file_format (str, optional): "csv", "jsonl" or "parquet"; inferred from
+                                     the input path when omitted.
+        digipin (Digipin, optional): Decoder whose backend runs the batches.
+
+    Returns:
+        PipelineStats: Row, error and timing counts.
+    """
+    digipin_handler = digipin if digipin is not None else Digipin()
+
+    def transform(table: "_Table", chunk: Any) -> Tuple[Any, int]:
+        pins = ["" if value is None else str(value) for value in table.column(chunk, pin_column)]
+        lats, lons, errors = _decode_chunk(digipin_handler, pins, precision)
+        return table.with_columns(chunk, {lat_column: lats, lon_column: lons}), errors
+
+    return _run(input_path, output_path, file_format, chunk_size, transform)
+
+
+def _run(input_path, output_path, file_format, chunk_size, transform) -> PipelineStats:
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be a positive integer, got {chunk_size}.")
+    file_format = file_format or detect_format(input_path)
+    if file_format not in FORMATS:
+        raise ValueError(f"Unknown format {file_format!r}; expected one of {', '.join(FORMATS)}.")
+
+    table = _TABLES[file_format]()
+    start = time.perf_counter()
+    rows = 0
+    errors = 0
+    with table.open(input_path, output_path) as (reader, writer):
+        for chunk in table.read(reader, chunk_size):
+            chunk, chunk_errors = transform(table, chunk)
+            table.write(writer, chunk)
+            rows += table.length(chunk)
+            errors += chunk_errors
+    return PipelineStats(rows=rows, errors=errors, seconds=time.perf_counter() - start)
+
+
+def _to_float(value: Any) -> float:
+    """Parses a cell as a float, mapping empty or malformed values to NaN."""
+    if value is None or value == "":
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _encode_chunk(
+    digipin_handler: Digipin, lats: Sequence[float], lons: Sequence[float], precision: int
+) -> Tuple[List[str], int]:
+    """Encodes one chunk; failed rows become empty strings."""
+    pins, invalid = digipin_handler.encode_many(
+        lats, lons, return_invalid=True, precision=precision
+    )
+    return _to_list(pins), _to_list(invalid).count(True)
+
+
+def _decode_chunk(
+    digipin_handler: Digipin, pins: Sequence[str], precision: int
+) -> Tuple[List[Optional[float]], List[Optional[float]], int]:
+    """Decodes one chunk; failed rows become None."""
+    decoded = digipin_handler.decode_many(pins, precision=precision)
+    valid = _to_list(decoded.valid)
+    lats = [lat if ok else None for lat, ok in zip(_to_list(decoded.latitude), valid)]
+    lons = [lon if ok else None for lon, ok in zip(_to_list(decoded.longitude), valid)]
+    return lats, lons, valid.count(False)
+
+
+def _to_list(values: Any) -> List[Any]:
+    """Batch results as a list, whether the backend returned arrays or lists."""
+    return values.tolist() if hasattr(values, "tolist") else list(values)
+
+
+class _Streams(object):
+    """Context manager opening text streams, treating "-" as stdin/stdout."""
+
+    def __init__(self, input_path: str, output_path: str, newline: Optional[str]):
+        self._paths = (input_path, output_path)
+        self._newline = newline
+        self._owned: List[IO[str]] = []
+
+    def __enter__(self) -> Tuple[IO[str], IO[str]]:
+        input_path, output_path = self._paths
+        if input_path == "-":
+            reader = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", newline=self._newline)
+        else:
+            reader = open(input_path, "r", encoding="utf-8", newline=self._newline)
+            self._owned.append(reader)
+        if output_path == "-":
+            writer = sys.stdout
+        else:
+            writer = open(output_path, "w", encoding="utf-8", newline=self._newline)
+            self._owned.append(writer)
+        return reader, writer
+
+    def __exit__(self, *exc_info) -> None:
+        for stream in self._owned:
+            stream.close()
+
+
+class _Table(object):
+    """Chunked reader/writer for one file format."""
+
+    def open(self, input_path: str, output_path: str):
+        raise NotImplementedError
+
+    def read(self, reader: Any, chunk_size: int) -> Iterator[Any]:
+        raise NotImplementedError
+
+    def write(self, writer: Any, chunk: Any) -> None:
+        raise NotImplementedError
+
+    def length(self, chunk: Any) -> int:
+        return len(chunk)
+
+    def column(self, chunk: Any, name: str) -> List[Any]:
+        try:
+            return [row[name] for row in chunk]
+        except KeyError:
+            raise KeyError(f"Column {name!r} not found in input.") from None
+
+    def with_columns(self, chunk: Any, columns: Dict[str, List[Any]]) -> Any:
+        for name, values in columns.items():
+            for row, value in zip(chunk, values):
+                row[name] = value
+        return chunk
+
+
+def _chunked(rows: Iterator[Dict[str, Any]], chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+    chunk: List[Dict[str, Any]] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class _CsvTable(_Table):
+    def __init__(self):
+        self._writer: Optional[csv.DictWriter] = None
+
+    def open(self, input_path: str, output_path: str) -> _Streams:
+        return _Streams(input_path, output_path, newline="")
+
+    def read(self, reader: IO[str], chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+        return _chunked(csv.DictReader(reader), chunk_size)
+
+    def write(self, writer: IO[str], chunk: List[Dict[str, Any]]) -> None:
+        if self._writer is None:
+            self._writer = csv.DictWriter(writer, fieldnames=list(chunk[0]))
+            self._writer.writeheader()
+        self._writer.writerows(
+            {key: "" if value is None else value for key, value in row.items()} for row in chunk
+        )
+
+
+class _JsonlTable(_Table):
+    def open(self, input_path: str, output_path: str) -> _Streams:
+        return _Streams(input_path, output_path, newline=None)
+
+    def read(self, reader: IO[str], chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+        return _chunked((json.loads(line) for line in reader if line.strip()), chunk_size)
+
+    def write(self, writer: IO[str], chunk: List[Dict[str, Any]]) -> None:
+        writer.writelines(json.dumps(row) + "\n" for row in chunk)
+
+
+class _ParquetTable(_Table):
+    def __init__(self):
+        try:
+            import pyarrow  # noqa: F401
+            import pyarrow.parquet  # noqa: F401
+        except ImportError as exc:
+            raise ImportError(
+                "Parquet support requires pyarrow. Install it with `pip install pyarrow`."
+            ) from exc
+        self._writer = None
+
+    def open(self, input_path: str, output_path: str) -> "_ParquetFiles":
+        if input_path == "-" or output_path == "-":
+            raise ValueError("Parquet input and output must be files, not stdin/stdout.")
+        return _ParquetFiles(self, input_path, output_path)
+
+    def read(self, reader: Any, chunk_size: int) -> Iterator[Any]:
+        return reader.iter_batches(batch_size=chunk_size)
+
+    def write(self, writer: str, chunk: Any) -> None:
+        import pyarrow.parquet as pq
+
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(writer, chunk.schema)
+        self._writer.write_batch(chunk)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def length(self, chunk: Any) -> int:
+        return chunk.num_rows
+
+    def column(self, chunk: Any, name: str) -> List[Any]:
+        index = chunk.schema.get_field_index(name)
+        if index < 0:
+            raise KeyError(f"Column {name!r} not found in input.")
+        return chunk.column(index).to_pylist()
+
+    def with_columns(self, chunk: Any, columns: Dict[str, List[Any]]) -> Any:
+        import pyarrow as pa
+
+        arrays = list(chunk.columns)
+        names = list(chunk.schema.names)
+        for name, values in columns.items():
+            array = pa.array(values)
+            if name in names:
+                arrays[names.index(name)] = array
+            else:
+                arrays.append(array)
+                names.append(name)
+        return pa.RecordBatch.from_arrays(arrays, names=names)
+
+
+class _ParquetFiles(object):
+    """Context manager yielding a Parquet reader and the output path."""
+
+    def __init__(self, table: _ParquetTable, input_path: str, output_path: str):
+        self._table = table
+        self._paths = (input_path, output_path)
+
+    def __enter__(self) -> Tuple[Any, str]:
+        import pyarrow.parquet as pq
+
+        input_path, output_path = self._paths
+        return pq.ParquetFile(input_path), output_path
+
+    def __exit__(self, *exc_info) -> None:
+        self._table.close()
+
+
+_TABLES = {"csv": _CsvTable, "jsonl": _JsonlTable, "parquet": _ParquetTable}
@@ -0,0 +1,206 @@
+"""
+Polygon and bounding-box coverage with DIGIPIN cells.
+
+`polyfill` walks the 4x4 grid hierarchy top-down. Each cell is classified
+against the shape as outside, inside or crossing its boundary: outside cells
+are pruned with all their descendants, inside cells are emitted without further
+testing, and only cells that cross the boundary are subdivided. Cells are
+yielded lazily, so covering a large area never materialises the full set.
+"""
+
+from typing import Iterator, List, Sequence, Tuple, Union
+
+from .core import BOUNDS, _check_precision
+from .grid import grid_to_pin
+from .hierarchy import _expand
+from .model import Coordinates, DigipinBounds
+
+_OUTSIDE = 0
+_INSIDE = 1
+_PARTIAL = 2
+
+_Point = Tuple[float, float]
+_Edge = Tuple[float, float, float, float]
+Geometry = Union[DigipinBounds, Sequence[Union[_Point, Coordinates]]]
+
+
+def polyfill(geometry: Geometry, level: int, compact: bool = False) -> Iterator[str]:
+    """
+    Yields the DIGIPIN cells that cover a bounding box or polygon.
+
+    Args:
+        geometry (DigipinBounds | Sequence): Either a `DigipinBounds` box, or a polygon
+                                             given as a sequence of `(lat, lon)` pairs
+                                             or `Coordinates` (the ring is closed
+                                             implicitly).
+        level (int): Level of the covering cells, from 1 to 10.
+        compact (bool): If True, cells lying entirely inside the shape are yielded
+                        at the coarsest level that fits instead of being expanded
+                        into their level-`level` descendants, giving a mixed-level
+                        cover.
+
+    Yields:
+        str: Hyphenated DIGIPINs, in hierarchical (depth-first) order. Every cell
+             that intersects the shape is included. Polygon covers are conservative
+             and may include cells that only touch the polygon's boundary.
+
+    Raises:
+        InvalidPrecisionError: If level is not between 1 and 10.
+        ValueError: If a polygon has fewer than 3 vertices.
+    """
+    _check_precision(level)
+    if isinstance(geometry, DigipinBounds):
+        shape = _BoxShape(geometry)
+    else:
+        shape = _PolygonShape(geometry)
+    return _walk(shape, 0, 0, 0, level, compact, shape.initial_state())
+
+
+def _cell_bounds(level: int, row: int, col: int) -> Tuple[float, float, float, float]:
+    """Bounds of a cell from its grid indices; cell edges are exact dyadic multiples."""
+    lat_size = (BOUNDS.max_lat - BOUNDS.min_lat) / 4**level
+    lon_size = (BOUNDS.max_lon - BOUNDS.min_lon) / 4**level
+    max_lat = BOUNDS.max_lat - row * lat_size
+    min_lon = BOUNDS.min_lon + col * lon_size
+    return max_lat - lat_size, max_lat, min_lon, min_lon + lon_size
+
+
+def _walk(shape, level, row, col, target, compact, state) -> Iterator[str]:
+    """Depth-first traversal of the 16 children of the cell at (level, row, col)."""
+    child_level = level + 1
+    for child_row in range(row * 4, row * 4 + 4):
+        for child_col in range(col * 4, col * 4 + 4):
+            bounds = _cell_bounds(child_level, child_row, child_col)
+            status, child_state = shape.classify(bounds, state)
+            if status == _OUTSIDE:
+                continue
+            if child_level == target or (status == _INSIDE and compact):
+                yield grid_to_pin(child_level, child_row, child_col)
+            elif status == _INSIDE:
+                yield from _descendants(child_level, child_row, child_col, target)
+            else:
+                yield from _walk(
+                    shape, child_level, child_row, child_col, target, compact, child_state
+                )
+
+
+def _descendants(level: int, row: int, col: int, target: int) -> Iterator[str]:
+    """Yields every descendant of a cell at the target level, depth-first."""
+    return _expand(grid_to_pin(level, row, col).replace("-", ""), target)
+
+
+def _overlaps(low: float, high: float, other_low: float, other_high: float) -> bool:
+    """Interval overlap with positive length; degenerate intervals may touch."""
+    if other_low == other_high:
+        return low <= other_low <= high
+    return low < other_high and other_low < high
+
+
+class _BoxShape(object):
+    """Classifies cells against an axis-aligned bounding box."""
+
+    def __init__(self, box: DigipinBounds):
+        self.box = box
+
+    def initial_state(self):
+        return None
+
+    def classify(self, bounds, state):
+        min_lat, max_lat, min_lon, max_lon = bounds
+        box = self.box
+        if not (
+            _overlaps(min_lat, max_lat, box.min_lat, box.max_lat)
+            and _overlaps(min_lon, max_lon, box.min_lon, box.max_lon)
+        ):
+            return _OUTSIDE, None
+        if (
+            box.min_lat <= min_lat
+            and max_lat <= box.max_lat
+            and box.min_lon <= min_lon
+            and max_lon <= box.max_lon
+        ):
+            return _INSIDE, None
+        return _PARTIAL, None
+
+
+class _PolygonShape(object):
+    """
+    Classifies cells against a simple polygon.
+
+    The state passed down the hierarchy is the list of polygon edges that touch
+    the parent cell; a child can only be crossed by those edges. A cell touched
+    by no edge is either wholly inside or wholly outside, decided by testing its
+    centre against the full polygon.
+    """
+
+    def __init__(self, vertices: Sequence[Union[_Point, Coordinates]]):
+        points: List[_Point] = [
+            (v.latitude, v.longitude) if isinstance(v, Coordinates) else (v[0], v[1])
+            for v in vertices
+        ]
+        if len(points) > 1 and points[0] == points[-1]:
+            points.pop()
+        if len(points) < 3:
+            raise ValueError("A polygon needs at least 3 vertices.")
+
+        self.edges: List[_Edge] = [
+            (lat_a, lon_a, lat_b, lon_b)
+            for (lat_a, lon_a), (lat_b, lon_b) in zip(points, points[1:] + points[:1])
+        ]
+        self.min_lat = min(lat for lat, _ in points)
+        self.max_lat = max(lat for lat, _ in points)
+        self.min_lon = min(lon for _, lon in points)
+        self.max_lon = max(lon for _, lon in points)
+
+    def initial_state(self) -> List[_Edge]:
+        return self.edges
+
+    def classify(self, bounds, edges: List[_Edge]):
+        min_lat, max_lat, min_lon, max_lon = bounds
+        if not (
+            _overlaps(min_lat, max_lat, self.min_lat, self.max_lat)
+            and _overlaps(min_lon, max_lon, self.min_lon, self.max_lon)
+        ):
+            return _OUTSIDE, []
+
+        crossing = [edge for edge in edges if _segment_hits_box(edge, bounds)]
+        if crossing:
+            return _PARTIAL, crossing
+        if self._contains((min_lat + max_lat) / 2, (min_lon + max_lon) / 2):
+            return _INSIDE, []
+        return _OUTSIDE, []
+
+    def _contains(self, lat: float, lon: float) -> bool:
+        """Even-odd ray casting along the longitude axis."""
+        inside = False
+        for lat_a, lon_a, lat_b, lon_b in self.edges:
+            if (lat_a > lat) != (lat_b > lat):
+                crossing_lon = lon_a + (lat - lat_a) * (lon_b - lon_a) / (lat_b - lat_a)
+                if lon < crossing_lon:
+                    inside = not inside
+        return inside
+
+
+def _segment_hits_box(edge: _Edge, bounds: Tuple[float, float, float, float]) -> bool:
+    """Liang-Barsky test of a segment against a closed axis-aligned box."""
+    lat_a, lon_a, lat_b, lon_b = edge
+    min_lat, max_lat, min_lon, max_lon = bounds
+    t_enter = 0.0
+    t_exit = 1.0
+    for delta, start, low, high in (
+        (lat_b - lat_a, lat_a, min_lat, max_lat),
+        (lon_b - lon_a, lon_a, min_lon, max_lon),
+    ):
+        if delta == 0:
+            if start < low or start > high:
+                return False
+            continue
+        t_low = (low - start) / delta
+        t_high = (high - start) / delta
+        if t_low > t_high:
+            t_low, t_high = t_high, t_low
+        t_enter = max(t_enter, t_low)
+        t_exit = min(t_exit, t_high)
+        if t_enter > t_exit:
+            return False
+    return True
@@ -0,0 +1,200 @@
+"""
+Streaming conversion of GPS traces into run-length encoded DIGIPIN cell sequences.
+
+Consecutive fixes of a vehicle usually fall in the same cell. `TraceEncoder`
+keeps the bounds of the current cell and only runs the encoder when a fix
+leaves them (or comes too close to an edge to decide safely), so the pins are
+always identical to `Digipin.get_digipin`. Each stay in a cell becomes one
+`CellRun`; memory use is constant however long the trace is.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, Optional, Tuple
+
+from .core import BOUNDS, DIGIPIN_LENGTH, Digipin, _check_precision
+from .error import LatitudeOutOfRangeError, LongitudeOutOfRangeError
+from .grid import pin_to_grid
+
+# Fixes closer than this fraction of a cell to its edge are re-encoded, so that
+# floating point rounding in the encoder can never disagree with the bounds test.
+_EDGE_MARGIN = 1e-6
+
+
+@dataclass(frozen=True)
+class CellRun:
+    """
+    A dataclass holding one stay of a trace in a cell.
+
+    Attributes:
+        digipin (str): The hyphenated DIGIPIN of the cell.
+        enter_time (Any): Timestamp of the first fix in the cell.
+        exit_time (Any): Timestamp of the last fix in the cell, before the trace
+                         moved on (equal to `enter_time` for a single fix).
+        count (int): Number of fixes in the run.
+    """
+
+    digipin: str
+    enter_time: Any
+    exit_time: Any
+    count: int
+
+
+class TraceEncoder(object):
+    """
+    Incremental run-length encoder for one trace.
+
+    Feed fixes in time order with `push`; a `CellRun` is returned whenever a
+    fix starts a new cell, and `flush` returns the run still in progress.
+    Keep one encoder per vehicle to process interleaved streams online.
+    """
+
+    def __init__(
+        self,
+        level: int = DIGIPIN_LENGTH,
+        skip_invalid: bool = False,
+        digipin: Optional[Digipin] = None,
+    ):
+        """
+        Initializes an encoder with no current cell.
+
+        Args:
+            level (int): Number of grid levels of the cells, from 1 to 10.
+            skip_invalid (bool): Drop fixes outside the DIGIPIN bounds instead
+                                 of raising; they neither end nor extend a run.
+            digipin (Digipin, optional): Encoder used for new cells, e.g. one
+                                         built with lookup tables.
+
+        Raises:
+            InvalidPrecisionError: If level is not between 1 and 10.
+        """
+        _check_precision(level)
+        self.level = level
+        self.skip_invalid = skip_invalid
+        self.skipped = 0
+        self.encoded = 0
+        self._digipin = digipin if digipin is not None else Digipin()
+        self._lat_size = (BOUNDS.max_lat - BOUNDS.min_lat) / 4**level
+        self._lon_size = (BOUNDS.max_lon - BOUNDS.min_lon) / 4**level
+        self._lat_margin = self._lat_size * _EDGE_MARGIN
+        self._lon_margin = self._lon_size * _EDGE_MARGIN
+        self._pin: Optional[str] = None
+        # Bounds of the current cell, shrunk by the edge margin
+        self._inner = (1.0, -1.0, 1.0, -1.0)
+        self._enter_time: Any = None
+        self._exit_time: Any = None
+        self._count = 0
+
+    def push(self, lat: float, lon: float, timestamp: Any = None) -> Optional[CellRun]:
+        """
+        Adds one fix to the trace.
+
+        Args:
+            lat (float): Latitude in decimal degrees.
+            lon (float): Longitude in decimal degrees.
+            timestamp (Any): Time of the fix, stored as-is in the runs.
+
+        Returns:
+            Optional[CellRun]: The run that just ended if this fix entered a new
+                               cell, otherwise None.
+
+        Raises:
+            LatitudeOutOfRangeError: If latitude is outside the defined bounds and
+                                     `skip_invalid` is False.
+            LongitudeOutOfRangeError: If longitude is outside the defined bounds and
+                                      `skip_invalid` is False.
+        """
+        min_lat, max_lat, min_lon, max_lon = self._inner
+        if min_lat < lat < max_lat and min_lon < lon < max_lon:
+            self._exit_time = timestamp
+            self._count += 1
+            return None
+
+        try:
+            pin = self._digipin.get_digipin(lat, lon, self.level)
+        except (LatitudeOutOfRangeError, LongitudeOutOfRangeError):
+            if not self.skip_invalid:
+                raise
+            self.skipped += 1
+            return None
+        self.encoded += 1
+        if pin == self._pin:  # Near an edge, but still in the same cell
+            self._exit_time = timestamp
+            self._count += 1
+            return None
+
+        finished = self.flush()
+        self._enter_cell(pin)
+        self._enter_time = self._exit_time = timestamp
+        self._count = 1
+        return finished
+
+    def flush(self) -> Optional[CellRun]:
+        """
+        Ends the current run, e.g. at the end of a trace or before a checkpoint.
+
+        Returns:
+            Optional[CellRun]: The run in progress, or None if there is none.
+        """
+        if self._pin is None:
+            return None
+        run = CellRun(
+            digipin=self._pin,
+            enter_time=self._enter_time,
+            exit_time=self._exit_time,
+            count=self._count,
+        )
+        self._pin = None
+        self._inner = (1.0, -1.0, 1.0, -1.0)
+        self._count = 0
+        return run
+
+    def _enter_cell(self, pin: str) -> None:
+        _, row, col = pin_to_grid(pin)
+        max_lat = BOUNDS.max_lat - row * self._lat_size
+        min_lon = BOUNDS.min_lon + col * self._lon_size
+        self._pin = pin
+        self._inner = (
+            max_lat - self._lat_size + self._lat_margin,
+            max_lat - self._lat_margin,
+            min_lon + self._lon_margin,
+            min_lon + self._lon_size - self._lon_margin,
+        )
+
+
+def encode_trace(
+    points: Iterable[Tuple[float, ...]],
+    level: int = DIGIPIN_LENGTH,
+    skip_invalid: bool = False,
+    digipin: Optional[Digipin] = None,
+) -> Iterator[CellRun]:
+    """
+    Lazily converts a GPS trace into run-length encoded cell visits.
+
+    Args:
+        points (Iterable[Tuple[float, float, Any]]): Fixes in time order, as
+            `(lat, lon, timestamp)` tuples. `(lat, lon)` pairs are accepted too;
+            their timestamp is the position of the fix in the trace.
+        level (int): Number of grid levels of the cells, from 1 to 10.
+        skip_invalid (bool): Drop fixes outside the DIGIPIN bounds instead of raising.
+        digipin (Digipin, optional): Encoder used for new cells.
+
+    Yields:
+        CellRun: One record per consecutive stay in a cell, as soon as the trace
+                 leaves it, plus the last run once `points` is exhausted.
+
+    Raises:
+        LatitudeOutOfRangeError: If a latitude is outside the defined bounds and
+                                 `skip_invalid` is False.
+        LongitudeOutOfRangeError: If a longitude is outside the defined bounds and
+                                  `skip_invalid` is False.
+        InvalidPrecisionError: If level is not between 1 and 10.
+    """
+    encoder = TraceEncoder(level, skip_invalid=skip_invalid, digipin=digipin)
+    push = encoder.push
+    for index, point in enumerate(points):
+        run = push(*point) if len(point) == 3 else push(point[0], point[1], index)
+        if run is not None:
+            yield run
+    run = encoder.flush()
+    if run is not None:
+        yield run
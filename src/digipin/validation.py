@@ -0,0 +1,194 @@
+"""
+Exception-free validation and normalization of DIGIPIN strings.
+
+`is_valid` answers whether `Digipin.get_lat_lng_from_digipin` would accept a
+pin, and `normalize` / `validate_many` clean up user input (lowercase, stray
+spaces, odd hyphenation) into the canonical "XXX-XXX-XXXX" form. Bad rows are
+reported with status codes instead of exceptions, so dirty feeds cost no more
+than clean ones.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Optional, Tuple
+
+from .core import DIGIPIN_GRID, DIGIPIN_LENGTH, _check_precision, format_digipin
+
+# Per-row status codes; the first three match `digipin.vectorized.DECODE_*`.
+VALID = 0
+INVALID_LENGTH = 1  # get_lat_lng_from_digipin would raise InvalidDigipinError
+INVALID_CHAR = 2  # get_lat_lng_from_digipin would raise InvalidDigipinCharError
+INVALID_TYPE = 3  # Not a string or bytes at all (None, NaN, numbers, ...)
+
+_VALID_CHARS = frozenset(char for row in DIGIPIN_GRID for char in row)
+
+# Characters dropped by `normalize`: hyphens and whitespace
+_SEPARATORS = "- \t\n\r\f\v"
+_STRIP_TABLE = str.maketrans("", "", _SEPARATORS)
+
+
+@dataclass(frozen=True)
+class ValidatedDigipins:
+    """
+    A dataclass holding the result of `validate_many`.
+
+    Attributes:
+        status (list | numpy.ndarray): Per-row status code, one of `VALID`,
+                                       `INVALID_LENGTH`, `INVALID_CHAR` or `INVALID_TYPE`.
+        normalized (list | numpy.ndarray): The canonical hyphenated form of each valid
+                                           row; None (or "" in an array) otherwise.
+    """
+
+    status: Any
+    normalized: Any
+
+    @property
+    def valid(self) -> Any:
+        """Per-row booleans (a list, or a boolean array for array input)."""
+        if isinstance(self.status, list):
+            return [code == VALID for code in self.status]
+        return self.status == VALID
+
+
+def is_valid(digi_pin: Any, precision: int = DIGIPIN_LENGTH) -> bool:
+    """
+    Checks whether a DIGIPIN would be accepted by `get_lat_lng_from_digipin`.
+
+    The check is strict: hyphens are ignored but case and whitespace are not.
+    Use `normalize` to accept dirty input.
+
+    Args:
+        digi_pin (Any): The value to check.
+        precision (int): Expected number of characters (excluding hyphens), from 1 to 10.
+
+    Returns:
+        bool: True if the pin decodes without error.
+
+    Raises:
+        InvalidPrecisionError: If precision is not between 1 and 10.
+    """
+    if precision != DIGIPIN_LENGTH:
+        _check_precision(precision)
+    if not isinstance(digi_pin, str):
+        return False
+    pin_cleaned = digi_pin.replace("-", "")
+    return len(pin_cleaned) == precision and _VALID_CHARS.issuperset(pin_cleaned)
+
+
+def normalize(digi_pin: Any, precision: int = DIGIPIN_LENGTH) -> Optional[str]:
+    """
+    Cleans a user-supplied DIGIPIN into its canonical hyphenated form.
+
+    Whitespace and hyphens anywhere in the string, and trailing NUL padding, are
+    dropped and ASCII letters are upper-cased before the pin is checked. Any
+    other character, including an embedded NUL or a non-ASCII letter, is invalid.
+
+    Args:
+        digi_pin (Any): The value to normalize, e.g. " 2tf j7f-86mm ". Bytes are
+                        read as ASCII.
+        precision (int): Expected number of characters (excluding separators), from 1 to 10.
+
+    Returns:
+        Optional[str]: The canonical DIGIPIN (e.g. "2TF-J7F-86MM"), or None if the
+                       value cannot be turned into a valid pin.
+
+    Raises:
+        InvalidPrecisionError: If precision is not between 1 and 10.
+    """
+    if precision != DIGIPIN_LENGTH:
+        _check_precision(precision)
+    return _classify(digi_pin, precision)[1]
+
+
+def validate_many(pins: Iterable[Any], precision: int = DIGIPIN_LENGTH) -> ValidatedDigipins:
+    """
+    Normalizes and validates many DIGIPINs without raising per row.
+
+    Args:
+        pins (Iterable | numpy.ndarray): The values to check. A NumPy `str` or
+                                         `bytes` array is processed in one
+                                         vectorized pass, with the same results
+                                         as for a list of its elements.
+        precision (int): Expected number of characters (excluding separators), from 1 to 10.
+
+    Returns:
+        ValidatedDigipins: Status codes and canonical forms, as lists, or as arrays
+                           shaped like the input when `pins` is a NumPy string array.
+
+    Raises:
+        InvalidPrecisionError: If precision is not between 1 and 10.
+    """
+    _check_precision(precision)
+    dtype = getattr(pins, "dtype", None)
+    if dtype is not None and dtype.kind in ("U", "S"):
+        return _validate_array(pins, precision)
+
+    status: List[int] = []
+    normalized: List[Optional[str]] = []
+    for digi_pin in pins:
+        code, pin = _classify(digi_pin, precision)
+        status.append(code)
+        normalized.append(pin)
+    return ValidatedDigipins(status=status, normalized=normalized)
+
+
+def _classify(digi_pin: Any, precision: int) -> Tuple[int, Optional[str]]:
+    """Returns the status code and canonical form (or None) of one value."""
+    if isinstance(digi_pin, bytes):
+        digi_pin = digi_pin.decode("ascii", "replace")
+    elif not isinstance(digi_pin, str):
+        return INVALID_TYPE, None
+    pin_cleaned = digi_pin.rstrip("\x00").translate(_STRIP_TABLE)
+    if len(pin_cleaned) != precision:
+        return INVALID_LENGTH, None
+    # Only ASCII is upper-cased: str.upper() can change the length of other text
+    if not pin_cleaned.isascii():
+        return INVALID_CHAR, None
+    pin_cleaned = pin_cleaned.upper()
+    if not _VALID_CHARS.issuperset(pin_cleaned):
+        return INVALID_CHAR, None
+    return VALID, format_digipin(pin_cleaned)
+
+
+def _validate_array(pins, precision: int) -> ValidatedDigipins:
+    """Vectorized `validate_many` over a NumPy `str` or `bytes` array."""
+    import numpy as np
+
+    from .vectorized import _CHAR_POSITIONS, _HYPHEN_POSITIONS, _REVERSE_ROW, _to_codepoints
+
+    shape = pins.shape
+    codepoints = _to_codepoints(pins.ravel()).copy()
+    n = codepoints.shape[0]
+
+    # Upper-case ASCII letters, then drop separators and fixed-width NUL padding.
+    # Only trailing NULs are padding; an embedded NUL fails the character check.
+    lower = (codepoints >= ord("a")) & (codepoints <= ord("z"))
+    codepoints[lower] -= ord("a") - ord("A")
+    keep = codepoints != 0
+    if codepoints.shape[1]:
+        ends = np.where(
+            keep.any(axis=1), codepoints.shape[1] - np.argmax(keep[:, ::-1], axis=1), 0
+        )
+        keep = np.arange(codepoints.shape[1]) < ends[:, None]
+    for separator in _SEPARATORS:
+        keep &= codepoints != ord(separator)
+    length_ok = keep.sum(axis=1) == precision
+    keep &= length_ok[:, None]
+
+    src_rows, src_cols = np.nonzero(keep)
+    dest_cols = np.cumsum(keep, axis=1)[src_rows, src_cols] - 1
+    chars = np.zeros((n, precision), dtype=np.uint32)
+    chars[src_rows, dest_cols] = codepoints[src_rows, src_cols]
+    char_ok = (_REVERSE_ROW[np.minimum(chars, 127)] >= 0).all(axis=1)
+
+    status = np.full(n, VALID, dtype=np.uint8)
+    status[~char_ok] = INVALID_CHAR
+    status[~length_ok] = INVALID_LENGTH
+
+    positions = _CHAR_POSITIONS[:precision]
+    width = positions[-1] + 1
+    canonical = np.zeros((n, width), dtype=np.uint32)
+    canonical[:, list(positions)] = chars
+    canonical[:, [pos for pos in _HYPHEN_POSITIONS if pos < width]] = ord("-")
+    canonical[status != VALID] = 0
+    normalized = canonical.view(f"U{width}").reshape(shape)
+    return ValidatedDigipins(status=status.reshape(shape), normalized=normalized)
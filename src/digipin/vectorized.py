@@ -0,0 +1,314 @@
+"""
+NumPy-vectorized batch encoding and decoding of DIGIPINs.
+
+The functions in this module apply exactly the same floating point operations
+as `Digipin.get_digipin` and `Digipin.get_lat_lng_from_digipin`, one grid level
+at a time, but over whole arrays instead of a single value. NumPy is an
+optional dependency of this package; install it with
+``pip install digipin-python[numpy]``.
+"""
+
+from typing import Tuple, Union
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - exercised only without numpy
+    raise ImportError(
+        "digipin.vectorized requires NumPy. "
+        "Install it with `pip install digipin-python[numpy]`."
+    ) from exc
+
+from .core import BOUNDS, DIGIPIN_GRID, DIGIPIN_LENGTH, _check_coordinates, _check_precision
+from .model import (  # noqa: F401 - re-exported
+    DECODE_INVALID_CHAR,
+    DECODE_INVALID_LENGTH,
+    DECODE_NULL,
+    DECODE_OK,
+    DecodedDigipins,
+)
+
+# Unicode code points of the grid characters, indexed as [row_idx, col_idx]
+_GRID_CODEPOINTS = np.array(
+    [[ord(char) for char in row] for row in DIGIPIN_GRID], dtype=np.uint32
+)
+
+# Column of each level's character inside the hyphenated "XXX-XXX-XXXX" form
+_CHAR_POSITIONS = (0, 1, 2, 4, 5, 6, 8, 9, 10, 11)
+_HYPHEN_POSITIONS = (3, 7)
+
+# Maps an ASCII code point to its grid row/column; -1 marks characters outside the grid.
+# Code points above 127 are clamped onto DEL (127), which is never a grid character.
+_REVERSE_ROW = np.full(128, -1, dtype=np.int8)
+_REVERSE_COL = np.full(128, -1, dtype=np.int8)
+for _r_idx, _row in enumerate(DIGIPIN_GRID):
+    for _c_idx, _char in enumerate(_row):
+        _REVERSE_ROW[ord(_char)] = _r_idx
+        _REVERSE_COL[ord(_char)] = _c_idx
+
+
+def encode_many(
+    lats, lons, return_invalid: bool = False, precision: int = DIGIPIN_LENGTH
+) -> Union["np.ndarray", Tuple["np.ndarray", "np.ndarray"]]:
+    """
+    Encodes arrays of latitudes and longitudes into DIGIPIN strings.
+
+    Args:
+        lats (array_like): Latitudes in decimal degrees. Any object accepted by
+                           `numpy.asarray` (lists, buffers, arrays) can be used.
+        lons (array_like): Longitudes in decimal degrees, with the same shape as `lats`.
+        return_invalid (bool): If True, out-of-range rows do not raise. They are
+                               encoded as empty strings and flagged in the returned mask.
+        precision (int): Number of grid levels to encode, from 1 to 10.
+
+    Returns:
+        numpy.ndarray: A fixed-width string array (`<U12` at full precision) of
+                       DIGIPINs with the same shape as the input, identical to
+                       calling `Digipin.get_digipin` on each row.
+        When `return_invalid` is True, a tuple `(pins, invalid)` is returned where
+        `invalid` is a boolean array marking rows outside the defined bounds.
+
+    Raises:
+        ValueError: If `lats` and `lons` have different shapes.
+        LatitudeOutOfRangeError: If a latitude is outside the defined bounds
+                                 and `return_invalid` is False.
+        LongitudeOutOfRangeError: If a longitude is outside the defined bounds
+                                  and `return_invalid` is False.
+        InvalidPrecisionError: If precision is not between 1 and 10.
+    """
+    _check_precision(precision)
+    lat = np.asarray(lats, dtype=np.float64)
+    lon = np.asarray(lons, dtype=np.float64)
+    if lat.shape != lon.shape:
+        raise ValueError(
+            "Latitude and longitude arrays must have the same shape, "
+            f"got {lat.shape} and {lon.shape}."
+        )
+    shape = lat.shape
+    lat = lat.ravel()
+    lon = lon.ravel()
+
+    codepoints, invalid = _encode_rows(lat, lon, precision)
+    if not return_invalid:
+        _raise_first_invalid(lat, lon, invalid)
+    pins = codepoints.view(f"U{codepoints.shape[1]}").reshape(shape)
+
+    if return_invalid:
+        return pins, invalid.reshape(shape)
+    return pins
+
+
+def _encode_rows(
+    lat: "np.ndarray", lon: "np.ndarray", precision: int = DIGIPIN_LENGTH
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Encodes 1-D coordinate arrays, blanking rows outside the defined bounds.
+
+    Returns the `(n, width)` code point matrix of `_encode_codepoints`, with
+    all-zero rows for out-of-range coordinates, and the boolean invalid mask.
+    """
+    # NaN compares False against both bounds, exactly like the scalar check.
+    invalid = ~((BOUNDS.min_lat <= lat) & (lat <= BOUNDS.max_lat))
+    invalid |= ~((BOUNDS.min_lon <= lon) & (lon <= BOUNDS.max_lon))
+    if invalid.any():
+        # Park invalid rows on a valid point so the arithmetic stays finite.
+        lat = np.where(invalid, BOUNDS.min_lat, lat)
+        lon = np.where(invalid, BOUNDS.min_lon, lon)
+
+    codepoints = _encode_codepoints(lat, lon, precision)
+    codepoints[invalid] = 0
+    return codepoints, invalid
+
+
+def _raise_first_invalid(lat: "np.ndarray", lon: "np.ndarray", invalid: "np.ndarray") -> None:
+    """Re-runs the scalar check on the first bad row so the error matches get_digipin."""
+    if invalid.any():
+        first = int(np.argmax(invalid))
+        _check_coordinates(float(lat[first]), float(lon[first]))
+
+
+def _encode_codepoints(
+    lat: "np.ndarray", lon: "np.ndarray", precision: int = DIGIPIN_LENGTH
+) -> "np.ndarray":
+    """
+    Runs the level-by-level subdivision over 1-D coordinate arrays.
+
+    Returns a `(n, width)` uint32 array holding the code points of the hyphenated
+    DIGIPIN of each row, ready to be viewed as a `U<width>` string array.
+    """
+    positions = _CHAR_POSITIONS[:precision]
+    width = positions[-1] + 1
+    n = lat.shape[0]
+    current_min_lat = np.full(n, BOUNDS.min_lat)
+    current_max_lat = np.full(n, BOUNDS.max_lat)
+    current_min_lon = np.full(n, BOUNDS.min_lon)
+    current_max_lon = np.full(n, BOUNDS.max_lon)
+
+    codepoints = np.empty((n, width), dtype=np.uint32)
+    codepoints[:, [pos for pos in _HYPHEN_POSITIONS if pos < width]] = ord("-")
+
+    for position in positions:
+        lat_div = (current_max_lat - current_min_lat) / 4
+        lon_div = (current_max_lon - current_min_lon) / 4
+
+        row_idx = 3 - np.floor((lat - current_min_lat) / lat_div)
+        col_idx = np.floor((lon - current_min_lon) / lon_div)
+
+        # Ensure indices are within bounds [0, 3]
+        np.clip(row_idx, 0, 3, out=row_idx)
+        np.clip(col_idx, 0, 3, out=col_idx)
+
+        codepoints[:, position] = _GRID_CODEPOINTS[
+            row_idx.astype(np.intp), col_idx.astype(np.intp)
+        ]
+
+        new_max_lat = current_min_lat + lat_div * (4 - row_idx)
+        new_min_lat = current_min_lat + lat_div * (3 - row_idx)
+
+        current_min_lat = new_min_lat
+        current_max_lat = new_max_lat
+
+        current_min_lon = current_min_lon + lon_div * col_idx
+        current_max_lon = current_min_lon + lon_div
+
+    return codepoints
+
+
+def decode_many(
+    pins, return_bounds: bool = False, precision: int = DIGIPIN_LENGTH
+) -> DecodedDigipins:
+    """
+    Decodes an array of DIGIPINs back into their central latitudes and longitudes.
+
+    Hyphens are ignored, as in `Digipin.get_lat_lng_from_digipin`. Invalid pins
+    never raise; they are reported through the per-row `errors` code and their
+    coordinates are NaN.
+
+    Args:
+        pins (array_like): DIGIPIN strings, as a sequence or a NumPy `str`/`bytes` array.
+        return_bounds (bool): If True, also return the bounding box of every cell.
+        precision (int): Expected number of characters (excluding hyphens), from 1 to 10.
+
+    Returns:
+        DecodedDigipins: Coordinate arrays and error codes, shaped like the input.
+
+    Raises:
+        InvalidPrecisionError: If precision is not between 1 and 10.
+    """
+    _check_precision(precision)
+    arr = np.asarray(pins)
+    if arr.dtype.kind not in ("U", "S"):
+        arr = arr.astype(str)
+    return _decode_codepoints(_to_codepoints(arr.ravel()), arr.shape, return_bounds, precision)
+
+
+def _decode_codepoints(
+    codepoints: "np.ndarray", shape: Tuple[int, ...], return_bounds: bool, precision: int
+) -> DecodedDigipins:
+    """
+    Decodes a `(n, width)` matrix of character codes, NUL-padded on the right.
+
+    Any unsigned integer dtype works, so raw UTF-8 bytes can be decoded in place.
+    """
+    n = codepoints.shape[0]
+
+    # Drop hyphens and the NUL padding of fixed-width strings, keeping character order.
+    # Only trailing NULs are padding: a NUL before the last character is kept and
+    # fails the character check, as it does in the scalar decoder.
+    keep = codepoints != 0
+    if codepoints.shape[1]:
+        ends = np.where(
+            keep.any(axis=1), codepoints.shape[1] - np.argmax(keep[:, ::-1], axis=1), 0
+        )
+        keep = np.arange(codepoints.shape[1]) < ends[:, None]
+    keep &= codepoints != ord("-")
+    lengths = keep.sum(axis=1)
+    length_ok = lengths == precision
+    keep &= length_ok[:, None]
+    src_rows, src_cols = np.nonzero(keep)
+    dest_cols = np.cumsum(keep, axis=1)[src_rows, src_cols] - 1
+    chars = np.zeros((n, precision), dtype=np.uint32)
+    chars[src_rows, dest_cols] = codepoints[src_rows, src_cols]
+
+    lookup = np.minimum(chars, 127)
+    row_idx = _REVERSE_ROW[lookup]
+    col_idx = _REVERSE_COL[lookup]
+    char_ok = (row_idx >= 0).all(axis=1)
+
+    errors = np.full(n, DECODE_OK, dtype=np.uint8)
+    errors[~char_ok] = DECODE_INVALID_CHAR
+    errors[~length_ok] = DECODE_INVALID_LENGTH
+    invalid = errors != DECODE_OK
+    row_idx[invalid] = 0
+    col_idx[invalid] = 0
+
+    min_lat, max_lat, min_lon, max_lon = _decode_bounds(
+        row_idx.astype(np.float64), col_idx.astype(np.float64)
+    )
+    latitude = np.round((min_lat + max_lat) / 2, 6)
+    longitude = np.round((min_lon + max_lon) / 2, 6)
+    latitude[invalid] = np.nan
+    longitude[invalid] = np.nan
+
+    bounds = {}
+    if return_bounds:
+        for name, values in (
+            ("min_lat", min_lat),
+            ("max_lat", max_lat),
+            ("min_lon", min_lon),
+            ("max_lon", max_lon),
+        ):
+            values[invalid] = np.nan
+            bounds[name] = values.reshape(shape)
+
+    return DecodedDigipins(
+        latitude=latitude.reshape(shape),
+        longitude=longitude.reshape(shape),
+        errors=errors.reshape(shape),
+        **bounds,
+    )
+
+
+def _to_codepoints(arr: "np.ndarray") -> "np.ndarray":
+    """Views a 1-D `str` or `bytes` array as a `(n, width)` uint32 code point matrix."""
+    n = arr.shape[0]
+    width = arr.dtype.itemsize // (4 if arr.dtype.kind == "U" else 1)
+    if width == 0:
+        return np.zeros((n, 0), dtype=np.uint32)
+    if arr.dtype.kind == "U":
+        return np.ascontiguousarray(arr).view(np.uint32).reshape(n, width)
+    return np.ascontiguousarray(arr).view(np.uint8).reshape(n, width).astype(np.uint32)
+
+
+def _decode_bounds(
+    row_idx: "np.ndarray", col_idx: "np.ndarray"
+) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]:
+    """
+    Narrows the bounds level by level from `(n, levels)` grid row/column indices.
+
+    Returns the `(min_lat, max_lat, min_lon, max_lon)` arrays of the final cells.
+    """
+    n = row_idx.shape[0]
+    current_min_lat = np.full(n, BOUNDS.min_lat)
+    current_max_lat = np.full(n, BOUNDS.max_lat)
+    current_min_lon = np.full(n, BOUNDS.min_lon)
+    current_max_lon = np.full(n, BOUNDS.max_lon)
+
+    for level in range(row_idx.shape[1]):
+        row = row_idx[:, level]
+        col = col_idx[:, level]
+
+        lat_div = (current_max_lat - current_min_lat) / 4
+        lon_div = (current_max_lon - current_min_lon) / 4
+
+        new_min_lat = current_max_lat - lat_div * (row + 1)
+        new_max_lat = current_max_lat - lat_div * row
+
+        new_min_lon = current_min_lon + lon_div * col
+        new_max_lon = current_min_lon + lon_div * (col + 1)
+
+        current_min_lat = new_min_lat
+        current_max_lat = new_max_lat
+        current_min_lon = new_min_lon
+        current_max_lon = new_max_lon
+
+    return current_min_lat, current_max_lat, current_min_lon, current_max_lon
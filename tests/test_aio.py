@@ -0,0 +1,149 @@
+import asyncio
+import random
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from digipin.aio import AsyncDigipin
+from digipin.core import BOUNDS, Digipin
+from digipin.error import (
+    InvalidDigipinCharError,
+    InvalidDigipinError,
+    LatitudeOutOfRangeError,
+    LongitudeOutOfRangeError,
+)
+from digipin.metrics import Metrics
+
+
+def _points(count: int):
+    rng = random.Random(5)
+    return [
+        (rng.uniform(BOUNDS.min_lat, BOUNDS.max_lat), rng.uniform(BOUNDS.min_lon, BOUNDS.max_lon))
+        for _ in range(count)
+    ]
+
+
+async def _gather(coroutines):
+    return await asyncio.gather(*coroutines, return_exceptions=True)
+
+
+class TestAsyncDigipin(unittest.TestCase):
+    def setUp(self):
+        self.handler = Digipin()
+
+    def test_concurrent_calls_share_batches(self):
+        """Concurrent calls are coalesced and each gets the scalar result."""
+        points = _points(50)
+        service = AsyncDigipin(max_batch_size=16, max_wait=0.05)
+
+        async def run():
+            pins = await _gather(service.encode(lat, lon) for lat, lon in points)
+            coords = await _gather(service.decode(pin) for pin in pins)
+            return pins, coords
+
+        pins, coords = asyncio.run(run())
+        self.assertEqual(pins, [self.handler.get_digipin(lat, lon) for lat, lon in points])
+        self.assertEqual(coords, [self.handler.get_lat_lng_from_digipin(pin) for pin in pins])
+
+        stats = service.stats()["encode"]
+        self.assertEqual((stats.batches, stats.items, stats.largest_batch), (4, 50, 16))
+        self.assertEqual(stats.max_queue_depth, 16)
+        self.assertEqual(stats.queue_depth, 0)
+        self.assertAlmostEqual(stats.mean_batch_size, 12.5)
+        self.assertEqual(service.queue_depth, 0)
+
+    def test_errors_are_per_call(self):
+        """A bad call fails alone with the scalar exception."""
+        service = AsyncDigipin(max_wait=0.01)
+
+        async def run():
+            return await _gather(
+                [
+                    service.encode(22.5726, 88.3639),
+                    service.encode(45.0, 80.0),
+                    service.encode(20.0, 100.0),
+                    service.decode("2TF-J7F-86MM"),
+                    service.decode("2TF-J7F"),
+                    service.decode("2TF-J7F-86MA"),
+                ]
+            )
+
+        results = asyncio.run(run())
+        self.assertEqual(results[0], "2TF-J7F-86MM")
+        self.assertIsInstance(results[1], LatitudeOutOfRangeError)
+        self.assertIsInstance(results[2], LongitudeOutOfRangeError)
+        self.assertEqual(results[3], self.handler.get_lat_lng_from_digipin("2TF-J7F-86MM"))
+        self.assertIsInstance(results[4], InvalidDigipinError)
+        self.assertIsInstance(results[5], InvalidDigipinCharError)
+
+    def test_uses_configured_handler(self):
+        """Batches go through the handler's batch methods, metrics and cache."""
+        metrics = Metrics()
+        handler = Digipin(backend="python", metrics=metrics)
+        service = AsyncDigipin(max_wait=0.01, digipin=handler)
+
+        async def run(service):
+            return await _gather(
+                [service.encode(22.5726, 88.3639), service.encode(45.0, 80.0)]
+                + [service.decode("2TF-J7F-86MM"), service.decode("2TF")]
+            )
+
+        results = asyncio.run(run(service))
+        self.assertEqual(results[0], "2TF-J7F-86MM")
+        self.assertIsInstance(results[1], LatitudeOutOfRangeError)
+        self.assertIsInstance(results[3], InvalidDigipinError)
+        snapshot = metrics.snapshot()
+        self.assertEqual((snapshot["encode_many"].calls, snapshot["encode_many"].items), (1, 2))
+        self.assertEqual(snapshot["encode_many"].errors, {"LatitudeOutOfRangeError": 1})
+        self.assertEqual(snapshot["decode_many"].calls, 1)
+        self.assertNotIn("get_digipin", snapshot)
+
+        cached = Digipin(cache_size=8)
+        service = AsyncDigipin(max_wait=0.01, digipin=cached)
+        asyncio.run(run(service))
+        asyncio.run(run(service))
+        stats = cached.cache_stats()
+        self.assertEqual((stats["encode"].hits, stats["decode"].hits), (1, 1))
+
+    def test_nul_characters_match_scalar(self):
+        """Pins holding NUL fail exactly as get_lat_lng_from_digipin does."""
+        service = AsyncDigipin(max_wait=0.01)
+        pins = ["2TF-J7F-86MM\x00", "2TF\x00J7F-86M", "2TF-J7F-86M\x00"]
+
+        async def run():
+            return await _gather(service.decode(pin) for pin in pins)
+
+        for pin, result in zip(pins, asyncio.run(run())):
+            with self.assertRaises(type(result)):
+                self.handler.get_lat_lng_from_digipin(pin)
+
+    def test_executor_and_precision(self):
+        """Batches can run in an executor, at a lower precision."""
+        points = _points(10)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            service = AsyncDigipin(max_batch_size=4, executor=executor, precision=4)
+
+            async def run():
+                return await _gather(service.encode(lat, lon) for lat, lon in points)
+
+            pins = asyncio.run(run())
+        self.assertEqual(
+            pins, [self.handler.get_digipin(lat, lon, precision=4) for lat, lon in points]
+        )
+
+    def test_flush_dispatches_without_waiting(self):
+        service = AsyncDigipin(max_wait=60)
+
+        async def run():
+            task = asyncio.ensure_future(service.encode(22.5726, 88.3639))
+            await asyncio.sleep(0)
+            self.assertEqual(service.queue_depth, 1)
+            service.flush()
+            return await asyncio.wait_for(task, timeout=5)
+
+        self.assertEqual(asyncio.run(run()), "2TF-J7F-86MM")
+
+    def test_invalid_settings(self):
+        with self.assertRaises(ValueError):
+            AsyncDigipin(max_batch_size=0)
+        with self.assertRaises(ValueError):
+            AsyncDigipin(max_wait=-1)
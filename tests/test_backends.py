@@ -0,0 +1,236 @@
+import math
+import os
+import random
+import subprocess
+import sys
+import unittest
+from unittest import mock
+
+from digipin import backends
+from digipin.backends import (
+    BACKEND_ENV_VAR,
+    Backend,
+    PythonBackend,
+    available_backends,
+    get_backend,
+    register_backend,
+)
+from digipin.core import Digipin
+from digipin.error import LatitudeOutOfRangeError, LongitudeOutOfRangeError
+from digipin.metrics import Metrics
+from digipin.model import DECODE_INVALID_CHAR, DECODE_INVALID_LENGTH, DECODE_OK
+
+
+def _flat(values):
+    return values.ravel().tolist() if hasattr(values, "ravel") else list(values)
+
+
+def _describe(values):
+    """Type, dtype and shape of a batch result, for comparing backends."""
+    return (
+        type(values).__name__,
+        str(getattr(values, "dtype", None)),
+        getattr(values, "shape", None),
+    )
+
+
+class TestBackendConformance(unittest.TestCase):
+    """Every available backend must match the scalar reference implementation."""
+
+    def setUp(self):
+        self.reference = Digipin()
+        rng = random.Random(20)
+        self.points = [(rng.uniform(2.5, 38.5), rng.uniform(63.5, 99.5)) for _ in range(500)]
+        # Grid edges and cell boundaries, where floating point rounding matters.
+        self.points += [(2.5, 63.5), (38.5, 99.5), (2.5, 99.5), (38.5, 63.5), (20.5, 81.5)]
+        self.points += [(2.5 + 36 * k / 4**5, 63.5 + 36 * k / 4**5) for k in range(0, 4**5, 37)]
+
+    def test_backends_registered(self):
+        """The reference and NumPy backends are known; the reference always loads."""
+        names = backends.backend_names()
+        self.assertIn("python", names)
+        self.assertIn("numpy", names)
+        self.assertIn("python", available_backends())
+
+    def test_encode_matches_reference(self):
+        lats = [lat for lat, _ in self.points]
+        lons = [lon for _, lon in self.points]
+        for name in available_backends():
+            backend = get_backend(name)
+            for precision in (1, 4, 7, 10):
+                with self.subTest(backend=name, precision=precision):
+                    expected = [
+                        self.reference.get_digipin(lat, lon, precision)
+                        for lat, lon in self.points
+                    ]
+                    pins = backend.encode_many(lats, lons, precision=precision)
+                    self.assertEqual(_flat(pins), expected)
+
+    def test_encode_invalid_rows(self):
+        lats = [22.5, 50.0, 22.5, float("nan")]
+        lons = [88.3, 88.3, 120.0, 88.3]
+        for name in available_backends():
+            backend = get_backend(name)
+            with self.subTest(backend=name):
+                pins, invalid = backend.encode_many(lats, lons, return_invalid=True)
+                self.assertEqual(_flat(invalid), [False, True, True, True])
+                self.assertEqual(_flat(pins)[1:], ["", "", ""])
+                with self.assertRaises(LatitudeOutOfRangeError):
+                    backend.encode_many(lats, lons)
+                with self.assertRaises(LongitudeOutOfRangeError):
+                    backend.encode_many(lats[2:3], lons[2:3])
+
+    def test_decode_matches_reference(self):
+        pins = [self.reference.get_digipin(lat, lon) for lat, lon in self.points]
+        pins += ["2TF", "2TF-J7F-86MA", "", "2tf-j7f-86mm"]
+        for name in available_backends():
+            backend = get_backend(name)
+            with self.subTest(backend=name):
+                decoded = backend.decode_many(pins, return_bounds=True)
+                errors = _flat(decoded.errors)
+                self.assertEqual(
+                    errors[-4:],
+                    [
+                        DECODE_INVALID_LENGTH,
+                        DECODE_INVALID_CHAR,
+                        DECODE_INVALID_LENGTH,
+                        DECODE_INVALID_CHAR,
+                    ],
+                )
+                self.assertTrue(math.isnan(_flat(decoded.latitude)[-1]))
+                for row, pin in enumerate(pins[:-4]):
+                    self.assertEqual(errors[row], DECODE_OK)
+                    expected = self.reference.get_lat_lng_from_digipin(pin)
+                    self.assertEqual(_flat(decoded.latitude)[row], expected.latitude)
+                    self.assertEqual(_flat(decoded.longitude)[row], expected.longitude)
+                    cell = self.reference.get_cell(pin)
+                    self.assertEqual(_flat(decoded.min_lat)[row], cell.bounds.min_lat)
+                    self.assertEqual(_flat(decoded.max_lon)[row], cell.bounds.max_lon)
+                self.assertEqual(_flat(decoded.valid), [code == DECODE_OK for code in errors])
+
+    def test_same_result_types(self):
+        """Backends return the same types, dtypes and shapes for the same input."""
+        lats = [[22.5726, None, 50.0], [28.6139, 19.0760, 12.9716]]
+        lons = [[88.3639, 77.2, 77.2], [77.2090, 72.8777, 77.5946]]
+        pins = [["2TF-J7F-86MM", "2TF", b"2TF-J7F-86MM"], ["2TF\x00J7F-86MM", "2TF-J7F-86MÀ", 5]]
+        reference = get_backend("python")
+        if reference._np is None:
+            # Without NumPy, batch inputs and results are flat sequences.
+            lats, lons, pins = (
+                [value for row in rows for value in row] for rows in (lats, lons, pins)
+            )
+        for name in available_backends():
+            backend = get_backend(name)
+            with self.subTest(backend=name):
+                for precision in (2, 10):
+                    expected = reference.encode_many(lats, lons, True, precision)
+                    result = backend.encode_many(lats, lons, True, precision)
+                    self.assertEqual(_describe(result), _describe(expected))
+                    self.assertEqual(_flat(result[0]), _flat(expected[0]))
+                    self.assertEqual(_flat(result[1]), _flat(expected[1]))
+                decoded = backend.decode_many(pins, return_bounds=True)
+                expected = reference.decode_many(pins, return_bounds=True)
+                for field in ("latitude", "longitude", "errors", "min_lat", "max_lon"):
+                    self.assertEqual(
+                        _describe(getattr(decoded, field)), _describe(getattr(expected, field))
+                    )
+                self.assertEqual(_flat(decoded.errors), _flat(expected.errors))
+                self.assertEqual(
+                    _flat(decoded.errors),
+                    [DECODE_OK, DECODE_INVALID_LENGTH, DECODE_OK]
+                    + [DECODE_INVALID_LENGTH, DECODE_INVALID_CHAR, DECODE_INVALID_LENGTH],
+                )
+                self.assertIsNone(backend.decode_many(pins).min_lat)
+                with self.assertRaises(LatitudeOutOfRangeError):
+                    backend.encode_many([22.5, None], [88.3, 88.3])
+                with self.assertRaises(ValueError):
+                    backend.encode_many([22.5, "north"], [88.3, 88.3])
+                with self.assertRaises(ValueError):
+                    backend.encode_many([22.5, 22.5], [88.3])
+
+    def test_python_backend_without_numpy(self):
+        """Where NumPy is not installed, the reference backend returns flat lists."""
+        backend = PythonBackend()
+        backend._np = None
+        pins, invalid = backend.encode_many((22.5726, None), (88.3639, 88.0), True)
+        self.assertEqual((pins, invalid), (["2TF-J7F-86MM", ""], [False, True]))
+        decoded = backend.decode_many(["2TF-J7F-86MM", None, b"2TF-J7F-86MM"])
+        self.assertEqual(decoded.errors, [DECODE_OK, DECODE_INVALID_LENGTH, DECODE_OK])
+        self.assertEqual(decoded.valid, [True, False, True])
+        with self.assertRaises(LatitudeOutOfRangeError):
+            backend.encode_many([None], [88.3])
+
+
+class TestBackendSelection(unittest.TestCase):
+    def tearDown(self):
+        backends._registry.pop("test", None)
+        backends._instances.pop("test", None)
+        backends._instances.pop("auto", None)
+
+    def test_explicit_and_env_selection(self):
+        """The argument wins over the environment variable."""
+        self.assertEqual(Digipin(backend="python").backend, "python")
+        pins = Digipin(backend="python").encode_many([22.5726], [88.3639])
+        self.assertEqual(_flat(pins), ["2TF-J7F-86MM"])
+        with mock.patch.dict(os.environ, {BACKEND_ENV_VAR: "python"}):
+            self.assertEqual(Digipin().backend, "python")
+        with self.assertRaises(ValueError):
+            Digipin(backend="no-such-backend")
+
+    def test_auto_prefers_highest_priority(self):
+        """Automatic selection skips backends that fail to import."""
+
+        class FastBackend(PythonBackend):
+            name = "test"
+
+        def unavailable():
+            raise ImportError("compiled kernel not built")
+
+        register_backend("test", unavailable, priority=100)
+        with mock.patch.dict(os.environ, {}, clear=True):
+            self.assertNotEqual(get_backend().name, "test")
+            register_backend("test", FastBackend, priority=100)
+            self.assertEqual(get_backend().name, "test")
+            self.assertEqual(Digipin().backend, "test")
+        with self.assertRaises(ValueError):
+            register_backend("auto", FastBackend)
+        self.assertTrue(issubclass(FastBackend, Backend))
+
+    def test_string_loader(self):
+        """Backends can be registered by import path and load lazily."""
+        register_backend("test", "digipin.backends:PythonBackend")
+        self.assertIsInstance(get_backend("test"), PythonBackend)
+
+    def test_metrics_on_python_backend(self):
+        """Batch metrics work on the reference backend."""
+        metrics = Metrics()
+        handler = Digipin(backend="python", metrics=metrics)
+        handler.encode_many([22.5, 50.0, 22.5], [88.3, 88.3, 120.0], return_invalid=True)
+        handler.decode_many(["2TF-J7F-86MM", "2TF"])
+        snapshot = metrics.snapshot()
+        self.assertEqual(
+            snapshot["encode_many"].errors,
+            {"LatitudeOutOfRangeError": 1, "LongitudeOutOfRangeError": 1},
+        )
+        self.assertEqual(snapshot["decode_many"].errors, {"InvalidDigipinError": 1})
+        self.assertEqual(snapshot["decode_many"].items, 2)
+
+    def test_import_is_lazy(self):
+        """Importing the package and scalar use load only core, model and error."""
+        code = (
+            "import sys, digipin\n"
+            "digipin.Digipin().get_digipin(22.5726, 88.3639)\n"
+            "print(sorted(m for m in sys.modules if m.split('.')[0] == 'digipin'))\n"
+            "print('numpy' in sys.modules)\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout.splitlines()
+        self.assertEqual(
+            output[0], str(["digipin", "digipin.core", "digipin.error", "digipin.model"])
+        )
+        self.assertEqual(output[1], "False")
+
+
+if __name__ == "__main__":
+    unittest.main()
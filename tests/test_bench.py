@@ -0,0 +1,65 @@
+import contextlib
+import importlib.util
+import io
+import os
+import unittest
+
+_BENCH_PATH = os.path.join(os.path.dirname(__file__), os.pardir, "benchmarks", "bench.py")
+_spec = importlib.util.spec_from_file_location("bench", _BENCH_PATH)
+bench = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(bench)
+
+
+def _results(**metrics):
+    return {
+        "metrics": {
+            name: bench._metric(value, "unit", better)
+            for name, (value, better) in metrics.items()
+        }
+    }
+
+
+class TestCompare(unittest.TestCase):
+    def compare(self, results, baseline, threshold=0.2):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            regressions = bench.compare(results, baseline, threshold)
+        return regressions, output.getvalue()
+
+    def test_threshold(self):
+        """Only changes past the threshold in the wrong direction are regressions."""
+        baseline = _results(
+            latency_slow=(100.0, bench.LOWER),
+            latency_ok=(100.0, bench.LOWER),
+            latency_faster=(100.0, bench.LOWER),
+            rate_slow=(1000.0, bench.HIGHER),
+            rate_ok=(1000.0, bench.HIGHER),
+            rate_faster=(1000.0, bench.HIGHER),
+        )
+        results = _results(
+            latency_slow=(125.0, bench.LOWER),
+            latency_ok=(119.0, bench.LOWER),
+            latency_faster=(50.0, bench.LOWER),
+            rate_slow=(750.0, bench.HIGHER),
+            rate_ok=(810.0, bench.HIGHER),
+            rate_faster=(5000.0, bench.HIGHER),
+        )
+        regressions, output = self.compare(results, baseline)
+        self.assertEqual(regressions, ["latency_slow", "rate_slow"])
+        self.assertEqual(output.count("REGRESSION"), 2)
+        regressions, _ = self.compare(results, baseline, threshold=0.3)
+        self.assertEqual(regressions, [])
+        regressions, _ = self.compare(results, baseline, threshold=0.1)
+        self.assertEqual(regressions, ["latency_ok", "latency_slow", "rate_ok", "rate_slow"])
+
+    def test_missing_metrics_are_skipped(self):
+        """Metrics new in the results, or zero in the baseline, are not compared."""
+        baseline = _results(latency=(0.0, bench.LOWER))
+        results = _results(latency=(10.0, bench.LOWER), rate=(1.0, bench.HIGHER))
+        regressions, output = self.compare(results, baseline)
+        self.assertEqual(regressions, [])
+        self.assertNotIn("rate", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+import random
+import threading
+import unittest
+
+from digipin.cache import LRUCache
+from digipin.core import BOUNDS, Digipin
+from digipin.error import InvalidDigipinCharError, LatitudeOutOfRangeError
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_eviction_order_and_counters(self):
+        """The least recently used entry is evicted first."""
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)  # "b" is now least recent
+        cache.put("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.evictions), (2, 1, 1))
+        self.assertEqual((stats.size, stats.maxsize), (2, 2))
+        self.assertAlmostEqual(stats.hit_rate, 2 / 3)
+
+    def test_ttl(self):
+        """Entries expire once they outlive the TTL."""
+        timer = FakeTimer()
+        cache = LRUCache(10, ttl=5, timer=timer)
+        cache.put("a", 1)
+        timer.now = 4.9
+        self.assertEqual(cache.get("a"), 1)
+        timer.now = 5.0
+        self.assertIsNone(cache.get("a"))
+        stats = cache.stats()
+        self.assertEqual((stats.expirations, stats.size), (1, 0))
+
+    def test_clear_and_validation(self):
+        cache = LRUCache(1)
+        cache.put("a", 1)
+        cache.get("a")
+        cache.clear()
+        self.assertEqual(cache.stats().hits, 0)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats().hit_rate, 0.0)
+        with self.assertRaises(ValueError):
+            LRUCache(0)
+        with self.assertRaises(ValueError):
+            LRUCache(1, ttl=0)
+
+    def test_concurrent_access(self):
+        """Counters stay consistent under concurrent access."""
+        cache = LRUCache(16)
+
+        def work():
+            for i in range(2000):
+                if cache.get(i % 32) is None:
+                    cache.put(i % 32, i)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = cache.stats()
+        self.assertEqual(stats.hits + stats.misses, 8000)
+        self.assertLessEqual(stats.size, 16)
+
+
+class TestDigipinCache(unittest.TestCase):
+    def test_results_match_uncached(self):
+        """Cached encoding and decoding return the same values as the plain loop."""
+        plain = Digipin()
+        cached = Digipin(cache_size=64)
+        rng = random.Random(3)
+        points = [
+            (
+                rng.uniform(BOUNDS.min_lat, BOUNDS.max_lat),
+                rng.uniform(BOUNDS.min_lon, BOUNDS.max_lon),
+            )
+            for _ in range(100)
+        ]
+        for _ in range(2):
+            for lat, lon in points:
+                pin = cached.get_digipin(lat, lon)
+                self.assertEqual(pin, plain.get_digipin(lat, lon))
+                self.assertEqual(cached.get_digipin(lat, lon, precision=4), pin[:5])
+                self.assertEqual(
+                    cached.get_lat_lng_from_digipin(pin), plain.get_lat_lng_from_digipin(pin)
+                )
+
+        stats = cached.cache_stats()
+        self.assertEqual(stats["encode"].size, 64)
+        self.assertGreater(stats["encode"].evictions, 0)
+        self.assertEqual(stats["decode"].misses, 200)
+
+    def test_hits_on_repeats(self):
+        """Repeated coordinates and pins are served from the cache, hyphens or not."""
+        handler = Digipin(cache_size=8)
+        handler.get_digipin(22.5726, 88.3639)
+        handler.get_digipin(22.5726, 88.3639)
+        handler.get_lat_lng_from_digipin("2TF-J7F-86MM")
+        handler.get_lat_lng_from_digipin("2TFJ7F86MM")
+        stats = handler.cache_stats()
+        self.assertEqual((stats["encode"].hits, stats["encode"].misses), (1, 1))
+        self.assertEqual((stats["decode"].hits, stats["decode"].misses), (1, 1))
+
+        handler.clear_cache()
+        self.assertEqual(handler.cache_stats()["encode"].size, 0)
+
+    def test_quantised_keys(self):
+        """With cache_decimals, nearby points share a cache entry."""
+        handler = Digipin(cache_size=8, cache_decimals=3)
+        first = handler.get_digipin(22.57261, 88.36391)
+        self.assertEqual(handler.get_digipin(22.57264, 88.36389), first)
+        self.assertEqual(handler.cache_stats()["encode"].hits, 1)
+
+    def test_errors_are_not_cached(self):
+        handler = Digipin(cache_size=8)
+        with self.assertRaises(LatitudeOutOfRangeError):
+            handler.get_digipin(45.0, 80.0)
+        with self.assertRaises(InvalidDigipinCharError):
+            handler.get_lat_lng_from_digipin("2TF-J7F-86MA")
+        with self.assertRaises(InvalidDigipinCharError):
+            handler.get_lat_lng_from_digipin("2TF-J7F-86MA")
+        self.assertEqual(handler.cache_stats()["decode"].size, 0)
+
+    def test_disabled_by_default(self):
+        self.assertEqual(Digipin().cache_stats(), {})
+        Digipin().clear_cache()
+        with self.assertRaises(ValueError):
+            Digipin(cache_size=-1)
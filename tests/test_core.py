@@ -4,9 +4,11 @@ from digipin.core import Digipin
 from digipin.error import (
     InvalidDigipinCharError,
     InvalidDigipinError,
+    InvalidPrecisionError,
     LatitudeOutOfRangeError,
     LongitudeOutOfRangeError,
 )
+from digipin.model import Coordinates
 
 
 # Mock DigipinBounds dataclass
@@ -168,3 +170,82 @@ class TestDigipin(unittest.TestCase):
                     self.assertAlmostEqual(decoded_coords.longitude, lon, places=4)
                 except Exception as e:
                     self.fail(f"Roundtrip failed for ({lat}, {lon}): {e}")
+
+    # --- Variable precision and cell geometry Tests ---
+
+    def test_get_digipin_precision_prefixes(self):
+        """Lower precisions return the hyphenated prefix of the full DIGIPIN."""
+        lat, lon = 22.5726, 88.3639
+        expected = {
+            1: "2",
+            3: "2TF",
+            4: "2TF-J",
+            6: "2TF-J7F",
+            7: "2TF-J7F-8",
+            10: "2TF-J7F-86MM",
+        }
+        for precision, pin in expected.items():
+            with self.subTest(precision=precision):
+                self.assertEqual(self.digipin_handler.get_digipin(lat, lon, precision), pin)
+
+    def test_get_digipin_invalid_precision(self):
+        """Precisions outside 1-10 are rejected."""
+        for precision in (0, 11, -1):
+            with self.assertRaises(InvalidPrecisionError):
+                self.digipin_handler.get_digipin(20.0, 80.0, precision=precision)
+
+    def test_get_lat_lng_from_digipin_partial(self):
+        """Partial pins decode to the centre of their coarser cell."""
+        decoded = self.digipin_handler.get_lat_lng_from_digipin("2TF-J", precision=4)
+        cell = self.digipin_handler.get_cell("2TF-J")
+        self.assertEqual(decoded.latitude, round(cell.center.latitude, 6))
+        self.assertEqual(decoded.longitude, round(cell.center.longitude, 6))
+        with self.assertRaises(InvalidDigipinError) as cm:
+            self.digipin_handler.get_lat_lng_from_digipin("2TF-J7", precision=4)
+        self.assertIn("Must be 4 alphanumeric characters", str(cm.exception))
+
+    def test_get_cell(self):
+        """Cells report their level, bounds, centre and size."""
+        cell = self.digipin_handler.get_cell("2")
+        self.assertEqual(cell.digipin, "2")
+        self.assertEqual(cell.level, 1)
+        self.assertEqual(cell.lat_size, 9.0)
+        self.assertEqual(cell.lon_size, 9.0)
+        self.assertEqual(cell.bounds.max_lat, 29.5)
+        self.assertEqual(cell.bounds.min_lon, 81.5)
+
+        cell = self.digipin_handler.get_cell("2TFJ7F86MM")
+        self.assertEqual(cell.digipin, "2TF-J7F-86MM")
+        self.assertEqual(cell.level, 10)
+        self.assertTrue(cell.bounds.min_lat <= 22.5726 <= cell.bounds.max_lat)
+        self.assertTrue(cell.bounds.min_lon <= 88.3639 <= cell.bounds.max_lon)
+        self.assertEqual(cell.lat_size, 36 / 4**10)
+
+    def test_get_cell_invalid(self):
+        """Empty, overlong or malformed pins are rejected."""
+        with self.assertRaises(InvalidDigipinError):
+            self.digipin_handler.get_cell("")
+        with self.assertRaises(InvalidDigipinError):
+            self.digipin_handler.get_cell("2TF-J7F-86MM-2")
+        with self.assertRaises(InvalidDigipinCharError):
+            self.digipin_handler.get_cell("2TG")
+
+    def test_get_lat_lng_tuple(self):
+        """The tuple fast path returns the same values as the Coordinates path."""
+        for digipin_handler in (self.digipin_handler, Digipin(cache_size=16)):
+            for pin in ("2TF-J7F-86MM", "4P3JK852C9", "2TF-J7F-86MM"):
+                with self.subTest(cached=bool(digipin_handler.cache_stats()), pin=pin):
+                    result = digipin_handler.get_lat_lng_tuple(pin)
+                    coords = digipin_handler.get_lat_lng_from_digipin(pin)
+                    self.assertIs(type(result), tuple)
+                    self.assertIs(type(coords), Coordinates)
+                    self.assertEqual(result, (coords.latitude, coords.longitude))
+            coords = digipin_handler.get_lat_lng_from_digipin("2TF", precision=3)
+            self.assertEqual(
+                digipin_handler.get_lat_lng_tuple("2TF", precision=3),
+                (coords.latitude, coords.longitude),
+            )
+            with self.assertRaises(InvalidDigipinError):
+                digipin_handler.get_lat_lng_tuple("2TF-J7F")
+            with self.assertRaises(InvalidDigipinCharError):
+                digipin_handler.get_lat_lng_tuple("2TF-J7F-86MA")
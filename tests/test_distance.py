@@ -0,0 +1,115 @@
+import math
+import random
+import unittest
+from unittest import mock
+
+from digipin.core import Digipin
+from digipin.distance import EARTH_RADIUS_KM, distance
+from digipin.error import InvalidDigipinCharError
+
+try:
+    import numpy as np
+
+    from digipin.distance import distance_many, distance_matrix, nearest
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+
+class TestDistance(unittest.TestCase):
+    def setUp(self):
+        self.digipin_handler = Digipin()
+        rng = random.Random(21)
+        self.points = [(rng.uniform(8.0, 35.0), rng.uniform(68.0, 97.0)) for _ in range(400)]
+        self.pins = [self.digipin_handler.get_digipin(lat, lon) for lat, lon in self.points]
+
+    def test_scalar_distance(self):
+        """Distances are between decoded cell centres."""
+        self.assertEqual(distance("2TF-J7F-86MM", "2TF-J7F-86MM"), 0.0)
+        a, b = self.pins[0], self.pins[1]
+        self.assertAlmostEqual(distance(a, b), distance(b, a))
+        # "J" and "L" share a grid column, so the two cells lie on one meridian.
+        lat_a = self.digipin_handler.get_lat_lng_from_digipin("2TF-J", precision=4)
+        lat_b = self.digipin_handler.get_lat_lng_from_digipin("2TF-L", precision=4)
+        expected = EARTH_RADIUS_KM * math.radians(abs(lat_a.latitude - lat_b.latitude))
+        self.assertAlmostEqual(distance("2TF-J", "2TF-L", precision=4), expected)
+        with self.assertRaises(InvalidDigipinCharError):
+            distance("2TF-J7F-86MA", "2TF-J7F-86MM")
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_distance_many_and_matrix(self):
+        """Batch distances match the scalar function; invalid pins give NaN."""
+        pins_a = np.array(self.pins[:200])
+        pins_b = np.array(self.pins[200:])
+        pairwise = distance_many(pins_a, pins_b)
+        for row in range(0, 200, 17):
+            self.assertAlmostEqual(pairwise[row], distance(pins_a[row], pins_b[row]), places=9)
+
+        matrix = distance_matrix(self.pins[:30], self.pins[30:80])
+        self.assertEqual(matrix.shape, (30, 50))
+        self.assertAlmostEqual(matrix[3, 7], distance(self.pins[3], self.pins[37]), places=9)
+
+        self.assertTrue(np.isnan(distance_many(["2TF"], ["2TF-J7F-86MM"])[0]))
+        self.assertTrue(
+            np.isnan(distance_matrix(["2TF-J7F-86MM", "bad"], self.pins[:3])[1]).all()
+        )
+        with self.assertRaises(ValueError):
+            distance_many(self.pins[:2], self.pins[:3])
+
+    def assertNearestExact(self, queries, candidates, k):
+        indices, distances = nearest(queries, candidates, k=k)
+        matrix = distance_matrix(queries, candidates)
+        np.testing.assert_allclose(distances, np.sort(matrix, axis=1)[:, :k])
+        np.testing.assert_allclose(np.take_along_axis(matrix, indices, axis=1), distances)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_nearest_matches_brute_force(self):
+        """The pruned search returns the same matches as a full distance matrix."""
+        rng = np.random.default_rng(4)
+        depots = Digipin().encode_many(rng.normal(19.0, 0.5, 60), rng.normal(73.0, 0.5, 60))
+        for queries, candidates in ((self.pins, depots), (depots, self.pins)):
+            for k in (1, 3):
+                with self.subTest(candidates=len(candidates), k=k):
+                    self.assertNearestExact(queries, candidates, k)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_nearest_clustered(self):
+        """Queries and candidates packed into one city, or far from it, stay exact."""
+        rng = np.random.default_rng(5)
+        digipin_handler = Digipin()
+
+        def city(n, spread):
+            return digipin_handler.encode_many(
+                rng.normal(19.07, spread, n), rng.normal(72.87, spread, n)
+            )
+
+        depots = city(1500, 0.05)
+        orders = np.concatenate((city(2000, 0.05), city(500, 0.001), city(20, 0.0)))
+        cases = (
+            ("same city", orders, depots),
+            ("far queries", self.pins, depots),
+            ("tight candidates", orders[:300], city(800, 0.001)),
+        )
+        for name, queries, candidates in cases:
+            for k in (1, 4):
+                with self.subTest(name, k=k):
+                    self.assertNearestExact(queries, candidates, k)
+        # Small distance slices force every block to be split across chunks.
+        with mock.patch("digipin.distance._MAX_PAIRS", 500):
+            self.assertNearestExact(orders[:500], depots, 2)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_nearest_missing_matches(self):
+        """Invalid queries and too few candidates are padded with -1 / inf."""
+        indices, distances = nearest(["2TF-J7F-86MM", "bad"], self.pins[:2] + ["2TF"], k=3)
+        self.assertEqual(indices.shape, (2, 3))
+        self.assertEqual(sorted(indices[0, :2].tolist()), [0, 1])
+        self.assertEqual(indices[0, 2], -1)
+        self.assertEqual(distances[0, 2], np.inf)
+        self.assertTrue((indices[1] == -1).all())
+        self.assertEqual(nearest(["2TF-J7F-86MM"], [], k=1)[0].tolist(), [[-1]])
+        with self.assertRaises(ValueError):
+            nearest(self.pins, self.pins, k=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
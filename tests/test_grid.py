@@ -0,0 +1,87 @@
+import unittest
+
+from digipin.core import Digipin
+from digipin.error import InvalidDigipinCharError, InvalidDigipinError
+from digipin.grid import (
+    grid_to_pin,
+    k_ring,
+    k_ring_many,
+    neighbors,
+    neighbors_many,
+    pin_to_grid,
+)
+
+
+class TestGrid(unittest.TestCase):
+    def setUp(self):
+        self.digipin_handler = Digipin()
+
+    def test_pin_to_grid_roundtrip(self):
+        """Grid indices convert back to the same hyphenated pin at every level."""
+        for pin in ("2", "2TF", "2TF-J", "2TF-J7F-86MM", "8", "L"):
+            level, row, col = pin_to_grid(pin)
+            self.assertEqual(grid_to_pin(level, row, col), pin)
+        self.assertEqual(pin_to_grid("F"), (1, 0, 0))
+        self.assertEqual(pin_to_grid("T"), (1, 3, 3))
+
+    def test_neighbors_match_geometry(self):
+        """Neighbours are the cells found by stepping one cell size in each direction."""
+        pin = "2TF-J7F-86MM"
+        cell = self.digipin_handler.get_cell(pin)
+        lat, lon = cell.center.latitude, cell.center.longitude
+        expected = [
+            self.digipin_handler.get_digipin(
+                lat + d_lat * cell.lat_size, lon + d_lon * cell.lon_size
+            )
+            for d_lat, d_lon in (
+                (1, 0),
+                (1, 1),
+                (0, 1),
+                (-1, 1),
+                (-1, 0),
+                (-1, -1),
+                (0, -1),
+                (1, -1),
+            )
+        ]
+        self.assertEqual(neighbors(pin), expected)
+
+    def test_neighbors_carry_across_parents(self):
+        """Neighbours across a parent boundary change the higher-level characters."""
+        # "2TF-J7F-86MT" sits in the south-east corner of its level-9 parent
+        result = neighbors("2TF-J7F-86MT")
+        self.assertEqual(len(result), 8)
+        self.assertTrue(any(not pin.startswith("2TF-J7F-86M") for pin in result))
+
+    def test_neighbors_clipped_at_edges(self):
+        """Corner and edge cells only report neighbours inside the grid."""
+        self.assertEqual(sorted(neighbors("F")), sorted(["C", "J", "3"]))
+        self.assertEqual(len(neighbors("C")), 5)
+        self.assertEqual(len(neighbors("3")), 8)
+
+    def test_k_ring(self):
+        """k-rings cover the full square block, clipped at the edges."""
+        self.assertEqual(k_ring("3", 0), ["3"])
+        self.assertEqual(len(k_ring("2TF-J7F-86MM", 2)), 25)
+        self.assertEqual(sorted(k_ring("F", 1)), sorted(["F", "C", "J", "3"]))
+        self.assertEqual(len(k_ring("5", 5)), 16)
+        ring = k_ring("2TF-J7F-86MM", 1)
+        self.assertIn("2TF-J7F-86MM", ring)
+        self.assertEqual(set(ring) - {"2TF-J7F-86MM"}, set(neighbors("2TF-J7F-86MM")))
+
+    def test_batch_variants(self):
+        """Batch variants return one result per input pin, in order."""
+        pins = ["F", "2TF-J7F-86MM"]
+        self.assertEqual(neighbors_many(pins), [neighbors(pin) for pin in pins])
+        self.assertEqual(k_ring_many(pins, 2), [k_ring(pin, 2) for pin in pins])
+
+    def test_invalid_input(self):
+        """Malformed pins and negative radii are rejected."""
+        with self.assertRaises(InvalidDigipinError):
+            neighbors("")
+        with self.assertRaises(InvalidDigipinCharError):
+            neighbors("2TG")
+        with self.assertRaises(ValueError):
+            k_ring("2TF", -1)
+        with self.assertRaises(ValueError):
+            k_ring_many(["2TF"], -1)
@@ -0,0 +1,139 @@
+import random
+import tracemalloc
+import unittest
+
+from digipin.core import BOUNDS, Digipin
+from digipin.error import InvalidDigipinCharError, InvalidDigipinError, InvalidPrecisionError
+from digipin.hierarchy import aggregate, children, descendants, parent
+from digipin.intcode import pin_to_int, prefix_range
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+class TestTraversal(unittest.TestCase):
+    def test_parent(self):
+        """Parents are hyphenated prefixes of the pin."""
+        self.assertEqual(parent("2TF-J7F-86MM"), "2TF-J7F-86M")
+        self.assertEqual(parent("2TFJ7F86MM", 6), "2TF-J7F")
+        self.assertEqual(parent("2TF-J7F-86MM", 3), "2TF")
+        self.assertEqual(parent("2TF-J", 4), "2TF-J")
+        with self.assertRaises(ValueError):
+            parent("2")
+        with self.assertRaises(ValueError):
+            parent("2TF", 4)
+        with self.assertRaises(InvalidPrecisionError):
+            parent("2TF", 0)
+        with self.assertRaises(InvalidDigipinCharError):
+            parent("2TA")
+
+    def test_children(self):
+        """Children cover the parent cell exactly, in grid order."""
+        kids = children("2TF")
+        self.assertEqual(len(kids), 16)
+        self.assertEqual(kids[:5], ["2TF-F", "2TF-C", "2TF-9", "2TF-8", "2TF-J"])
+        handler = Digipin()
+        cell = handler.get_cell("2TF")
+        area = sum(
+            handler.get_cell(kid).lat_size * handler.get_cell(kid).lon_size for kid in kids
+        )
+        self.assertAlmostEqual(area, cell.lat_size * cell.lon_size)
+        self.assertTrue(all(parent(kid) == "2TF" for kid in kids))
+        with self.assertRaises(ValueError):
+            children("2TF-J7F-86MM")
+        with self.assertRaises(InvalidDigipinError):
+            children("")
+
+    def test_descendants(self):
+        """Descendants are generated lazily in depth-first children order."""
+        generated = descendants("2TF-J7F-86", 9)
+        self.assertNotIsInstance(generated, list)
+        self.assertEqual(list(generated), children("2TF-J7F-86"))
+        grand = list(descendants("2T", 4))
+        self.assertEqual(len(grand), 256)
+        self.assertEqual(grand, [pin for kid in children("2T") for pin in children(kid)])
+        self.assertEqual(list(descendants("2TF", 3)), ["2TF"])
+        with self.assertRaises(ValueError):
+            descendants("2TF", 2)
+
+
+class TestAggregate(unittest.TestCase):
+    def setUp(self):
+        handler = Digipin()
+        rng = random.Random(9)
+        self.pins = [
+            handler.get_digipin(
+                rng.uniform(20.0, 24.0), rng.uniform(BOUNDS.min_lon + 20, BOUNDS.min_lon + 24)
+            )
+            for _ in range(500)
+        ]
+        self.counts = [rng.randint(1, 5) for _ in self.pins]
+
+    def expected(self, level, counts=None):
+        totals = {}
+        for index, pin in enumerate(self.pins):
+            key = parent(pin, level)
+            totals[key] = totals.get(key, 0) + (1 if counts is None else counts[index])
+        return totals
+
+    def test_strings_and_codes(self):
+        """Pins and integer codes roll up to the same totals, in code order."""
+        for level in (1, 3, 6, 10):
+            expected = self.expected(level, self.counts)
+            result = aggregate(self.pins, self.counts, level)
+            self.assertEqual(result, expected)
+            self.assertEqual(list(result), sorted(result, key=lambda pin: prefix_range(pin)[0]))
+            codes = [pin_to_int(pin) for pin in self.pins]
+            self.assertEqual(aggregate(codes, self.counts, level), expected)
+        self.assertEqual(aggregate(self.pins, None, 4), self.expected(4))
+        self.assertEqual(aggregate(["2TF-J7", "2TF-J8"], None, 4), {"2TF-J": 2})
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numpy_codes(self):
+        """A NumPy array of codes is grouped vectorized with the same result."""
+        codes = np.array([pin_to_int(pin) for pin in self.pins], dtype=np.uint64)
+        self.assertEqual(aggregate(codes, None, 5), self.expected(5))
+        self.assertEqual(
+            aggregate(codes, np.array(self.counts), 5), self.expected(5, self.counts)
+        )
+        weights = np.array(self.counts, dtype=np.float64) / 2
+        result = aggregate(codes.astype(np.int64), weights, 2)
+        for key, total in self.expected(2, self.counts).items():
+            self.assertAlmostEqual(result[key], total / 2)
+        with self.assertRaises(InvalidDigipinError):
+            aggregate(np.array([-1]), None, 3)
+        with self.assertRaises(ValueError):
+            aggregate(codes, np.ones(3), 3)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numpy_codes_small_input(self):
+        """Small inputs at coarse levels are not counted into a dense array of cells."""
+        pins = self.pins[:3]
+        codes = np.array([pin_to_int(pin) for pin in pins], dtype=np.uint64)
+        zero = np.zeros(3, dtype=np.int64)
+        for level in range(1, 7):
+            with self.subTest(level=level):
+                self.assertEqual(aggregate(codes, None, level), aggregate(pins, None, level))
+                self.assertEqual(aggregate(codes, zero, level), aggregate(pins, [0] * 3, level))
+        tracemalloc.start()
+        try:
+            aggregate(codes[:1], None, 6)
+            aggregate(codes[:1], zero[:1], 6)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        self.assertLess(peak, 1 << 20)
+
+    def test_errors(self):
+        with self.assertRaises(InvalidDigipinError):
+            aggregate(["2TF"], None, 4)
+        with self.assertRaises(InvalidDigipinCharError):
+            aggregate(["2TA-J7F-86MM"], None, 4)
+        with self.assertRaises(InvalidDigipinError):
+            aggregate([1 << 40], None, 4)
+        with self.assertRaises(ValueError):
+            aggregate(self.pins, [1], 4)
+        with self.assertRaises(InvalidPrecisionError):
+            aggregate(self.pins, None, 11)
@@ -0,0 +1,105 @@
+import random
+import unittest
+
+from digipin.core import Digipin
+from digipin.error import InvalidDigipinError
+from digipin.index import DigipinIndex, _haversine_km
+from digipin.intcode import pin_to_int
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+class TestDigipinIndex(unittest.TestCase):
+    def setUp(self):
+        self.digipin_handler = Digipin()
+        rng = random.Random(5)
+        self.points = [(rng.uniform(22.0, 23.0), rng.uniform(88.0, 89.0)) for _ in range(3000)]
+        self.pins = [self.digipin_handler.get_digipin(lat, lon) for lat, lon in self.points]
+        self.index = DigipinIndex((pin, i) for i, pin in enumerate(self.pins))
+
+    def test_bulk_load_and_get(self):
+        """Bulk-loaded records are found under their exact cell."""
+        self.assertEqual(len(self.index), len(self.pins))
+        for i in (0, 10, 2999):
+            self.assertIn(i, self.index.get(self.pins[i]))
+            self.assertIn(self.pins[i], self.index)
+        self.assertEqual(self.index.get("FFF-FFF-FFFF"), [])
+        self.assertNotIn("FFF-FFF-FFFF", self.index)
+
+    def test_insert_and_remove(self):
+        """Single inserts and removals keep the index consistent."""
+        index = DigipinIndex()
+        index.insert("2TF-J7F-86MM", "a")
+        index.insert(pin_to_int("2TF-J7F-86MM"), "b")
+        index.insert("4P3-JK8-52C9", "c")
+        self.assertEqual(index.get("2TF-J7F-86MM"), ["a", "b"])
+        index.remove("2TF-J7F-86MM", "a")
+        self.assertEqual(index.get("2TF-J7F-86MM"), ["b"])
+        self.assertEqual(len(index), 2)
+        with self.assertRaises(KeyError):
+            index.remove("2TF-J7F-86MM", "a")
+
+    def test_integer_keys(self):
+        """Integer codes of any integral type are accepted and range-checked."""
+        index = DigipinIndex()
+        code = pin_to_int("2TF-J7F-86MM")
+        index.insert(code, "a")
+        if np is not None:
+            index.insert(np.int64(code), "b")
+            index.bulk_load([(np.uint64(code), "c")])
+            self.assertIn(np.int64(code), index)
+            self.assertEqual(index.get(np.uint64(code)), ["a", "b", "c"])
+        self.assertEqual([pin for pin, _ in index], ["2TF-J7F-86MM"] * len(index))
+        for bad in (-1, 1 << 40):
+            with self.assertRaises(InvalidDigipinError):
+                index.insert(bad, "x")
+            with self.assertRaises(InvalidDigipinError):
+                index.bulk_load([(bad, "x")])
+        self.assertEqual(len(index), 3 if np is not None else 1)
+
+    def test_iteration_is_sorted_by_code(self):
+        """Iteration yields records in integer-code order."""
+        codes = [pin_to_int(pin) for pin, _ in self.index]
+        self.assertEqual(codes, sorted(codes))
+
+    def test_prefix(self):
+        """Prefix lookups return exactly the records whose pin starts with the prefix."""
+        for prefix in ("2TF", "2TF-J", "2TF-J7F-8"):
+            expected = sorted(i for i, pin in enumerate(self.pins) if pin.startswith(prefix))
+            found = sorted(record for _, record in self.index.prefix(prefix))
+            self.assertEqual(found, expected)
+
+    def test_radius_matches_brute_force(self):
+        """Radius search agrees with a full scan using decoded cell centres."""
+        lat, lon, radius_km = 22.5, 88.5, 12.0
+        expected = set()
+        for i, pin in enumerate(self.pins):
+            center = self.digipin_handler.get_cell(pin).center
+            if _haversine_km(lat, lon, center.latitude, center.longitude) <= radius_km:
+                expected.add(i)
+        results = self.index.radius(lat, lon, radius_km)
+        self.assertEqual({record for _, record, _ in results}, expected)
+        distances = [distance for _, _, distance in results]
+        self.assertEqual(distances, sorted(distances))
+        self.assertTrue(expected)
+
+    def test_radius_edge_cases(self):
+        """Zero radii, far-away points and negative radii are handled."""
+        pin = self.pins[0]
+        center = self.digipin_handler.get_cell(pin).center
+        self.assertIn(
+            0, [r for _, r, _ in self.index.radius(center.latitude, center.longitude, 0)]
+        )
+        self.assertEqual(self.index.radius(60.0, 88.5, 5.0), [])
+        with self.assertRaises(ValueError):
+            self.index.radius(22.5, 88.5, -1.0)
+
+    def test_haversine(self):
+        """Haversine distance matches a known value."""
+        # Kolkata to Bengaluru is roughly 1,560 km
+        self.assertAlmostEqual(
+            _haversine_km(22.5726, 88.3639, 12.9716, 77.5946) / 1560, 1, places=1
+        )
@@ -0,0 +1,100 @@
+import random
+import unittest
+
+from digipin.core import BOUNDS, Digipin
+from digipin.error import InvalidDigipinCharError, InvalidDigipinError, LatitudeOutOfRangeError
+from digipin.intcode import (
+    MAX_CODE,
+    code_bounds,
+    deinterleave,
+    int_to_pin,
+    interleave,
+    pin_to_int,
+    prefix_range,
+)
+
+
+class TestIntCode(unittest.TestCase):
+    def setUp(self):
+        self.digipin_handler = Digipin()
+        rng = random.Random(11)
+        self.points = [
+            (
+                rng.uniform(BOUNDS.min_lat, BOUNDS.max_lat),
+                rng.uniform(BOUNDS.min_lon, BOUNDS.max_lon),
+            )
+            for _ in range(2000)
+        ]
+        self.points += [
+            (BOUNDS.min_lat, BOUNDS.min_lon),
+            (BOUNDS.max_lat, BOUNDS.max_lon),
+            (22.5726, 88.3639),
+        ]
+
+    def test_encode_int_matches_get_digipin(self):
+        """The integer code converts back to the exact string from get_digipin."""
+        for lat, lon in self.points:
+            code = self.digipin_handler.encode_int(lat, lon)
+            pin = self.digipin_handler.get_digipin(lat, lon)
+            self.assertEqual(int_to_pin(code), pin)
+            self.assertEqual(pin_to_int(pin), code)
+
+    def test_decode_int_matches_get_lat_lng_from_digipin(self):
+        """Decoding an integer code gives the same centre as decoding the string."""
+        for lat, lon in self.points:
+            code = self.digipin_handler.encode_int(lat, lon)
+            self.assertEqual(
+                self.digipin_handler.decode_int(code),
+                self.digipin_handler.get_lat_lng_from_digipin(int_to_pin(code)),
+            )
+
+    def test_code_bounds_contains_point(self):
+        """The bounds of an encoded cell contain the encoded point."""
+        code = self.digipin_handler.encode_int(22.5726, 88.3639)
+        bounds = code_bounds(code)
+        self.assertTrue(bounds.min_lat <= 22.5726 <= bounds.max_lat)
+        self.assertTrue(bounds.min_lon <= 88.3639 <= bounds.max_lon)
+
+    def test_interleave_roundtrip(self):
+        """Row/column interleaving is lossless and fills exactly 40 bits."""
+        self.assertEqual(interleave(4**10 - 1, 4**10 - 1), MAX_CODE)
+        for row, col in [(0, 0), (1, 2), (123456, 654321), (4**10 - 1, 0)]:
+            self.assertEqual(deinterleave(interleave(row, col)), (row, col))
+
+    def test_ordering_groups_descendants(self):
+        """All pins sharing a prefix fall into one contiguous integer range."""
+        low = pin_to_int("2TF-J7F-8FFF")
+        high = pin_to_int("2TF-J7F-8TTT")
+        self.assertEqual(high - low, 16**3 - 1)
+        self.assertTrue(low <= pin_to_int("2TF-J7F-86MM") <= high)
+
+    def test_pin_to_int_invalid(self):
+        """Malformed pins raise the same errors as the string decoder."""
+        with self.assertRaises(InvalidDigipinError):
+            pin_to_int("2TF-J7F")
+        with self.assertRaises(InvalidDigipinCharError):
+            pin_to_int("2TF-J7G-86MM")
+
+    def test_invalid_codes(self):
+        """Codes outside the 40-bit range are rejected."""
+        for code in (-1, MAX_CODE + 1):
+            with self.assertRaises(InvalidDigipinError):
+                int_to_pin(code)
+            with self.assertRaises(InvalidDigipinError):
+                self.digipin_handler.decode_int(code)
+
+    def test_encode_int_out_of_range(self):
+        """Out-of-range coordinates raise like get_digipin."""
+        with self.assertRaises(LatitudeOutOfRangeError):
+            self.digipin_handler.encode_int(40.0, 80.0)
+
+    def test_prefix_range(self):
+        """Prefix ranges contain exactly the codes of their descendants."""
+        low, high = prefix_range("2TF-J7F-86M")
+        self.assertEqual(high - low, 16)
+        self.assertTrue(low <= pin_to_int("2TF-J7F-86MM") < high)
+        code = pin_to_int("2TF-J7F-86MM")
+        self.assertEqual(prefix_range("2TF-J7F-86MM"), (code, code + 1))
+        self.assertEqual(prefix_range("F")[0], 0)
+        with self.assertRaises(InvalidDigipinError):
+            prefix_range("")
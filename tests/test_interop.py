@@ -0,0 +1,170 @@
+import array
+import random
+import unittest
+from unittest import mock
+
+from digipin.core import BOUNDS, Digipin
+from digipin.intcode import pin_to_int
+
+try:
+    import numpy as np
+
+    from digipin import interop
+    from digipin.interop import (
+        as_float64,
+        decode_buffer,
+        decode_to_arrow,
+        encode_to_arrow,
+        encode_to_bytes,
+        encode_to_codes,
+    )
+    from digipin.vectorized import DECODE_INVALID_CHAR, DECODE_INVALID_LENGTH, DECODE_NULL
+except ImportError:  # pragma: no cover
+    np = None
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+
+
+def _points(count: int):
+    rng = random.Random(21)
+    lats = [rng.uniform(BOUNDS.min_lat, BOUNDS.max_lat) for _ in range(count)]
+    lons = [rng.uniform(BOUNDS.min_lon, BOUNDS.max_lon) for _ in range(count)]
+    return lats, lons
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestBuffers(unittest.TestCase):
+    def setUp(self):
+        self.handler = Digipin()
+        self.lats, self.lons = _points(200)
+        self.lats[3] = 45.0  # Out of range
+        self.expected = [
+            self.handler.get_digipin(lat, lon) if index != 3 else ""
+            for index, (lat, lon) in enumerate(zip(self.lats, self.lons))
+        ]
+
+    def test_as_float64_is_zero_copy(self):
+        values = np.array(self.lats)
+        view, valid = as_float64(values)
+        self.assertTrue(np.shares_memory(view, values))
+        self.assertIsNone(valid)
+        view, _ = as_float64(memoryview(array.array("d", self.lats)))
+        self.assertEqual(view.tolist(), self.lats)
+
+    def test_encode_to_bytes(self):
+        """Buffer-protocol input encodes to fixed-width ASCII pins."""
+        pins, valid = encode_to_bytes(array.array("d", self.lats), array.array("d", self.lons))
+        self.assertEqual(pins.dtype, np.dtype("S12"))
+        self.assertEqual([pin.decode() for pin in pins.tolist()], self.expected)
+        self.assertEqual(np.flatnonzero(~valid).tolist(), [3])
+
+        short, _ = encode_to_bytes(self.lats, self.lons, precision=5)
+        self.assertEqual(short.dtype, np.dtype("S6"))
+        self.assertEqual(short[0].decode(), self.expected[0][:6])
+
+    def test_encode_to_codes(self):
+        codes, valid = encode_to_codes(np.array(self.lats), np.array(self.lons))
+        self.assertEqual(codes.dtype, np.uint64)
+        for code, pin, ok in zip(codes.tolist(), self.expected, valid.tolist()):
+            self.assertEqual(code, pin_to_int(pin) if ok else 0)
+
+    def test_decode_buffer_bytes(self):
+        pins, _ = encode_to_bytes(self.lats, self.lons)
+        decoded = decode_buffer(pins)
+        for index, pin in enumerate(self.expected):
+            if not pin:
+                self.assertEqual(decoded.errors[index], DECODE_INVALID_LENGTH)
+                continue
+            coords = self.handler.get_lat_lng_from_digipin(pin)
+            self.assertEqual(
+                (decoded.latitude[index], decoded.longitude[index]),
+                (coords.latitude, coords.longitude),
+            )
+
+
+@unittest.skipIf(np is None or pa is None, "NumPy or pyarrow is not installed")
+class TestArrow(unittest.TestCase):
+    def setUp(self):
+        self.handler = Digipin()
+        self.lats, self.lons = _points(100)
+
+    def test_encode_nulls_and_range(self):
+        """Nulls in either column and out-of-range rows become null pins."""
+        lats = pa.array([self.lats[0], None, self.lats[2], 50.0])
+        lons = pa.array([self.lons[0], self.lons[1], None, self.lons[3]])
+        pins = encode_to_arrow(lats, lons)
+        self.assertEqual(pins.type, pa.string())
+        self.assertEqual(
+            pins.to_pylist(),
+            [self.handler.get_digipin(self.lats[0], self.lons[0]), None, None, None],
+        )
+        codes = encode_to_arrow(lats, lons, codes=True)
+        self.assertEqual(codes.type, pa.uint64())
+        self.assertEqual(codes.null_count, 3)
+        self.assertEqual(codes[0].as_py(), pin_to_int(pins[0].as_py()))
+        with self.assertRaises(ValueError):
+            encode_to_arrow(lats, lons, precision=5, codes=True)
+
+    def test_large_output_uses_64bit_offsets(self):
+        """Pins beyond the int32 offset range are returned as large_string."""
+        expected = encode_to_arrow(self.lats, self.lons).to_pylist()
+        with mock.patch.object(interop, "_MAX_STRING_BYTES", 12 * 50):
+            pins = encode_to_arrow(self.lats, self.lons)
+            small = encode_to_arrow(self.lats[:50], self.lons[:50])
+        self.assertEqual(pins.type, pa.large_string())
+        pins.validate(full=True)
+        self.assertEqual(pins.to_pylist(), expected)
+        self.assertEqual(small.type, pa.string())
+        lat, lon = decode_to_arrow(pins)
+        self.assertEqual(lat.null_count, 0)
+
+    def test_sliced_and_chunked_input(self):
+        """Array offsets and chunking are honoured."""
+        lats = pa.chunked_array([self.lats[:50], self.lats[50:]])
+        lons = pa.array(self.lons).slice(0)
+        pins = encode_to_arrow(lats.slice(10, 60), lons.slice(10, 60), precision=6)
+        self.assertEqual(
+            pins.to_pylist(),
+            [
+                self.handler.get_digipin(lat, lon, precision=6)
+                for lat, lon in zip(self.lats[10:70], self.lons[10:70])
+            ],
+        )
+
+    def test_decode_roundtrip(self):
+        pins = encode_to_arrow(self.lats, self.lons)
+        lat, lon = decode_to_arrow(pins)
+        expected = [self.handler.get_lat_lng_from_digipin(pin) for pin in pins.to_pylist()]
+        self.assertEqual(lat.to_pylist(), [coords.latitude for coords in expected])
+        self.assertEqual(lon.to_pylist(), [coords.longitude for coords in expected])
+
+    def test_decode_ragged_and_null(self):
+        """Ragged, dirty and null rows are classified per row."""
+        pins = pa.array(
+            ["2TF-J7F-86MM", None, "2TFJ7F86MM", "2TF", "2TF-J7F-86MA", "2" * 40, "4P3-JK8-52C9"]
+        )
+        decoded = decode_buffer(pins.slice(0))
+        self.assertEqual(
+            decoded.errors.tolist(),
+            [
+                0,
+                DECODE_NULL,
+                0,
+                DECODE_INVALID_LENGTH,
+                DECODE_INVALID_CHAR,
+                DECODE_INVALID_LENGTH,
+                0,
+            ],
+        )
+        lat, _ = decode_to_arrow(pins.slice(1))
+        self.assertEqual(lat.null_count, 4)
+        self.assertEqual(
+            lat[1].as_py(), self.handler.get_lat_lng_from_digipin("2TFJ7F86MM").latitude
+        )
+        large = decode_buffer(pins.cast(pa.large_string()))
+        self.assertEqual(large.errors.tolist(), decoded.errors.tolist())
+        with self.assertRaises(TypeError):
+            decode_buffer(pa.array([1, 2]))
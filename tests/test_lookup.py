@@ -0,0 +1,94 @@
+import math
+import random
+import unittest
+
+from digipin._lookup import MAX_LOOKUP_LEVELS, get_encode_table
+from digipin.core import BOUNDS, Digipin
+from digipin.error import InvalidDigipinCharError, InvalidDigipinError, LatitudeOutOfRangeError
+
+
+class TestLookupTables(unittest.TestCase):
+    def setUp(self):
+        self.reference = Digipin()
+        rng = random.Random(23)
+        self.points = [
+            (
+                rng.uniform(BOUNDS.min_lat, BOUNDS.max_lat),
+                rng.uniform(BOUNDS.min_lon, BOUNDS.max_lon),
+            )
+            for _ in range(1000)
+        ]
+        self.points += [
+            (BOUNDS.min_lat, BOUNDS.min_lon),
+            (BOUNDS.max_lat, BOUNDS.max_lon),
+            (BOUNDS.min_lat, BOUNDS.max_lon),
+            (BOUNDS.max_lat, BOUNDS.min_lon),
+        ]
+
+    def test_encode_matches_reference(self):
+        """Every supported table depth encodes exactly like the plain loop."""
+        for levels in range(1, MAX_LOOKUP_LEVELS + 1):
+            handler = Digipin(lookup_levels=levels)
+            for lat, lon in self.points:
+                with self.subTest(levels=levels, lat=lat, lon=lon):
+                    self.assertEqual(
+                        handler.get_digipin(lat, lon), self.reference.get_digipin(lat, lon)
+                    )
+
+    def test_encode_precision_matches_reference(self):
+        """Precisions below, at and above the table depth match the plain loop."""
+        handler = Digipin(lookup_levels=3)
+        for precision in range(1, 11):
+            for lat, lon in self.points[:100]:
+                self.assertEqual(
+                    handler.get_digipin(lat, lon, precision),
+                    self.reference.get_digipin(lat, lon, precision),
+                )
+
+    def test_encode_at_strip_edges(self):
+        """Points on and just below every strip threshold encode exactly like the loop."""
+        handler = Digipin(lookup_levels=3)
+        table = get_encode_table(3)
+        lon = 80.0
+        for threshold in table._lat_thresholds[1:]:
+            for lat in (threshold, math.nextafter(threshold, -math.inf)):
+                self.assertEqual(
+                    handler.get_digipin(lat, lon), self.reference.get_digipin(lat, lon)
+                )
+
+    def test_decode_matches_reference(self):
+        """Every supported table depth decodes exactly like the plain loop."""
+        for levels in range(1, MAX_LOOKUP_LEVELS + 1):
+            handler = Digipin(lookup_levels=levels)
+            for lat, lon in self.points[:200]:
+                pin = self.reference.get_digipin(lat, lon)
+                self.assertEqual(
+                    handler.get_lat_lng_from_digipin(pin),
+                    self.reference.get_lat_lng_from_digipin(pin),
+                )
+
+    def test_errors_unchanged(self):
+        """The fast paths raise the same errors as the plain loop."""
+        handler = Digipin(lookup_levels=2)
+        with self.assertRaises(LatitudeOutOfRangeError):
+            handler.get_digipin(BOUNDS.max_lat + 0.001, 80.0)
+        with self.assertRaises(InvalidDigipinError):
+            handler.get_lat_lng_from_digipin("2TF-J7F")
+        with self.assertRaises(InvalidDigipinCharError) as cm:
+            handler.get_lat_lng_from_digipin("GTF-J7F-86MM")
+        self.assertIn("Invalid character 'G' found in DIGIPIN.", str(cm.exception))
+
+    def test_invalid_lookup_levels(self):
+        """Unsupported table depths are rejected."""
+        for levels in (-1, MAX_LOOKUP_LEVELS + 1):
+            with self.assertRaises(ValueError):
+                Digipin(lookup_levels=levels)
+
+    def test_tables_are_shared(self):
+        """Tables are built once per process and shared between instances."""
+        self.assertIs(
+            Digipin(lookup_levels=2)._encode_table, Digipin(lookup_levels=2)._encode_table
+        )
+        self.assertIs(
+            Digipin(lookup_levels=2)._decode_table, Digipin(lookup_levels=2)._decode_table
+        )
@@ -0,0 +1,120 @@
+import os
+import random
+import tempfile
+import unittest
+
+from digipin.core import Digipin
+from digipin.error import InvalidDigipinError
+from digipin.index import DigipinIndex
+from digipin.intcode import pin_to_int
+from digipin.lookupfile import LookupFile, LookupFileWriter, write_lookup_file
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+class TestLookupFile(unittest.TestCase):
+    def setUp(self):
+        self.digipin_handler = Digipin()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "records.dpl")
+        rng = random.Random(11)
+        self.points = [(rng.uniform(22.0, 23.0), rng.uniform(88.0, 89.0)) for _ in range(2000)]
+        self.pins = [self.digipin_handler.get_digipin(lat, lon) for lat, lon in self.points]
+        # Small runs force the external merge of several sorted run files.
+        with LookupFileWriter(self.path, run_size=300) as writer:
+            for i, (lat, lon) in enumerate(self.points):
+                writer.add_point(lat, lon, f"record-{i}")
+        self.lookup = LookupFile(self.path)
+        self.index = DigipinIndex(
+            (pin, f"record-{i}".encode()) for i, pin in enumerate(self.pins)
+        )
+
+    def tearDown(self):
+        self.lookup.close()
+        self.tmpdir.cleanup()
+
+    def test_get_matches_in_memory_index(self):
+        """Exact-cell lookups return the same records as DigipinIndex."""
+        self.assertEqual(len(self.lookup), len(self.pins))
+        for pin in self.pins[:200]:
+            self.assertEqual(self.lookup.get(pin), self.index.get(pin))
+            self.assertEqual(self.lookup.get(pin_to_int(pin)), self.index.get(pin))
+            self.assertIn(pin, self.lookup)
+        self.assertEqual(self.lookup.get("FFF-FFF-FFFF"), [])
+        self.assertNotIn("FFF-FFF-FFFF", self.lookup)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_numpy_integer_keys(self):
+        """NumPy integer codes are accepted and range-checked like Python ints."""
+        code = pin_to_int(self.pins[0])
+        expected = self.index.get(self.pins[0])
+        self.assertEqual(self.lookup.get(np.uint64(code)), expected)
+        self.assertEqual(self.lookup.get(np.int64(code)), expected)
+        self.assertIn(np.uint64(code), self.lookup)
+        path = os.path.join(self.tmpdir.name, "codes.dpl")
+        with LookupFileWriter(path) as writer:
+            writer.add(np.uint64(code), b"a")
+            writer.add(np.int32(0), b"b")
+        with LookupFile(path) as lookup:
+            self.assertEqual(lookup.get(code), [b"a"])
+            self.assertEqual(lookup.get(0), [b"b"])
+        for bad in (-5, 1 << 40):
+            with self.assertRaises(InvalidDigipinError):
+                self.lookup.get(bad)
+            with self.assertRaises(InvalidDigipinError):
+                with LookupFileWriter(os.path.join(self.tmpdir.name, "bad.dpl")) as bad_writer:
+                    bad_writer.add(bad, b"x")
+
+    def test_prefix_and_iteration(self):
+        """Prefix queries and iteration follow integer-code order."""
+        self.assertEqual(list(self.lookup), list(self.index))
+        for prefix in (self.pins[0][:2], self.pins[1][:5], self.pins[2]):
+            expected = list(self.index.prefix(prefix))
+            self.assertEqual(list(self.lookup.prefix(prefix)), expected)
+            self.assertEqual(self.lookup.count(prefix), len(expected))
+
+    def test_duplicate_pins_keep_insertion_order(self):
+        """Records sharing a pin come back in the order they were added."""
+        count = write_lookup_file(
+            self.path,
+            [("2TF-J7F-86MM", b"b"), ("4P3-JK8-52C9", "c"), ("2TF-J7F-86MM", b"a")],
+            run_size=1,
+        )
+        self.assertEqual(count, 3)
+        with LookupFile(self.path) as lookup:
+            self.assertEqual(lookup.get("2TF-J7F-86MM"), [b"b", b"a"])
+            self.assertEqual(lookup.get("4P3-JK8-52C9"), [b"c"])
+
+    def test_empty_file(self):
+        """A file without records opens and answers queries."""
+        write_lookup_file(self.path, [])
+        with LookupFile(self.path) as lookup:
+            self.assertEqual(len(lookup), 0)
+            self.assertEqual(lookup.get("2TF-J7F-86MM"), [])
+            self.assertEqual(list(lookup.prefix("2")), [])
+
+    def test_failed_write_leaves_no_file(self):
+        """A writer block that raises neither creates the file nor leaves temporaries."""
+        path = os.path.join(self.tmpdir.name, "partial.dpl")
+        with self.assertRaises(InvalidDigipinError):
+            with LookupFileWriter(path) as writer:
+                writer.add("2TF-J7F-86MM", b"ok")
+                writer.add("2TF", b"bad")
+        self.assertEqual(sorted(os.listdir(self.tmpdir.name)), ["records.dpl"])
+        with self.assertRaises(ValueError):
+            writer.add("2TF-J7F-86MM", b"late")
+
+    def test_rejects_other_files(self):
+        """Opening a file that is not a lookup file raises ValueError."""
+        path = os.path.join(self.tmpdir.name, "other.bin")
+        with open(path, "wb") as handle:
+            handle.write(b"not a lookup file at all, just some bytes")
+        with self.assertRaises(ValueError):
+            LookupFile(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+import io
+import threading
+import unittest
+
+from digipin.core import Digipin
+from digipin.error import InvalidDigipinCharError, LatitudeOutOfRangeError
+from digipin.metrics import (
+    InMemoryExporter,
+    Metrics,
+    PrometheusTextExporter,
+    format_prometheus,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.metrics = Metrics()
+        self.digipin_handler = Digipin(metrics=self.metrics)
+
+    def test_disabled_by_default(self):
+        """Without metrics the class methods are used unchanged."""
+        handler = Digipin()
+        self.assertNotIn("get_digipin", vars(handler))
+        self.assertEqual(handler.get_digipin.__func__, Digipin.get_digipin)
+        self.assertIn("get_digipin", vars(self.digipin_handler))
+
+    def test_scalar_counters_and_errors(self):
+        """Calls, errors by exception class and sampled latency are recorded."""
+        self.assertEqual(self.digipin_handler.get_digipin(22.5726, 88.3639), "2TF-J7F-86MM")
+        self.digipin_handler.get_lat_lng_from_digipin("2TF-J7F-86MM")
+        self.digipin_handler.get_lat_lng_tuple("2TF-J7F-86MM")
+        with self.assertRaises(LatitudeOutOfRangeError):
+            self.digipin_handler.get_digipin(50.0, 88.0)
+        with self.assertRaises(InvalidDigipinCharError):
+            self.digipin_handler.get_lat_lng_from_digipin("2TF-J7F-86MA")
+
+        snapshot = self.metrics.snapshot()
+        encode, decode = snapshot["encode"], snapshot["decode"]
+        self.assertEqual((encode.calls, encode.items), (2, 2))
+        self.assertEqual(encode.errors, {"LatitudeOutOfRangeError": 1})
+        self.assertEqual(decode.calls, 3)
+        self.assertEqual(decode.errors, {"InvalidDigipinCharError": 1})
+        self.assertEqual(encode.latency.count, 2)
+        self.assertEqual(sum(encode.latency.counts), 2)
+        self.assertIsNone(encode.batch_sizes)
+
+    def test_sampling_and_reset(self):
+        """Only one call in sample_every is timed, and reset zeroes everything."""
+        metrics = Metrics(sample_every=4)
+        handler = Digipin(metrics=metrics)
+        for _ in range(10):
+            handler.get_digipin(22.5726, 88.3639)
+        stats = metrics.snapshot()["encode"]
+        self.assertEqual(stats.calls, 10)
+        self.assertEqual(stats.latency.count, 2)
+        metrics.reset()
+        handler.get_digipin(22.5726, 88.3639)
+        self.assertEqual(metrics.snapshot()["encode"].calls, 1)
+
+    def test_thread_safety(self):
+        """Concurrent calls are all counted."""
+
+        def work():
+            for _ in range(500):
+                self.digipin_handler.get_digipin(22.5726, 88.3639)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.metrics.snapshot()["encode"].calls, 2000)
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_batch_stats(self):
+        """Batch methods record their size and per-row errors."""
+        self.digipin_handler.encode_many(
+            np.array([22.5, 50.0, 22.5, 1.0]),
+            np.array([88.3, 88.3, 120.0, 200.0]),
+            return_invalid=True,
+        )
+        self.digipin_handler.decode_many(["2TF-J7F-86MM", "2TF", "2TF-J7F-86MA"])
+        with self.assertRaises(LatitudeOutOfRangeError):
+            self.digipin_handler.encode_many(np.array([50.0]), np.array([88.0]))
+
+        snapshot = self.metrics.snapshot()
+        encode = snapshot["encode_many"]
+        self.assertEqual((encode.calls, encode.items), (2, 4))
+        self.assertEqual(
+            encode.errors, {"LatitudeOutOfRangeError": 3, "LongitudeOutOfRangeError": 1}
+        )
+        self.assertEqual(encode.batch_sizes.count, 1)
+        decode = snapshot["decode_many"]
+        self.assertEqual((decode.calls, decode.items), (1, 3))
+        self.assertEqual(decode.errors, {"InvalidDigipinError": 1, "InvalidDigipinCharError": 1})
+        self.assertEqual(decode.batch_sizes.counts[1], 1)  # 3 rows falls in the "<= 10" bucket
+
+    def test_histogram_quantile(self):
+        """Quantiles resolve to bucket upper bounds."""
+        metrics = Metrics(latency_buckets=(0.1, 1.0))
+        for seconds, size in ((0.05, 1), (0.5, 1), (0.5, 1), (5.0, 1)):
+            metrics.record_batch("load", size, seconds)
+        latency = metrics.snapshot()["load"].latency
+        self.assertEqual(latency.counts, (1, 2, 1))
+        self.assertEqual(latency.quantile(0.25), 0.1)
+        self.assertEqual(latency.quantile(0.5), 1.0)
+        self.assertEqual(latency.quantile(1.0), float("inf"))
+        self.assertAlmostEqual(latency.mean, 1.5125)
+        with self.assertRaises(ValueError):
+            latency.quantile(2)
+
+    def test_exporters(self):
+        """Exporters receive snapshots; the Prometheus text is well formed."""
+        memory = InMemoryExporter()
+        stream = io.StringIO()
+        prometheus = PrometheusTextExporter(stream=stream)
+        metrics = Metrics(latency_buckets=(0.001, 0.01), exporters=[memory])
+        metrics.add_exporter(prometheus)
+        handler = Digipin(metrics=metrics)
+        handler.get_digipin(22.5726, 88.3639)
+        with self.assertRaises(LatitudeOutOfRangeError):
+            handler.get_digipin(50.0, 88.0)
+
+        snapshot = metrics.export()
+        self.assertIs(memory.latest, snapshot)
+        self.assertEqual(stream.getvalue(), prometheus.text)
+        self.assertEqual(prometheus.text, format_prometheus(snapshot))
+        lines = prometheus.text.splitlines()
+        self.assertIn("# TYPE digipin_calls_total counter", lines)
+        self.assertIn('digipin_calls_total{operation="encode"} 2', lines)
+        self.assertIn(
+            'digipin_errors_total{operation="encode",error="LatitudeOutOfRangeError"} 1', lines
+        )
+        self.assertIn('digipin_latency_seconds_bucket{operation="encode",le="+Inf"} 2', lines)
+        self.assertIn('digipin_latency_seconds_count{operation="encode"} 2', lines)
+
+    def test_invalid_arguments(self):
+        """Bad sampling rates and unsorted buckets are rejected."""
+        with self.assertRaises(ValueError):
+            Metrics(sample_every=0)
+        with self.assertRaises(ValueError):
+            Metrics(latency_buckets=(1.0, 0.1))
+
+
+if __name__ == "__main__":
+    unittest.main()
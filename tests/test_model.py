@@ -1,3 +1,5 @@
+import dataclasses
+import pickle
 import unittest
 
 from digipin.model import Coordinates, DigipinBounds
@@ -64,3 +66,23 @@ class TestDigipinBounds(unittest.TestCase):
         with self.assertRaises(AttributeError):
             # Attempting to modify a frozen dataclass attribute should raise AttributeError
             bounds.min_lat = 1.0  # type: ignore
+
+
+class TestDataclassBehaviour(unittest.TestCase):
+    def test_slots_and_hash(self):
+        """Instances have no __dict__, hash by value and are not tuples."""
+        coords = Coordinates(latitude=10.0, longitude=20.0)
+        self.assertEqual(hash(coords), hash(Coordinates(10.0, 20.0)))
+        self.assertFalse(hasattr(coords, "__dict__"))
+        self.assertNotEqual(coords, (10.0, 20.0))
+        self.assertEqual(dataclasses.asdict(coords), {"latitude": 10.0, "longitude": 20.0})
+        self.assertEqual(dataclasses.replace(coords, longitude=30.0), Coordinates(10.0, 30.0))
+
+    def test_pickle_roundtrip(self):
+        bounds = DigipinBounds(min_lat=0.0, max_lat=90.0, min_lon=-180.0, max_lon=180.0)
+        self.assertEqual(pickle.loads(pickle.dumps(bounds)), bounds)
+        self.assertEqual(pickle.loads(pickle.dumps(Coordinates(1.0, 2.0))), Coordinates(1.0, 2.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import random
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+from digipin.core import BOUNDS, Digipin
+from digipin.error import LatitudeOutOfRangeError
+
+try:
+    import numpy as np
+
+    from digipin.parallel import parallel_encode
+    from digipin.vectorized import encode_many
+except ImportError:  # pragma: no cover
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestParallelEncode(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(11)
+        self.lats = np.array([rng.uniform(BOUNDS.min_lat, BOUNDS.max_lat) for _ in range(2000)])
+        self.lons = np.array([rng.uniform(BOUNDS.min_lon, BOUNDS.max_lon) for _ in range(2000)])
+
+    def test_matches_vectorized_across_workers(self):
+        """Shared-memory workers return the same pins, in input order."""
+        expected = encode_many(self.lats, self.lons)
+        # 2000 rows would otherwise be clamped to a single worker.
+        with mock.patch("digipin.parallel.MIN_ROWS_PER_WORKER", 500):
+            with mock.patch(
+                "digipin.parallel.ProcessPoolExecutor", wraps=ProcessPoolExecutor
+            ) as pool:
+                pins = parallel_encode(self.lats, self.lons, workers=2, chunk_size=300)
+        self.assertEqual(pool.call_args.kwargs["max_workers"], 2)
+        np.testing.assert_array_equal(pins, expected)
+
+    def test_matches_scalar(self):
+        """Results agree with get_digipin row by row."""
+        handler = Digipin()
+        pins = parallel_encode(self.lats[:200], self.lons[:200], workers=2, chunk_size=64)
+        for lat, lon, pin in zip(self.lats[:200], self.lons[:200], pins):
+            self.assertEqual(pin, handler.get_digipin(float(lat), float(lon)))
+
+    def test_invalid_rows(self):
+        """Out-of-range rows raise the scalar error, or are flagged per row."""
+        lats = self.lats.copy()
+        lats[[5, 1500]] = [45.0, np.nan]
+        with self.assertRaises(LatitudeOutOfRangeError):
+            parallel_encode(lats, self.lons, workers=2, chunk_size=500)
+
+        pins, invalid = parallel_encode(
+            lats, self.lons, workers=2, chunk_size=500, return_invalid=True, precision=4
+        )
+        self.assertEqual(pins.dtype, np.dtype("<U5"))
+        self.assertEqual(list(np.nonzero(invalid)[0]), [5, 1500])
+        self.assertEqual(pins[5], "")
+        np.testing.assert_array_equal(
+            pins[~invalid], encode_many(self.lats, self.lons, precision=4)[~invalid]
+        )
+
+    def test_small_input_and_shape(self):
+        """Small inputs are encoded in-process and keep their shape."""
+        pins = Digipin().parallel_encode(self.lats[:6].reshape(2, 3), self.lons[:6].reshape(2, 3))
+        self.assertEqual(pins.shape, (2, 3))
+        self.assertEqual(parallel_encode([], []).shape, (0,))
+
+    def test_argument_errors(self):
+        with self.assertRaises(ValueError):
+            parallel_encode(self.lats, self.lons[:10])
+        with self.assertRaises(ValueError):
+            parallel_encode(self.lats, self.lons, workers=0)
+        with self.assertRaises(ValueError):
+            parallel_encode(self.lats, self.lons, chunk_size=0)
@@ -0,0 +1,163 @@
+import csv
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+from digipin.cli import main
+from digipin.core import Digipin
+from digipin.pipeline import decode_file, detect_format, encode_file
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = None
+
+ROWS = [
+    {"id": "1", "lat": "22.5726", "lon": "88.3639"},
+    {"id": "2", "lat": "40.0", "lon": "80.0"},
+    {"id": "3", "lat": "", "lon": "80.0"},
+    {"id": "4", "lat": "12.9716", "lon": "77.5946"},
+    {"id": "5", "lat": "28.6139", "lon": "77.2090"},
+]
+EXPECTED_PINS = ["2TF-J7F-86MM", "", "", "4P3-JK8-52C9"]
+
+
+class TestPipeline(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def write_csv(self, name, rows):
+        with open(self.path(name), "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+        return self.path(name)
+
+    def read_csv(self, name):
+        with open(self.path(name), newline="") as f:
+            return list(csv.DictReader(f))
+
+    def test_detect_format(self):
+        """Formats are inferred from file extensions."""
+        self.assertEqual(detect_format("a.CSV"), "csv")
+        self.assertEqual(detect_format("a.ndjson"), "jsonl")
+        self.assertEqual(detect_format("a.parquet"), "parquet")
+        with self.assertRaises(ValueError):
+            detect_format("a.txt")
+
+    def test_csv_roundtrip_in_small_chunks(self):
+        """CSV rows gain a DIGIPIN column, then decoded coordinates, across chunks."""
+        source = self.write_csv("in.csv", ROWS)
+        stats = encode_file(source, self.path("pins.csv"), chunk_size=2)
+        self.assertEqual((stats.rows, stats.errors), (5, 2))
+        rows = self.read_csv("pins.csv")
+        self.assertEqual([row["digipin"] for row in rows[:4]], EXPECTED_PINS)
+        self.assertEqual(rows[0]["id"], "1")
+
+        stats = decode_file(self.path("pins.csv"), self.path("coords.csv"), chunk_size=3)
+        self.assertEqual((stats.rows, stats.errors), (5, 2))
+        rows = self.read_csv("coords.csv")
+        self.assertAlmostEqual(float(rows[0]["latitude"]), 22.5726, places=4)
+        self.assertEqual(rows[1]["latitude"], "")
+        self.assertGreater(stats.rows_per_second, 0)
+
+    def test_roundtrip_at_lower_precision(self):
+        """Pins encoded at a precision below 10 decode at that precision, on any backend."""
+        source = self.write_csv("in.csv", ROWS)
+        with redirect_stderr(io.StringIO()):
+            self.assertEqual(
+                main(["encode", source, self.path("pins.csv"), "--precision", "6"]), 0
+            )
+            self.assertEqual(
+                main(
+                    ["decode", self.path("pins.csv"), self.path("coords.csv"), "--precision", "6"]
+                ),
+                0,
+            )
+        rows = self.read_csv("coords.csv")
+        expected = Digipin().get_lat_lng_from_digipin(rows[0]["digipin"], precision=6)
+        self.assertEqual(rows[0]["digipin"], "2TF-J7F")
+        self.assertAlmostEqual(float(rows[0]["latitude"]), expected.latitude)
+        self.assertAlmostEqual(float(rows[3]["longitude"]), 77.5946, places=1)
+        self.assertEqual(
+            [row["latitude"] == "" for row in rows], [False, True, True, False, False]
+        )
+
+        for backend in ("python", "auto"):
+            with self.subTest(backend=backend):
+                digipin_handler = Digipin(backend=backend)
+                stats = decode_file(
+                    self.path("pins.csv"),
+                    self.path("again.csv"),
+                    precision=6,
+                    digipin=digipin_handler,
+                )
+                self.assertEqual((stats.rows, stats.errors), (5, 2))
+                self.assertEqual(self.read_csv("again.csv"), rows)
+                stats = decode_file(self.path("pins.csv"), self.path("again.csv"))
+                self.assertEqual(stats.errors, 5)
+
+    def test_jsonl_encode(self):
+        """JSONL records keep their fields and gain a DIGIPIN."""
+        with open(self.path("in.jsonl"), "w") as f:
+            for row in ROWS:
+                f.write(json.dumps({"lat": float(row["lat"] or "nan"), "lon": float(row["lon"])}))
+                f.write("\n")
+        stats = encode_file(self.path("in.jsonl"), self.path("out.jsonl"), precision=3)
+        self.assertEqual(stats.errors, 2)
+        with open(self.path("out.jsonl")) as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(records[0]["digipin"], "2TF")
+        self.assertEqual(records[0]["lat"], 22.5726)
+
+    @unittest.skipIf(pa is None, "pyarrow is not installed")
+    def test_parquet_roundtrip(self):
+        """Parquet files are processed batch by batch."""
+        table = pa.table(
+            {
+                "lat": [22.5726, 40.0, None, 12.9716, 28.6139],
+                "lon": [88.3639, 80.0, 80.0, 77.5946, 77.2090],
+            }
+        )
+        pq.write_table(table, self.path("in.parquet"))
+        stats = encode_file(self.path("in.parquet"), self.path("pins.parquet"), chunk_size=2)
+        self.assertEqual((stats.rows, stats.errors), (5, 2))
+        result = pq.read_table(self.path("pins.parquet"))
+        self.assertEqual(result.column("digipin").to_pylist()[:4], EXPECTED_PINS)
+
+        stats = decode_file(self.path("pins.parquet"), self.path("coords.parquet"))
+        result = pq.read_table(self.path("coords.parquet"))
+        self.assertEqual(result.column("latitude").to_pylist()[1], None)
+        self.assertAlmostEqual(result.column("longitude").to_pylist()[3], 77.5946, places=4)
+
+    def test_missing_column(self):
+        """A missing coordinate column is reported clearly."""
+        source = self.write_csv("in.csv", [{"x": "1", "y": "2"}])
+        with self.assertRaises(KeyError):
+            encode_file(source, self.path("out.csv"))
+
+    def test_cli(self):
+        """The console entry point encodes files and single values."""
+        source = self.write_csv("in.csv", ROWS)
+        stderr = io.StringIO()
+        with redirect_stderr(stderr):
+            code = main(["encode", source, self.path("out.csv"), "--chunk-size", "2"])
+        self.assertEqual(code, 0)
+        self.assertIn("Encoded 5 rows", stderr.getvalue())
+        self.assertIn("2 errors", stderr.getvalue())
+
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            self.assertEqual(main(["pin", "22.5726", "88.3639"]), 0)
+        self.assertEqual(stdout.getvalue().strip(), "2TF-J7F-86MM")
+
+        with redirect_stderr(io.StringIO()):
+            self.assertEqual(main(["coords", "2TF-J7G-86MM"]), 1)
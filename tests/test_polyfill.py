@@ -0,0 +1,93 @@
+import random
+import unittest
+
+from digipin.core import Digipin
+from digipin.error import InvalidPrecisionError
+from digipin.model import Coordinates, DigipinBounds
+from digipin.polyfill import polyfill
+
+
+class TestPolyfill(unittest.TestCase):
+    def setUp(self):
+        self.digipin_handler = Digipin()
+        self.box = DigipinBounds(min_lat=22.5, max_lat=22.6, min_lon=88.3, max_lon=88.4)
+        self.triangle = [(22.5, 88.3), (22.6, 88.35), (22.5, 88.4)]
+
+    def _sample(self, count, box):
+        rng = random.Random(3)
+        return [
+            (rng.uniform(box.min_lat, box.max_lat), rng.uniform(box.min_lon, box.max_lon))
+            for _ in range(count)
+        ]
+
+    def test_polyfill_box_covers_every_point(self):
+        """Every point inside the box falls in one of the covering cells."""
+        cells = set(polyfill(self.box, 6))
+        for lat, lon in self._sample(2000, self.box):
+            self.assertIn(self.digipin_handler.get_digipin(lat, lon, 6), cells)
+
+    def test_polyfill_box_cells_intersect(self):
+        """Every covering cell overlaps the box and appears only once."""
+        cells = list(polyfill(self.box, 6))
+        self.assertEqual(len(cells), len(set(cells)))
+        for pin in cells:
+            bounds = self.digipin_handler.get_cell(pin).bounds
+            self.assertTrue(
+                bounds.min_lat < self.box.max_lat and bounds.max_lat > self.box.min_lat
+            )
+            self.assertTrue(
+                bounds.min_lon < self.box.max_lon and bounds.max_lon > self.box.min_lon
+            )
+
+    def test_polyfill_aligned_box_is_exact(self):
+        """A box matching one cell exactly is covered by that cell's children only."""
+        cell = self.digipin_handler.get_cell("2TF")
+        cells = list(polyfill(cell.bounds, 4))
+        self.assertEqual(len(cells), 16)
+        self.assertTrue(all(pin.startswith("2TF-") for pin in cells))
+        self.assertEqual(list(polyfill(cell.bounds, 4, compact=True)), ["2TF"])
+
+    def test_polyfill_polygon_covers_every_point(self):
+        """Every point inside the polygon falls in one of the covering cells."""
+        cells = set(polyfill(self.triangle, 7))
+        for lat, lon in self._sample(5000, self.box):
+            # Points under the apex of the triangle
+            if abs(lon - 88.35) <= (22.6 - lat) / 2:
+                self.assertIn(self.digipin_handler.get_digipin(lat, lon, 7), cells)
+        self.assertLess(len(cells), len(list(polyfill(self.box, 7))))
+
+    def test_polyfill_accepts_coordinates_and_closed_rings(self):
+        """Coordinates vertices and an explicitly closed ring give the same cover."""
+        ring = [Coordinates(latitude=lat, longitude=lon) for lat, lon in self.triangle]
+        ring.append(ring[0])
+        self.assertEqual(list(polyfill(ring, 6)), list(polyfill(self.triangle, 6)))
+
+    def test_polyfill_compact_expands_to_uniform(self):
+        """A compact cover expands to exactly the uniform cover."""
+        uniform = set(polyfill(self.triangle, 6))
+        expanded = set()
+        for pin in polyfill(self.triangle, 6, compact=True):
+            level = len(pin.replace("-", ""))
+            if level == 6:
+                expanded.add(pin)
+            else:
+                expanded.update(p for p in uniform if p.startswith(pin))
+        self.assertEqual(expanded, uniform)
+        self.assertLess(len(list(polyfill(self.triangle, 6, compact=True))), len(uniform))
+
+    def test_polyfill_is_lazy(self):
+        """Results are streamed from a generator."""
+        cells = polyfill(DigipinBounds(min_lat=2.5, max_lat=38.5, min_lon=63.5, max_lon=99.5), 10)
+        self.assertEqual(len(next(cells).replace("-", "")), 10)
+
+    def test_polyfill_outside_bounds(self):
+        """Shapes outside the DIGIPIN bounds yield nothing."""
+        box = DigipinBounds(min_lat=40.0, max_lat=41.0, min_lon=80.0, max_lon=81.0)
+        self.assertEqual(list(polyfill(box, 3)), [])
+
+    def test_polyfill_invalid_input(self):
+        """Invalid levels and degenerate polygons are rejected."""
+        with self.assertRaises(InvalidPrecisionError):
+            polyfill(self.box, 11)
+        with self.assertRaises(ValueError):
+            polyfill([(22.5, 88.3), (22.6, 88.35)], 5)
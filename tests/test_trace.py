@@ -0,0 +1,110 @@
+import itertools
+import random
+import unittest
+
+from digipin.core import Digipin
+from digipin.error import InvalidPrecisionError, LatitudeOutOfRangeError
+from digipin.trace import CellRun, TraceEncoder, encode_trace
+
+
+class TestTrace(unittest.TestCase):
+    def setUp(self):
+        self.digipin_handler = Digipin()
+        self.rng = random.Random(22)
+
+    def _walk(self, count, step):
+        lat, lon = self.rng.uniform(5.0, 35.0), self.rng.uniform(66.0, 97.0)
+        points = []
+        for index in range(count):
+            lat = min(max(lat + self.rng.gauss(0, step), 2.5), 38.5)
+            lon = min(max(lon + self.rng.gauss(0, step), 63.5), 99.5)
+            points.append((lat, lon, index))
+        return points
+
+    def _expected(self, points, level):
+        pins = (self.digipin_handler.get_digipin(lat, lon, level) for lat, lon, _ in points)
+        return [(pin, len(list(group))) for pin, group in itertools.groupby(pins)]
+
+    def test_matches_scalar_encoder(self):
+        """Runs agree with get_digipin on every fix, including fixes on cell edges."""
+        for level in (1, 4, 7, 10):
+            size = 36.0 / 4**level
+            with self.subTest(level=level):
+                points = self._walk(2000, size / 10)
+                points += [
+                    (
+                        2.5 + round((lat - 2.5) / size) * size,
+                        63.5 + round((lon - 63.5) / size) * size,
+                        2000 + index,
+                    )
+                    for index, (lat, lon, _) in enumerate(points[:300])
+                ]
+                points += [(38.5, 99.5, 3000), (2.5, 63.5, 3001), (38.5, 63.5, 3002)]
+                runs = list(encode_trace(points, level))
+                self.assertEqual(
+                    [(run.digipin, run.count) for run in runs], self._expected(points, level)
+                )
+                self.assertEqual(sum(run.count for run in runs), len(points))
+
+    def test_run_times(self):
+        """Runs record the timestamps of their first and last fixes."""
+        points = [
+            (28.6139, 77.2090, 0.0),
+            (28.6139, 77.2090, 1.0),
+            (28.6139, 77.2090, 2.5),
+            (19.0760, 72.8777, 3.0),
+            (28.6139, 77.2090, 4.0),
+        ]
+        runs = list(encode_trace(points, level=6))
+        delhi = self.digipin_handler.get_digipin(28.6139, 77.2090, 6)
+        mumbai = self.digipin_handler.get_digipin(19.0760, 72.8777, 6)
+        self.assertEqual(
+            runs,
+            [
+                CellRun(delhi, 0.0, 2.5, 3),
+                CellRun(mumbai, 3.0, 3.0, 1),
+                CellRun(delhi, 4.0, 4.0, 1),
+            ],
+        )
+        # Pairs without timestamps use the position of the fix
+        pairs = [(lat, lon) for lat, lon, _ in points]
+        self.assertEqual(next(encode_trace(pairs, level=6)), CellRun(delhi, 0, 2, 3))
+        self.assertEqual(list(encode_trace([])), [])
+
+    def test_streaming(self):
+        """Runs are yielded as soon as the trace leaves a cell, without reading ahead."""
+
+        def fixes():
+            yield (28.6139, 77.2090, 0)
+            yield (19.0760, 72.8777, 1)
+            raise AssertionError("read past the first completed run")
+
+        self.assertEqual(next(encode_trace(fixes())).count, 1)
+
+    def test_encoder_push_and_flush(self):
+        """TraceEncoder skips re-encoding inside a cell and can be flushed mid-trace."""
+        encoder = TraceEncoder(level=8)
+        points = self._walk(5000, 36.0 / 4**8 / 50)
+        runs = [run for run in (encoder.push(*point) for point in points) if run is not None]
+        runs.append(encoder.flush())
+        self.assertIsNone(encoder.flush())
+        self.assertEqual([(run.digipin, run.count) for run in runs], self._expected(points, 8))
+        self.assertLess(encoder.encoded, len(points) / 5)
+
+    def test_invalid_fixes(self):
+        """Out-of-range fixes raise, or are dropped with skip_invalid."""
+        points = [(28.6139, 77.2090, 0), (40.0, 77.2090, 1), (28.6139, 77.2090, 2)]
+        with self.assertRaises(LatitudeOutOfRangeError):
+            list(encode_trace(points))
+        encoder = TraceEncoder(skip_invalid=True)
+        runs = list(encode_trace(points, skip_invalid=True))
+        self.assertEqual(len(runs), 1)
+        self.assertEqual((runs[0].enter_time, runs[0].exit_time, runs[0].count), (0, 2, 2))
+        self.assertIsNone(encoder.push(float("nan"), 77.2090, 0))
+        self.assertEqual(encoder.skipped, 1)
+        with self.assertRaises(InvalidPrecisionError):
+            list(encode_trace(points, level=11))
+
+
+if __name__ == "__main__":
+    unittest.main()
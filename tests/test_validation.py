@@ -0,0 +1,127 @@
+import random
+import unittest
+
+from digipin.core import Digipin
+from digipin.error import InvalidDigipinCharError, InvalidDigipinError, InvalidPrecisionError
+from digipin.validation import (
+    INVALID_CHAR,
+    INVALID_LENGTH,
+    INVALID_TYPE,
+    VALID,
+    is_valid,
+    normalize,
+    validate_many,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+SAMPLES = [
+    ("2TF-J7F-86MM", VALID, "2TF-J7F-86MM"),
+    ("2TFJ7F86MM", VALID, "2TF-J7F-86MM"),
+    (" 2tf j7f-86mm ", VALID, "2TF-J7F-86MM"),
+    ("2-T-F-J-7-F-8-6-M-M", VALID, "2TF-J7F-86MM"),
+    ("4p3-jk8-52c9\n", VALID, "4P3-JK8-52C9"),
+    ("2TF-J7F-86M", INVALID_LENGTH, None),
+    ("", INVALID_LENGTH, None),
+    ("2TF-J7F-86MA", INVALID_CHAR, None),
+    ("2TF-J7F-86M0", INVALID_CHAR, None),
+    (None, INVALID_TYPE, None),
+    (12345, INVALID_TYPE, None),
+]
+
+
+class TestValidation(unittest.TestCase):
+    def test_is_valid_matches_decoder(self):
+        """is_valid agrees with whether get_lat_lng_from_digipin raises."""
+        handler = Digipin()
+        for pin in (
+            "2TF-J7F-86MM",
+            "2TFJ7F86MM",
+            "2tf-j7f-86mm",
+            "2TF J7F 86MM",
+            "2TF-J7F-86M",
+            "2TF-J7F-86MA",
+        ):
+            try:
+                handler.get_lat_lng_from_digipin(pin)
+                expected = True
+            except (InvalidDigipinError, InvalidDigipinCharError):
+                expected = False
+            self.assertEqual(is_valid(pin), expected, pin)
+        self.assertFalse(is_valid(None))
+        self.assertTrue(is_valid("2TF-J", precision=4))
+
+    def test_normalize(self):
+        for pin, status, canonical in SAMPLES:
+            self.assertEqual(normalize(pin), canonical, pin)
+        self.assertEqual(normalize("2tf j", precision=4), "2TF-J")
+        with self.assertRaises(InvalidPrecisionError):
+            normalize("2TF", precision=0)
+
+    def test_validate_many(self):
+        """Every row gets a status code and canonical form, without raising."""
+        result = validate_many(pin for pin, _, _ in SAMPLES)
+        self.assertEqual(result.status, [status for _, status, _ in SAMPLES])
+        self.assertEqual(result.normalized, [canonical for _, _, canonical in SAMPLES])
+        self.assertEqual(result.valid, [status == VALID for _, status, _ in SAMPLES])
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_validate_many_array(self):
+        """A NumPy string array is validated in one vectorized pass with the same result."""
+        strings = [pin for pin, _, _ in SAMPLES if isinstance(pin, str)]
+        expected = validate_many(strings)
+        result = validate_many(np.array(strings).reshape(3, 3))
+        self.assertEqual(result.status.shape, (3, 3))
+        self.assertEqual(result.status.ravel().tolist(), expected.status)
+        self.assertEqual(
+            result.normalized.ravel().tolist(),
+            [pin if pin is not None else "" for pin in expected.normalized],
+        )
+        self.assertEqual(result.valid.sum(), 5)
+
+        short = validate_many(np.array(["2tf", "2T", "2TF-J"]), precision=3)
+        self.assertEqual(short.status.tolist(), [VALID, INVALID_LENGTH, INVALID_LENGTH])
+        self.assertEqual(short.normalized.tolist(), ["2TF", "", ""])
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_array_and_list_paths_agree(self):
+        """str arrays, bytes arrays and lists give the same status for the same input."""
+        edge_cases = [
+            ("2TF\x00J7F-86M", INVALID_CHAR),
+            ("2TF-J7F-86M\x00", INVALID_LENGTH),
+            ("2tf-j7f-86mm\x00\x00", VALID),
+            ("2TF-J7F-86MM\x00 ", INVALID_LENGTH),
+            ("\x00", INVALID_LENGTH),
+            ("2TF-J7F-86Mß", INVALID_CHAR),
+            ("2TF-J7F-8ßMM", INVALID_CHAR),
+            ("2tf-j7f-86mﬀ", INVALID_CHAR),
+            ("２TF-J7F-86MM", INVALID_CHAR),
+            ("2TF-J7F-86M\u00a0", INVALID_CHAR),
+        ]
+        alphabet = "2TFJ7C8MP9LK- tfjmx\x00é"
+        rng = random.Random(16)
+        strings = [pin for pin, _ in edge_cases] + [pin for pin, _, _ in SAMPLES[:-2]]
+        strings += [
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 14))) for _ in range(500)
+        ]
+        expected = validate_many(strings)
+        result = validate_many(np.array(strings))
+        self.assertEqual(result.status.tolist(), expected.status)
+        self.assertEqual(
+            result.normalized.tolist(),
+            [pin if pin is not None else "" for pin in expected.normalized],
+        )
+        self.assertEqual(expected.status[:10], [status for _, status in edge_cases])
+        self.assertEqual(expected.normalized[2], "2TF-J7F-86MM")
+
+        encoded = [pin.encode("utf-8") for pin in strings]
+        from_bytes = validate_many(np.array(encoded))
+        self.assertEqual(from_bytes.status.tolist(), validate_many(encoded).status)
+        # Bytes are read as ASCII, so multi-byte UTF-8 characters are each invalid
+        self.assertEqual(
+            from_bytes.status.tolist()[:10],
+            [INVALID_CHAR, INVALID_LENGTH, VALID] + [INVALID_LENGTH] * 7,
+        )
@@ -0,0 +1,137 @@
+import random
+import unittest
+
+from digipin.core import BOUNDS, Digipin
+from digipin.error import LatitudeOutOfRangeError, LongitudeOutOfRangeError
+
+try:
+    import numpy as np
+
+    from digipin.vectorized import DECODE_INVALID_CHAR, DECODE_INVALID_LENGTH, DECODE_OK
+except ImportError:  # pragma: no cover
+    np = None
+
+
+def _sample_coordinates(count: int, seed: int = 7):
+    """Random points inside the bounds plus the corners and edges of the grid."""
+    rng = random.Random(seed)
+    lats = [rng.uniform(BOUNDS.min_lat, BOUNDS.max_lat) for _ in range(count)]
+    lons = [rng.uniform(BOUNDS.min_lon, BOUNDS.max_lon) for _ in range(count)]
+    for lat in (BOUNDS.min_lat, BOUNDS.max_lat, 20.5, 11.5):
+        for lon in (BOUNDS.min_lon, BOUNDS.max_lon, 81.5, 72.5):
+            lats.append(lat)
+            lons.append(lon)
+    return lats, lons
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestEncodeMany(unittest.TestCase):
+    def setUp(self):
+        self.digipin_handler = Digipin()
+
+    def test_encode_many_matches_get_digipin(self):
+        """Every row of the batch encoder matches the scalar encoder exactly."""
+        lats, lons = _sample_coordinates(2000)
+        pins = self.digipin_handler.encode_many(np.array(lats), np.array(lons))
+        expected = [self.digipin_handler.get_digipin(lat, lon) for lat, lon in zip(lats, lons)]
+        self.assertEqual(pins.tolist(), expected)
+
+    def test_encode_many_accepts_lists_and_keeps_shape(self):
+        """Plain sequences are accepted and the output shape follows the input."""
+        pins = self.digipin_handler.encode_many([[22.5726, 12.9716]], [[88.3639, 77.5946]])
+        self.assertEqual(pins.shape, (1, 2))
+        self.assertEqual(pins.tolist(), [["2TF-J7F-86MM", "4P3-JK8-52C9"]])
+
+    def test_encode_many_empty(self):
+        """Empty input produces an empty array."""
+        pins = self.digipin_handler.encode_many([], [])
+        self.assertEqual(pins.shape, (0,))
+
+    def test_encode_many_shape_mismatch(self):
+        """Mismatched input shapes are rejected."""
+        with self.assertRaises(ValueError):
+            self.digipin_handler.encode_many([20.0, 21.0], [80.0])
+
+    def test_encode_many_raises_first_error(self):
+        """Out-of-range rows raise the same error as get_digipin for the first bad row."""
+        with self.assertRaises(LongitudeOutOfRangeError):
+            self.digipin_handler.encode_many([20.0, 20.0, 40.0], [80.0, 100.0, 80.0])
+        with self.assertRaises(LatitudeOutOfRangeError) as cm:
+            self.digipin_handler.encode_many([20.0, 40.0], [80.0, 100.0])
+        self.assertIn("Latitude 40.0 out of range", str(cm.exception))
+
+    def test_encode_many_precision(self):
+        """Lower precisions produce the same prefixes as get_digipin."""
+        lats, lons = _sample_coordinates(200)
+        for precision in (1, 3, 4, 7):
+            pins = self.digipin_handler.encode_many(lats, lons, precision=precision)
+            expected = [
+                self.digipin_handler.get_digipin(lat, lon, precision)
+                for lat, lon in zip(lats, lons)
+            ]
+            self.assertEqual(pins.tolist(), expected)
+
+    def test_encode_many_return_invalid(self):
+        """With return_invalid, bad rows are flagged and encoded as empty strings."""
+        pins, invalid = self.digipin_handler.encode_many(
+            [22.5726, 40.0, float("nan")], [88.3639, 80.0, 80.0], return_invalid=True
+        )
+        self.assertEqual(invalid.tolist(), [False, True, True])
+        self.assertEqual(pins.tolist(), ["2TF-J7F-86MM", "", ""])
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestDecodeMany(unittest.TestCase):
+    def setUp(self):
+        self.digipin_handler = Digipin()
+
+    def test_decode_many_matches_get_lat_lng_from_digipin(self):
+        """Every row of the batch decoder matches the scalar decoder exactly."""
+        lats, lons = _sample_coordinates(2000)
+        pins = self.digipin_handler.encode_many(lats, lons).tolist()
+        decoded = self.digipin_handler.decode_many(pins)
+        expected = [self.digipin_handler.get_lat_lng_from_digipin(pin) for pin in pins]
+        self.assertEqual(decoded.latitude.tolist(), [c.latitude for c in expected])
+        self.assertEqual(decoded.longitude.tolist(), [c.longitude for c in expected])
+        self.assertTrue(decoded.valid.all())
+
+    def test_decode_many_bounds(self):
+        """The returned bounding boxes contain the encoded point and the centre."""
+        lat, lon = 22.5726, 88.3639
+        decoded = self.digipin_handler.decode_many(["2TF-J7F-86MM"], return_bounds=True)
+        self.assertTrue(decoded.min_lat[0] <= lat <= decoded.max_lat[0])
+        self.assertTrue(decoded.min_lon[0] <= lon <= decoded.max_lon[0])
+        self.assertAlmostEqual(
+            decoded.latitude[0], (decoded.min_lat[0] + decoded.max_lat[0]) / 2, places=6
+        )
+
+    def test_decode_many_error_codes(self):
+        """Invalid pins are reported per row instead of raising."""
+        pins = ["2TF-J7F-86MM", "F3K-C4M-95P", "2TF-J7G-86MM", "2TFJ7F86MM", "2TF-J7F-86MĀ"]
+        decoded = self.digipin_handler.decode_many(pins)
+        self.assertEqual(
+            decoded.errors.tolist(),
+            [
+                DECODE_OK,
+                DECODE_INVALID_LENGTH,
+                DECODE_INVALID_CHAR,
+                DECODE_OK,
+                DECODE_INVALID_CHAR,
+            ],
+        )
+        self.assertTrue(np.isnan(decoded.latitude[1:3]).all())
+        self.assertEqual(decoded.latitude[0], decoded.latitude[3])
+
+    def test_decode_many_precision(self):
+        """Partial pins decode like get_lat_lng_from_digipin at the same precision."""
+        decoded = self.digipin_handler.decode_many(["2TF-J", "2TF-J7F-86MM"], precision=4)
+        expected = self.digipin_handler.get_lat_lng_from_digipin("2TF-J", precision=4)
+        self.assertEqual(decoded.latitude[0], expected.latitude)
+        self.assertEqual(decoded.errors.tolist(), [DECODE_OK, DECODE_INVALID_LENGTH])
+
+    def test_decode_many_bytes_input(self):
+        """Fixed-width bytes arrays decode like their str counterparts."""
+        decoded = self.digipin_handler.decode_many(np.array([b"4P3-JK8-52C9"]))
+        expected = self.digipin_handler.get_lat_lng_from_digipin("4P3-JK8-52C9")
+        self.assertEqual(decoded.latitude[0], expected.latitude)
+        self.assertEqual(decoded.longitude[0], expected.longitude)